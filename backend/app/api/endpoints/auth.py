@@ -17,6 +17,7 @@ from app.db.crud_user import (
     authenticate_user,
     delete_user_by_username,
 )
+from app.services.auth_cache import Principal, user_cache
 from app.utils import success_response, error_response
 
 from pydantic import BaseModel, EmailStr, Field
@@ -82,14 +83,14 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db)
 ):
     """
-    获取当前用户依赖项
+    获取当前用户依赖项（用户信息优先读取短 TTL 的用户缓存）
     
     Args:
         credentials: HTTP Bearer凭据
         db: 数据库会话
         
     Returns:
-        User: 当前用户对象
+        Principal: 当前用户主体
         
     Raises:
         HTTPException: 认证失败时抛出401错误
@@ -109,13 +110,18 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = await get_user_by_username(db, username)
-    if not user or not user.is_active:
+    principal = user_cache.get(username)
+    if principal is None:
+        user = await get_user_by_username(db, username)
+        if user:
+            principal = Principal.from_user(user)
+            user_cache.set(principal)
+    if not principal or not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="用户不存在或已禁用",
         )
-    return user
+    return principal
 
 
 async def get_current_superuser(
@@ -125,10 +131,10 @@ async def get_current_superuser(
     获取当前超级管理员用户依赖项
     
     Args:
-        current_user: 当前用户对象
+        current_user: 当前用户主体
         
     Returns:
-        User: 当前超级管理员用户对象
+        Principal: 当前超级管理员用户主体
         
     Raises:
         HTTPException: 非超级管理员时抛出403错误
@@ -10,13 +10,17 @@ import json
 from app.db.database import get_db
 from app.api.endpoints.auth import get_current_user
 from app.db import crud_config
-from app.utils import success_response, error_response
+from app.utils import success_response, error_response, json_response
 from app.utils.encryption import encryption_manager
+from app.services.clients.ratelimit import rate_limiters
+from app.services.clients.circuit import circuit_breakers
+from app.services.config_snapshot import config_snapshots
+from app.services.dict_tree import is_valid_dict_value
 from app.utils.config_helpers import (
-    mask_api_key,
+    api_key_fields,
     parse_extra_config,
-    encrypt_if_present,
-    decrypt_if_present,
+    aencrypt_if_present,
+    adecrypt_if_present,
     get_active_proxy_config,
     normalize_proxy_dict,
 )
@@ -35,6 +39,17 @@ from app.api.schemas.config import (
 
 router = APIRouter()
 
+# extra_config 中需按系统字典校验的字段 -> 字典类型编码
+DICT_VALIDATED_FIELDS = {"language": "language", "region": "region"}
+
+
+async def _validate_extra_config(db: AsyncSession, extra: Optional[Dict[str, Any]]) -> None:
+    """按系统字典校验 extra_config 中的语言/地区，不合法时返回 400"""
+    for field, dict_type_code in DICT_VALIDATED_FIELDS.items():
+        value = (extra or {}).get(field)
+        if value and not await is_valid_dict_value(db, dict_type_code, str(value)):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{field} 取值无效: {value}")
+
 
 # ----------------------- 配置概览 -----------------------
 
@@ -58,7 +73,8 @@ router = APIRouter()
                                     "service_type": "api",
                                     "name": "默认Sonarr",
                                     "url": "http://127.0.0.1:8989",
-                                    "api_key_masked": "****9f2c",
+                                    "api_key_masked": "1234****9f2c",
+                                    "api_key_length": 12,
                                     "is_active": True,
                                     "created_at": "2025-10-12T10:00:00Z",
                                     "updated_at": "2025-10-12T11:00:00Z"
@@ -102,12 +118,13 @@ async def get_configurations(
                 service_type=s.service_type,
                 name=s.name,
                 url=s.url,
-                api_key_masked=mask_api_key(decrypt_if_present(s.api_key)),
+                api_key_masked=s.api_key_masked,
+                api_key_length=s.api_key_length,
                 username=s.username,
                 is_active=s.is_active,
                 extra_config=extra,
-                created_at=s.created_at.isoformat() if getattr(s, "created_at", None) else None,
-                updated_at=s.updated_at.isoformat() if getattr(s, "updated_at", None) else None,
+                created_at=s.created_at,
+                updated_at=s.updated_at,
             )
         )
     
@@ -124,8 +141,8 @@ async def get_configurations(
                     has_value=bool(c.value),
                     is_encrypted=c.is_encrypted,
                     is_active=c.is_active,
-                    created_at=c.created_at.isoformat() if getattr(c, "created_at", None) else None,
-                    updated_at=c.updated_at.isoformat() if getattr(c, "updated_at", None) else None,
+                    created_at=c.created_at,
+                    updated_at=c.updated_at,
                 )
             )
         else:
@@ -138,12 +155,12 @@ async def get_configurations(
                     has_value=None,
                     is_encrypted=c.is_encrypted,
                     is_active=c.is_active,
-                    created_at=c.created_at.isoformat() if getattr(c, "created_at", None) else None,
-                    updated_at=c.updated_at.isoformat() if getattr(c, "updated_at", None) else None,
+                    created_at=c.created_at,
+                    updated_at=c.updated_at,
                 )
             )
 
-    return success_response({"services": [x.model_dump() for x in services_out], "kv": [x.model_dump() for x in kv_out]})
+    return json_response({"services": services_out, "kv": kv_out})
 
 
 # ----------------------- 创建配置 -----------------------
@@ -161,6 +178,10 @@ async def get_configurations(
                 }
             }
         },
+        400: {
+            "description": "extra_config 中的语言/地区不在系统字典中",
+            "content": {"application/json": {"example": {"detail": "language 取值无效: xx-XX"}}}
+        },
         409: {
             "description": "重复（服务名+名称 或 KV键 冲突）",
             "content": {"application/json": {"example": {"detail": "同名配置已存在"}}}
@@ -176,6 +197,7 @@ async def create_configuration(
         dup = await crud_config.is_service_name_duplicate(db, service_name=payload.service_name, name=payload.name)
         if dup:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="同名配置已存在")
+        await _validate_extra_config(db, payload.extra_config)
         
         extra_json = json.dumps(payload.extra_config, ensure_ascii=False) if payload.extra_config else None
         
@@ -185,19 +207,21 @@ async def create_configuration(
             service_type=payload.service_type,
             name=payload.name,
             url=payload.url,
-            api_key=encrypt_if_present(payload.api_key),
+            api_key=await aencrypt_if_present(payload.api_key),
             username=payload.username,
-            password=encrypt_if_present(payload.password),
+            password=await aencrypt_if_present(payload.password),
             extra_config=extra_json,
             is_active=payload.is_active,
+            **api_key_fields(payload.api_key),
         )
+        await config_snapshots.invalidate(db)
         return success_response({"id": item.id})
     else:
         dup = await crud_config.is_kv_key_duplicate(db, key=payload.key)
         if dup:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Key 已存在")
         
-        value_enc = encryption_manager.encrypt(payload.value) if payload.is_encrypted and payload.value else payload.value
+        value_enc = await encryption_manager.aencrypt(payload.value) if payload.is_encrypted and payload.value else payload.value
         item = await crud_config.create_configuration(
             db,
             key=payload.key,
@@ -206,6 +230,7 @@ async def create_configuration(
             is_encrypted=payload.is_encrypted,
             is_active=payload.is_active,
         )
+        await config_snapshots.invalidate(db)
         return success_response({"id": item.id})
 
 
@@ -220,6 +245,7 @@ async def create_configuration(
             "description": "更新成功",
             "content": {"application/json": {"example": {"code": 200, "message": "OK", "data": {"id": 1}}}},
         },
+        400: {"description": "语言/地区无效", "content": {"application/json": {"example": {"detail": "region 取值无效: XX"}}}},
         404: {"description": "配置不存在", "content": {"application/json": {"example": {"detail": "配置不存在"}}}},
         409: {"description": "重复冲突", "content": {"application/json": {"example": {"detail": "Key 已存在"}}}},
     },
@@ -247,13 +273,16 @@ async def update_configuration(
                 update_data[field] = value
         
         if payload.api_key is not None:
-            update_data["api_key"] = encrypt_if_present(payload.api_key)
+            update_data["api_key"] = await aencrypt_if_present(payload.api_key)
+            update_data.update(api_key_fields(payload.api_key))
         if payload.password is not None:
-            update_data["password"] = encrypt_if_present(payload.password)
+            update_data["password"] = await aencrypt_if_present(payload.password)
         if payload.extra_config is not None:
+            await _validate_extra_config(db, payload.extra_config)
             update_data["extra_config"] = json.dumps(payload.extra_config, ensure_ascii=False)
         
         svc = await crud_config.update_service_config(db, obj=svc, data=update_data)
+        await config_snapshots.invalidate(db)
         return success_response({"id": svc.id})
 
     # 尝试 KV 配置
@@ -277,11 +306,12 @@ async def update_configuration(
     
     if getattr(payload, "value", None) is not None:
         if payload.value and (payload.is_encrypted if payload.is_encrypted is not None else kv.is_encrypted):
-            update_data["value"] = encryption_manager.encrypt(payload.value)
+            update_data["value"] = await encryption_manager.aencrypt(payload.value)
         else:
             update_data["value"] = payload.value
     
     kv = await crud_config.update_configuration(db, obj=kv, data=update_data)
+    await config_snapshots.invalidate(db)
     return success_response({"id": kv.id})
 
 
@@ -304,6 +334,9 @@ async def delete_configuration(
     svc = await crud_config.get_service_config_by_id(db, config_id=config_id)
     if svc:
         await crud_config.delete_service_config(db, obj=svc)
+        await config_snapshots.invalidate(db)
+        rate_limiters.discard(config_id)
+        circuit_breakers.discard(config_id)
         return success_response({"deleted": True})
     
     kv = await crud_config.get_configuration_by_id(db, config_id=config_id)
@@ -311,6 +344,7 @@ async def delete_configuration(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="配置不存在")
     
     await crud_config.delete_configuration(db, obj=kv)
+    await config_snapshots.invalidate(db)
     return success_response({"deleted": True})
 
 
@@ -338,13 +372,14 @@ async def test_service_connection(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    from app.services.clients import make_client
+    from app.services.clients import make_client, NO_RETRY
 
     # 准备参数
     service_name: Optional[str] = None
     url: Optional[str] = None
     raw_api_key: Optional[str] = None
     proxy: Optional[Dict[str, str]] = None
+    rate_limiter = None
 
     if isinstance(payload, TestConnectionByBody):
         service_name = payload.service_name
@@ -358,12 +393,16 @@ async def test_service_connection(
         
         service_name = svc.service_name
         url = svc.url
-        raw_api_key = decrypt_if_present(svc.api_key)
+        raw_api_key = await adecrypt_if_present(svc.api_key)
         
         # 解析 use_proxy 并注入"proxy 类型服务"作为代理
         extra = parse_extra_config(getattr(svc, "extra_config", None)) or {}
         if isinstance(extra, dict) and extra.get("use_proxy"):
             proxy = await get_active_proxy_config(db)
+        
+        # 按 extra_config.rate_limit / rate_burst 共享该服务的出站限流器
+        if isinstance(extra, dict):
+            rate_limiter = rate_limiters.from_extra_config(svc.id, extra)
 
     if service_name not in {"sonarr", "prowlarr", "tmdb"}:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="仅支持 sonarr/prowlarr/tmdb 连通性测试")
@@ -375,9 +414,14 @@ async def test_service_connection(
             url=url,
             api_key=raw_api_key,
             proxies=proxy,
-            timeout=5
+            timeout=5,
+            retry_policy=NO_RETRY,
+            rate_limiter=rate_limiter,
         )
-        ok, note = client.check_status()
+        ok, note = await client.acheck_status()
+        # 手动测试连通成功后立即恢复该服务的熔断器，无需等待探测间隔
+        if ok and isinstance(payload, TestConnectionById):
+            circuit_breakers.reset(payload.id)
         return success_response({"ok": ok, "details": note})
     except ValueError as e:
         return error_response(message=str(e), code=400)
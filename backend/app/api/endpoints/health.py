@@ -5,6 +5,13 @@
 from fastapi import APIRouter
 from datetime import datetime
 from app.core.config import settings
+from app.services.cache import tmdb_cache
+from app.services.clients import request_group, rate_limiters, circuit_breakers
+from app.services.auth_cache import user_cache
+from app.services.config_snapshot import config_snapshots
+from app.services.dict_tree import dict_trees
+from app.services.log_store import log_store
+from app.utils.logger import log_sink
 
 router = APIRouter()
 
@@ -35,3 +42,33 @@ async def ping():
         dict: pong响应
     """
     return {"message": "pong"}
+
+
+@router.get("/cache")
+async def cache_stats():
+    """
+    外部接口缓存命中、请求合并、限流、熔断、配置快照、用户缓存与字典选项树统计
+    
+    Returns:
+        dict: 各缓存的命中/未命中计数、single-flight 合并计数、各服务限流器排队深度、熔断器状态、配置快照版本、已认证用户缓存命中及字典选项树重建/304 次数
+    """
+    return {
+        "tmdb": tmdb_cache.stats(),
+        "singleflight": request_group.stats(),
+        "rate_limiters": rate_limiters.stats(),
+        "circuit_breakers": circuit_breakers.stats(),
+        "config_snapshot": config_snapshots.stats(),
+        "auth_users": user_cache.stats(),
+        "dict_trees": dict_trees.stats(),
+    }
+
+
+@router.get("/logging")
+async def logging_stats():
+    """
+    文件日志队列与日志入库统计
+    
+    Returns:
+        dict: 当前排队数、队列容量、累计入队/写入/丢弃/写入失败次数与输出格式，store 为日志入库的待写入/写入/丢弃/清理计数
+    """
+    return {**log_sink.stats(), "store": log_store.stats()}
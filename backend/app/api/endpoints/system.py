@@ -0,0 +1,79 @@
+"""
+系统管理端点
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.endpoints.auth import get_current_superuser
+from app.api.schemas.system import LogEntryOut, LogListResponse
+from app.core.config import settings
+from app.db import crud_log
+from app.db.database import get_db
+from app.services.log_store import log_store
+from app.utils import success_response, error_response, json_response
+
+router = APIRouter()
+
+
+# ----------------------- 日志查询 -----------------------
+
+@router.get(
+    "/logs",
+    summary="获取日志列表",
+    description=(
+        "按级别与时间范围分页查询应用日志（时间倒序，仅管理员）。"
+        "日志由后台任务每 LOG_STORE_FLUSH_INTERVAL 秒批量入库，只能查到最近一次入库之前的记录；"
+        "总数最多计到 LOG_STORE_COUNT_LIMIT 条，with_total=false 时不计数"
+    ),
+    response_model=None,
+)
+async def get_logs(
+    page: int = Query(default=1, ge=1, description="页码"),
+    size: int = Query(default=50, ge=1, le=500, description="每页条数"),
+    level: Optional[str] = Query(default=None, description="日志级别，如 INFO、ERROR"),
+    start_time: Optional[datetime] = Query(default=None, description="起始时间（ISO 8601，不带时区时按服务器本地时间）"),
+    end_time: Optional[datetime] = Query(default=None, description="结束时间（ISO 8601，不带时区时按服务器本地时间）"),
+    with_total: bool = Query(default=True, description="是否返回总数与总页数（计数有上限）"),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_superuser),
+):
+    """获取日志列表"""
+    if start_time and end_time and start_time > end_time:
+        return error_response(code=400, message="起始时间不能晚于结束时间")
+
+    filters = {
+        "level": level.upper() if level else None,
+        "start": start_time.timestamp() if start_time else None,
+        "end": end_time.timestamp() if end_time else None,
+    }
+    items, has_more = await crud_log.get_log_records(db, **filters, page=page, size=size)
+    total = None
+    if with_total:
+        total = await crud_log.count_log_records(db, **filters, limit=settings.LOG_STORE_COUNT_LIMIT)
+
+    response_data = LogListResponse(
+        items=[LogEntryOut.from_record(item) for item in items],
+        total=total,
+        page=page,
+        size=size,
+        pages=(total + size - 1) // size if total is not None else None,
+        has_more=has_more,
+    )
+
+    return json_response(response_data)
+
+
+@router.delete(
+    "/logs",
+    summary="清空日志",
+    description="清空日志查询接口中的全部日志（不影响日志文件，仅管理员）",
+    response_model=None,
+)
+async def clear_logs(current_user=Depends(get_current_superuser)):
+    """清空日志"""
+    deleted = await log_store.clear()
+    return success_response({"deleted": deleted}, message="日志已清空")
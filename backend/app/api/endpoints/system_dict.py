@@ -2,46 +2,78 @@
 系统字典管理端点
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from app.db.database import get_db
 from app.api.endpoints.auth import get_current_user, get_current_superuser
 from app.db import crud_system_dict
-from app.utils import success_response, error_response
+from app.services.dict_tree import dict_trees, etag_matches
+from app.services.parser import PARSE_RULE_DICT_TYPE, ensure_parse_rules, validate_rule
+from app.utils import success_response, error_response, json_response
+from app.utils.pagination import encode_cursor, decode_cursor
 from app.api.schemas.system_dict import (
     DictTypeOut,
     DictTypeCreate,
     DictTypeUpdate,
     DictTypeListResponse,
+    DictTypeCursorResponse,
     DictItemOut,
     DictItemCreate,
     DictItemUpdate,
     DictItemListResponse,
-    DictOptionOut,
+    DictItemCursorResponse,
     DictOptionsResponse,
 )
 
 router = APIRouter()
 
+CURSOR_DESCRIPTION = "游标分页：传空值获取第一页，之后传上一页返回的 next_cursor；不传时使用页码分页"
+WITH_TOTAL_DESCRIPTION = "游标分页时是否返回总数（缓存计数）"
+
+
+async def _refresh_parse_rules(db: AsyncSession, dict_type_code: str) -> None:
+    """解析规则字典变更后立即刷新本进程的规则表（其他 worker 在下次解析前按版本戳刷新）"""
+    if dict_type_code == PARSE_RULE_DICT_TYPE:
+        await ensure_parse_rules(db)
+
 
 # ----------------------- 字典类型管理 -----------------------
 
 @router.get(
     "/types",
     summary="获取字典类型列表",
-    description="获取字典类型列表（分页）",
+    description="获取字典类型列表（页码分页，或传 cursor 使用游标分页）",
     response_model=None,
 )
 async def get_dict_types(
     is_active: Optional[bool] = Query(default=None, description="是否启用筛选"),
     page: int = Query(default=1, ge=1, description="页码"),
     page_size: int = Query(default=20, ge=1, le=100, description="每页条数"),
+    cursor: Optional[str] = Query(default=None, description=CURSOR_DESCRIPTION),
+    with_total: bool = Query(default=False, description=WITH_TOTAL_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """获取字典类型列表"""
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, 1)[0] if cursor else None
+        except ValueError as e:
+            return error_response(code=400, message=str(e))
+        items, has_more = await crud_system_dict.get_dict_types_after(
+            db, is_active=is_active, after_id=after, limit=page_size
+        )
+        response_data = DictTypeCursorResponse(
+            items=[DictTypeOut.model_validate(item) for item in items],
+            next_cursor=encode_cursor([items[-1].id]) if has_more else None,
+            has_more=has_more,
+            total=await crud_system_dict.count_dict_types(db, is_active=is_active) if with_total else None,
+            page_size=page_size,
+        )
+        return json_response(response_data)
+
     items, total = await crud_system_dict.get_dict_types(
         db,
         is_active=is_active,
@@ -56,7 +88,7 @@ async def get_dict_types(
         page_size=page_size,
     )
     
-    return success_response(response_data.model_dump())
+    return json_response(response_data)
 
 
 @router.post(
@@ -84,6 +116,7 @@ async def create_dict_type(
         remark=data.remark,
         is_active=data.is_active,
     )
+    await _refresh_parse_rules(db, data.code)
     
     return success_response(DictTypeOut.model_validate(item).model_dump())
 
@@ -110,6 +143,7 @@ async def update_dict_type(
     update_data = data.model_dump(exclude_unset=True)
     if update_data:
         dict_type = await crud_system_dict.update_dict_type(db, obj=dict_type, data=update_data)
+        await _refresh_parse_rules(db, dict_type.code)
     
     return success_response(DictTypeOut.model_validate(dict_type).model_dump())
 
@@ -132,7 +166,9 @@ async def delete_dict_type(
         return error_response(code=404, message="字典类型不存在")
     
     # 删除字典类型（级联删除字典项）
+    code = dict_type.code
     await crud_system_dict.delete_dict_type(db, obj=dict_type)
+    await _refresh_parse_rules(db, code)
     
     return success_response({"deleted": True})
 
@@ -142,7 +178,7 @@ async def delete_dict_type(
 @router.get(
     "/items",
     summary="获取字典项列表",
-    description="获取字典项列表（分页）",
+    description="获取字典项列表（页码分页，或传 cursor 使用按 (sort_order, id) 的游标分页）",
     response_model=None,
 )
 async def get_dict_items(
@@ -151,6 +187,8 @@ async def get_dict_items(
     parent_id: Optional[int] = Query(default=None, description="父项ID筛选"),
     page: int = Query(default=1, ge=1, description="页码"),
     page_size: int = Query(default=50, ge=1, le=200, description="每页条数"),
+    cursor: Optional[str] = Query(default=None, description=CURSOR_DESCRIPTION),
+    with_total: bool = Query(default=False, description=WITH_TOTAL_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -160,6 +198,33 @@ async def get_dict_items(
     if not dict_type:
         return error_response(code=404, message=f"字典类型 '{dict_type_code}' 不存在")
     
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, 2) if cursor else None
+        except ValueError as e:
+            return error_response(code=400, message=str(e))
+        items, has_more = await crud_system_dict.get_dict_items_after(
+            db,
+            dict_type_code=dict_type_code,
+            is_active=is_active,
+            parent_id=parent_id,
+            after=after,
+            limit=page_size,
+        )
+        total = None
+        if with_total:
+            total = await crud_system_dict.count_dict_items(
+                db, dict_type_code=dict_type_code, is_active=is_active, parent_id=parent_id
+            )
+        response_data = DictItemCursorResponse(
+            items=[DictItemOut.model_validate(item) for item in items],
+            next_cursor=encode_cursor([items[-1].sort_order, items[-1].id]) if has_more else None,
+            has_more=has_more,
+            total=total,
+            page_size=page_size,
+        )
+        return json_response(response_data)
+    
     # 获取字典项列表
     items, total = await crud_system_dict.get_dict_items(
         db,
@@ -177,7 +242,7 @@ async def get_dict_items(
         page_size=page_size,
     )
     
-    return success_response(response_data.model_dump())
+    return json_response(response_data)
 
 
 @router.get(
@@ -234,6 +299,12 @@ async def create_dict_item(
         if parent.dict_type_code != data.dict_type_code:
             return error_response(code=400, message="父项必须属于同一字典类型")
     
+    # 解析规则需校验正则
+    if data.dict_type_code == PARSE_RULE_DICT_TYPE:
+        error = validate_rule(data.code, data.value, data.sort_order, data.extra_data)
+        if error:
+            return error_response(code=400, message=error)
+    
     # 创建字典项
     item = await crud_system_dict.create_dict_item(
         db,
@@ -247,6 +318,7 @@ async def create_dict_item(
         is_active=data.is_active,
         extra_data=data.extra_data,
     )
+    await _refresh_parse_rules(db, data.dict_type_code)
     
     return success_response(DictItemOut.model_validate(item).model_dump())
 
@@ -280,10 +352,22 @@ async def update_dict_item(
         if parent.dict_type_code != item.dict_type_code:
             return error_response(code=400, message="父项必须属于同一字典类型")
     
+    # 解析规则需校验更新后的正则
+    if item.dict_type_code == PARSE_RULE_DICT_TYPE:
+        error = validate_rule(
+            item.code,
+            data.value or item.value,
+            item.sort_order if data.sort_order is None else data.sort_order,
+            data.extra_data or item.extra_data,
+        )
+        if error:
+            return error_response(code=400, message=error)
+    
     # 更新字典项
     update_data = data.model_dump(exclude_unset=True)
     if update_data:
         item = await crud_system_dict.update_dict_item(db, obj=item, data=update_data)
+        await _refresh_parse_rules(db, item.dict_type_code)
     
     return success_response(DictItemOut.model_validate(item).model_dump())
 
@@ -306,7 +390,9 @@ async def delete_dict_item(
         return error_response(code=404, message="字典项不存在")
     
     # 删除字典项（级联删除子项）
+    dict_type_code = item.dict_type_code
     await crud_system_dict.delete_dict_item(db, obj=item)
+    await _refresh_parse_rules(db, dict_type_code)
     
     return success_response({"deleted": True})
 
@@ -316,35 +402,30 @@ async def delete_dict_item(
 @router.get(
     "/options/{dict_type_code}",
     summary="获取字典选项",
-    description="获取指定字典类型的所有启用选项（用于前端下拉列表）",
+    description="获取指定字典类型的所有启用选项（用于前端下拉列表），支持 ETag / If-None-Match 条件请求",
     response_model=None,
+    responses={200: {"model": DictOptionsResponse}, 304: {"description": "选项未变化"}},
 )
 async def get_dict_options(
     dict_type_code: str,
     parent_id: Optional[int] = Query(default=None, description="父项ID筛选"),
+    tree: bool = Query(default=False, description="是否返回树形结构（子项嵌套在 children 中）"),
+    if_none_match: Optional[str] = Header(default=None),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """获取字典选项"""
-    # 验证字典类型是否存在且启用
-    dict_type = await crud_system_dict.get_dict_type_by_code(db, code=dict_type_code)
-    if not dict_type:
+    """获取字典选项（由进程内选项树缓存直接返回预先序列化的响应体）"""
+    dict_tree = await dict_trees.get(db, dict_type_code)
+    if dict_tree is None:
         return error_response(code=404, message=f"字典类型 '{dict_type_code}' 不存在")
     
-    if not dict_type.is_active:
+    if not dict_tree.is_active:
         return error_response(code=400, message=f"字典类型 '{dict_type_code}' 未启用")
     
-    # 获取启用的字典项
-    items = await crud_system_dict.get_dict_options(
-        db,
-        dict_type_code=dict_type_code,
-        parent_id=parent_id,
-    )
-    
-    response_data = DictOptionsResponse(
-        dict_type={"code": dict_type.code, "name": dict_type.name},
-        options=[DictOptionOut.model_validate(item) for item in items],
-    )
+    body, etag = dict_tree.render(parent_id=parent_id, tree=tree)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        dict_trees.record_not_modified()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
     
-    return success_response(response_data.model_dump())
-
+    return Response(content=body, media_type="application/json", headers=headers)
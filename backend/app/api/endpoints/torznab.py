@@ -0,0 +1,123 @@
+"""
+Torznab 端点
+供 Sonarr 以 Torznab 索引器的方式接入：URL 填写 http://<host>:8000/api/v1/torznab，API Path 保持 /api
+"""
+
+import hmac
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+from app.services.clients import make_client
+from app.services.clients.circuit import circuit_breakers
+from app.services.clients.ratelimit import rate_limiters
+from app.services import torznab
+from app.services.config_snapshot import ConfigSnapshot, config_snapshots
+from app.utils.logger import logger
+
+router = APIRouter()
+
+# Torznab API Key 所在的 KV 配置键
+TORZNAB_API_KEY = "torznab_api_key"
+
+XML_MEDIA_TYPE = "application/rss+xml; charset=utf-8"
+
+
+def _xml_response(content: bytes) -> Response:
+    return Response(content=content, media_type=XML_MEDIA_TYPE)
+
+
+def _verify_api_key(snapshot: ConfigSnapshot, apikey: Optional[str]) -> bool:
+    """
+    校验 Torznab apikey 是否与 KV 配置 torznab_api_key 一致（未配置时拒绝所有请求）
+    """
+    expected = snapshot.get_kv(TORZNAB_API_KEY)
+    if not apikey or not expected:
+        return False
+    return hmac.compare_digest(expected.encode("utf-8"), apikey.encode("utf-8"))
+
+
+def _parse_categories(cat: Optional[str]) -> Optional[List[int]]:
+    """解析逗号分隔的分类 ID"""
+    if not cat:
+        return None
+    return [int(c) for c in cat.split(",") if c.strip().isdigit()]
+
+
+def _build_query(q: Optional[str], season: Optional[str], ep: Optional[str]) -> str:
+    """构建 Prowlarr 搜索关键词，季/集号以 Prowlarr 的 {Season:NN}{Episode:NN} 记号传递"""
+    query = (q or "").strip()
+    if season and season.isdigit():
+        query += f"{{Season:{int(season):02d}}}"
+        if ep and ep.isdigit():
+            query += f"{{Episode:{int(ep):02d}}}"
+    return query
+
+
+async def _release_batches(results: AsyncIterator[tuple[int, bool, Any]]) -> AsyncIterator[List[Dict[str, Any]]]:
+    """将按索引器产出的结果转换为成功结果批次，失败的索引器仅记录日志"""
+    try:
+        async for indexer_id, ok, result in results:
+            if ok:
+                yield result
+            else:
+                logger.warning(f"Torznab 搜索索引器 {indexer_id} 失败: {result}")
+    finally:
+        await results.aclose()
+
+
+@router.get(
+    "/api",
+    summary="Torznab API",
+    description="兼容 Torznab 规范的搜索接口（t=caps|search|tvsearch），以流式 RSS XML 返回 Prowlarr 搜索结果",
+    response_class=Response,
+)
+async def torznab_api(
+    t: str = Query(..., description="功能：caps / search / tvsearch"),
+    q: Optional[str] = Query(default=None, description="搜索关键词"),
+    apikey: Optional[str] = Query(default=None, description="Torznab API Key（KV 配置 torznab_api_key）"),
+    cat: Optional[str] = Query(default=None, description="分类ID，逗号分隔"),
+    season: Optional[str] = Query(default=None, description="季号"),
+    ep: Optional[str] = Query(default=None, description="集号"),
+    limit: int = Query(default=100, ge=1, le=1000, description="最大返回条数"),
+    offset: int = Query(default=0, ge=0, description="偏移量"),
+    db: AsyncSession = Depends(get_db),
+):
+    if t == "caps":
+        return _xml_response(torznab.render_caps())
+
+    snapshot = await config_snapshots.get(db)
+    if not _verify_api_key(snapshot, apikey):
+        return _xml_response(torznab.render_error(torznab.ERROR_INCORRECT_CREDENTIALS, "Incorrect user credentials"))
+
+    if t not in {"search", "tvsearch"}:
+        return _xml_response(torznab.render_error(torznab.ERROR_UNSUPPORTED_FUNCTION, f"Function not available: {t}"))
+
+    services = snapshot.get_services("prowlarr")
+    if not services:
+        return _xml_response(torznab.render_error(torznab.ERROR_UNKNOWN, "Prowlarr is not configured"))
+    svc = services[0]
+
+    extra = dict(svc.extra)
+    proxy = dict(snapshot.proxy) if snapshot.proxy and extra.get("use_proxy") else None
+    client = make_client(
+        service_name="prowlarr",
+        url=svc.url,
+        api_key=svc.api_key,
+        proxies=proxy,
+        rate_limiter=rate_limiters.from_extra_config(svc.id, extra),
+        circuit_breaker=circuit_breakers.from_extra_config(svc.id, extra),
+    )
+
+    results = client.asearch(
+        _build_query(q, season, ep),
+        categories=_parse_categories(cat),
+        search_type=t,
+    )
+    return StreamingResponse(
+        torznab.stream_feed(_release_batches(results), offset=offset, limit=limit),
+        media_type=XML_MEDIA_TYPE,
+    )
@@ -4,7 +4,7 @@ API路由汇总
 
 from fastapi import APIRouter
 
-from app.api.endpoints import auth, config, health, system_dict
+from app.api.endpoints import auth, config, health, system, system_dict, torznab
 
 # 创建主路由器
 api_router = APIRouter()
@@ -14,3 +14,5 @@ api_router.include_router(health.router, prefix="/health", tags=["健康检查"]
 api_router.include_router(auth.router, prefix="/auth", tags=["认证"])
 api_router.include_router(config.router, prefix="/config", tags=["配置管理"])
 api_router.include_router(system_dict.router, prefix="/dict", tags=["字典管理"])
+api_router.include_router(system.router, prefix="/system", tags=["系统管理"])
+api_router.include_router(torznab.router, prefix="/torznab", tags=["Torznab"])
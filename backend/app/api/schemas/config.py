@@ -2,6 +2,7 @@
 配置相关的 Pydantic Schema 定义
 """
 
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional, Literal, Dict, Any
 
@@ -15,11 +16,12 @@ class ServiceConfigOut(BaseModel):
     name: str = Field(description="配置名称")
     url: str = Field(description="服务基础URL")
     api_key_masked: Optional[str] = Field(default=None, description="API Key 掩码，仅展示末4位")
+    api_key_length: Optional[int] = Field(default=None, description="API Key 明文长度")
     username: Optional[str] = Field(default=None, description="用户名（可选）")
     is_active: bool = Field(description="是否启用")
     extra_config: Optional[Dict[str, Any]] = Field(default=None, description="额外配置（JSON 反序列化）")
-    created_at: Optional[str] = Field(default=None, description="创建时间 ISO8601")
-    updated_at: Optional[str] = Field(default=None, description="更新时间 ISO8601")
+    created_at: Optional[datetime] = Field(default=None, description="创建时间 ISO8601")
+    updated_at: Optional[datetime] = Field(default=None, description="更新时间 ISO8601")
 
     class Config:
         from_attributes = True
@@ -32,8 +34,8 @@ class KVConfigOut(BaseModel):
     has_value: Optional[bool] = Field(default=None, description="当 is_encrypted=True 时，指示是否已设置值")
     is_encrypted: bool = Field(description="是否加密存储")
     is_active: bool = Field(description="是否启用")
-    created_at: Optional[str] = Field(default=None, description="创建时间 ISO8601")
-    updated_at: Optional[str] = Field(default=None, description="更新时间 ISO8601")
+    created_at: Optional[datetime] = Field(default=None, description="创建时间 ISO8601")
+    updated_at: Optional[datetime] = Field(default=None, description="更新时间 ISO8601")
 
     class Config:
         from_attributes = True
@@ -0,0 +1,42 @@
+"""
+系统管理相关的 Pydantic Schema 定义
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.models.log import LogRecord
+
+
+class LogEntryOut(BaseModel):
+    """日志记录输出 Schema"""
+    id: int = Field(description="日志ID")
+    level: str = Field(description="日志级别", examples=["INFO"])
+    message: str = Field(description="日志内容")
+    timestamp: str = Field(description="记录时间（ISO 8601，含时区）")
+    module: Optional[str] = Field(default=None, description="来源（模块:函数:行号）")
+    exception: Optional[str] = Field(default=None, description="异常堆栈")
+
+    @classmethod
+    def from_record(cls, record: LogRecord) -> "LogEntryOut":
+        """由日志记录模型构建（时间戳转换为本地时区的 ISO 时间）"""
+        return cls(
+            id=record.id,
+            level=record.level,
+            message=record.message,
+            timestamp=datetime.fromtimestamp(record.timestamp).astimezone().isoformat(),
+            module=record.module,
+            exception=record.exception,
+        )
+
+
+class LogListResponse(BaseModel):
+    """日志列表响应 Schema"""
+    items: list[LogEntryOut] = Field(description="日志列表")
+    total: Optional[int] = Field(default=None, description="总数（最多计到 LOG_STORE_COUNT_LIMIT，with_total=false 时为空）")
+    page: int = Field(description="当前页码")
+    size: int = Field(description="每页条数")
+    pages: Optional[int] = Field(default=None, description="总页数（with_total=false 时为空）")
+    has_more: bool = Field(description="是否还有下一页")
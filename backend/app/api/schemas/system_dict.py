@@ -88,6 +88,7 @@ class DictOptionOut(BaseModel):
     name: str = Field(description="显示名称")
     value: str = Field(description="实际值")
     extra_data: Optional[str] = Field(default=None, description="扩展数据（JSON字符串）")
+    children: list["DictOptionOut"] = Field(default_factory=list, description="子选项（仅 tree=true 时填充）")
     
     class Config:
         from_attributes = True
@@ -116,3 +117,21 @@ class DictItemListResponse(BaseModel):
     page: int = Field(description="当前页码")
     page_size: int = Field(description="每页条数")
 
+
+
+class DictTypeCursorResponse(BaseModel):
+    """字典类型列表响应 Schema（游标分页）"""
+    items: list[DictTypeOut] = Field(description="字典类型列表")
+    next_cursor: Optional[str] = Field(default=None, description="下一页游标，无下一页时为空")
+    has_more: bool = Field(description="是否还有下一页")
+    total: Optional[int] = Field(default=None, description="总数（仅 with_total=true 时返回，可能有短暂延迟）")
+    page_size: int = Field(description="每页条数")
+
+
+class DictItemCursorResponse(BaseModel):
+    """字典项列表响应 Schema（游标分页）"""
+    items: list[DictItemOut] = Field(description="字典项列表")
+    next_cursor: Optional[str] = Field(default=None, description="下一页游标，无下一页时为空")
+    has_more: bool = Field(description="是否还有下一页")
+    total: Optional[int] = Field(default=None, description="总数（仅 with_total=true 时返回，可能有短暂延迟）")
+    page_size: int = Field(description="每页条数")
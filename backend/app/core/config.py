@@ -17,14 +17,22 @@ class Settings(BaseSettings):
     # 服务器配置
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    ORJSON_RESPONSE: bool = True  # 使用 orjson 序列化 JSON 响应（未安装 orjson 时自动回退到标准库）
     
     # 数据库配置
     DATABASE_URL: str = "sqlite+aiosqlite:///./queqiao.db"
+    SQLITE_PRAGMA_PROFILE: str = "balanced"  # SQLite 连接参数方案：off / balanced / durable
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 写锁冲突时的等待时间（毫秒）
+    SQLITE_CACHE_SIZE_KB: int = 16384  # 每个连接的页缓存大小（KiB）
+    SQLITE_MMAP_SIZE_MB: int = 128  # 内存映射读取的大小上限（MiB），0 表示禁用
     
     # 安全配置
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     ALGORITHM: str = "HS256"
+    AUTH_USER_CACHE_TTL: float = 10.0  # 已认证用户缓存时间（秒），也是用户删除/禁用在其他 worker 生效的最长延迟
+    AUTH_CACHE_MAXSIZE: int = 1024  # 用户缓存与已验证令牌缓存的最大条目数
+    CRYPTO_WORKERS: int = 2  # bcrypt/PBKDF2 等加密运算的专用线程数
     
     # CORS配置
     ALLOWED_HOSTS: List[str] = ["*"]
@@ -50,15 +58,44 @@ class Settings(BaseSettings):
     LOG_FILE: str = "logs/queqiao-arr.log"
     LOG_ROTATION: str = "1 day"
     LOG_RETENTION: str = "30 days"
+    LOG_FORMAT: str = "text"  # 文件日志格式：text（文本行）/ json（JSON Lines）
+    LOG_QUEUE_SIZE: int = 10000  # 文件日志队列容量，写满后丢弃新记录并计数
+    LOG_STORE_ENABLED: bool = True  # 是否将日志写入数据库供日志查询接口使用
+    LOG_STORE_FLUSH_INTERVAL: float = 1.0  # 日志批量入库间隔（秒）
+    LOG_STORE_RETENTION_DAYS: int = 7  # 数据库中日志的保留天数，0 表示不清理
+    LOG_STORE_COUNT_LIMIT: int = 10000  # 日志查询返回总数时的计数上限（超过时总数按上限返回）
     
     # 缓存配置
     CACHE_TTL: int = 3600  # 1小时
     TMDB_CACHE_TTL: int = 86400  # 24小时
+    TMDB_CACHE_MAXSIZE: int = 1024  # 进程内缓存条目上限
+    CACHE_PURGE_INTERVAL: float = 3600.0  # 持久缓存过期条目的清理间隔（秒），写入缓存时按此间隔顺带清理
+    DICT_COUNT_CACHE_TTL: float = 30.0  # 字典游标分页总数的缓存时间（秒）
     
     # 请求配置
     REQUEST_TIMEOUT: int = 30
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0
+    RETRY_MAX_DELAY: float = 10.0  # 单次重试的最大等待（秒），Retry-After 超过该值时放弃重试
+    REQUEST_DEADLINE: float = 2.0  # 单次外部调用（含重试）的总时间预算，<=0 表示不限
+    
+    # Prowlarr 搜索配置
+    PROWLARR_INDEXER_TIMEOUT: float = 2.0  # 单个索引器的搜索超时（秒）
+    
+    # 标题解析配置
+    PARSER_CACHE_SIZE: int = 4096  # 解析结果记忆化的最大条目数
+    PARSER_POOL_WORKERS: int = 2  # 批量解析子进程数，<=0 表示禁用进程池
+    PARSER_POOL_THRESHOLD: int = 1000  # 去重后标题数达到该值时改用进程池解析
+    PARSER_POOL_CHUNK_SIZE: int = 500  # 每次分发给子进程的标题数
+    
+    # 熔断配置（可被 ServiceConfig.extra_config 覆盖）
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RECOVERY_TIMEOUT: float = 30.0
+    
+    # HTTP连接池配置
+    HTTP_POOL_MAX_CONNECTIONS: int = 100
+    HTTP_POOL_MAX_KEEPALIVE: int = 20
+    HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0
     
     class Config:
         env_file = ".env"
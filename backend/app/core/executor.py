@@ -0,0 +1,51 @@
+"""
+CPU 密集型加密运算执行器
+bcrypt 与 PBKDF2/Fernet 在事件循环中同步执行会阻塞其他请求，
+统一交给容量受限的专用线程池（两者在计算期间均释放 GIL）
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_crypto_executor: Optional[Executor] = None
+
+
+def get_crypto_executor() -> Executor:
+    """获取（必要时创建）加密运算专用线程池"""
+    global _crypto_executor
+    if _crypto_executor is None:
+        _crypto_executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.CRYPTO_WORKERS),
+            thread_name_prefix="crypto",
+        )
+    return _crypto_executor
+
+
+async def run_crypto(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    在加密线程池中执行函数
+
+    Args:
+        func: 同步函数
+        args: 位置参数
+        kwargs: 关键字参数
+
+    Returns:
+        函数返回值
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_crypto_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_crypto_executor() -> None:
+    """关闭加密线程池（下次使用时重新创建）"""
+    global _crypto_executor
+    if _crypto_executor is not None:
+        _crypto_executor.shutdown(wait=False)
+        _crypto_executor = None
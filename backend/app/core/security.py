@@ -2,12 +2,21 @@
 安全相关工具模块
 """
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
 from jose import JWTError, jwt
 import bcrypt
 
 from app.core.config import settings
+from app.core.executor import run_crypto
+from app.utils.ttl_cache import MISSING, TTLCache
+
+# 已验证令牌 -> 用户名，缓存至令牌过期（失败结果不缓存）
+_verified_tokens = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAXSIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
 
 
 def create_access_token(
@@ -39,7 +48,7 @@ def create_access_token(
 
 def verify_token(token: str) -> Optional[str]:
     """
-    验证JWT令牌
+    验证JWT令牌（验证通过的令牌在过期前直接复用结果，不再重复验签）
     
     Args:
         token: JWT令牌字符串
@@ -47,6 +56,9 @@ def verify_token(token: str) -> Optional[str]:
     Returns:
         令牌主体，如果验证失败返回None
     """
+    cached = _verified_tokens.get(token)
+    if cached is not MISSING:
+        return cached
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -54,9 +66,14 @@ def verify_token(token: str) -> Optional[str]:
         username: str = payload.get("sub")
         if username is None:
             return None
-        return username
     except JWTError:
         return None
+    exp = payload.get("exp")
+    if exp is not None:
+        remaining = float(exp) - time.time()
+        if remaining > 0:
+            _verified_tokens.set(token, username, ttl=remaining)
+    return username
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -96,6 +113,16 @@ def get_password_hash(password: str) -> str:
     return hashed.decode('utf-8')
 
 
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """在加密线程池中验证密码（参数同 verify_password）"""
+    return await run_crypto(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """在加密线程池中计算密码哈希（参数同 get_password_hash）"""
+    return await run_crypto(get_password_hash, password)
+
+
 def generate_secret_key() -> str:
     """
     生成随机密钥
@@ -0,0 +1,61 @@
+"""
+外部接口响应缓存的数据库操作 (CRUD)
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cache import ApiCacheEntry
+
+
+async def get_cache_entry(db: AsyncSession, *, key: str, now: float) -> Optional[ApiCacheEntry]:
+    """获取未过期的缓存项"""
+    stmt = select(ApiCacheEntry).where(ApiCacheEntry.key == key, ApiCacheEntry.expires_at > now)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def upsert_cache_entry(
+    db: AsyncSession,
+    *,
+    key: str,
+    namespace: str,
+    value: str,
+    expires_at: float,
+) -> None:
+    """写入或覆盖缓存项"""
+    stmt = insert(ApiCacheEntry).values(
+        key=key,
+        namespace=namespace,
+        value=value,
+        expires_at=expires_at,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ApiCacheEntry.key],
+        set_={"value": stmt.excluded.value, "expires_at": stmt.excluded.expires_at},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def purge_expired_entries(db: AsyncSession, *, now: float, namespace: Optional[str] = None) -> int:
+    """删除已过期的缓存项，返回删除条数"""
+    stmt = delete(ApiCacheEntry).where(ApiCacheEntry.expires_at <= now)
+    if namespace is not None:
+        stmt = stmt.where(ApiCacheEntry.namespace == namespace)
+    result = await db.execute(stmt)
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+async def clear_cache_entries(db: AsyncSession, *, namespace: str) -> int:
+    """清空指定命名空间的缓存项，返回删除条数"""
+    stmt = delete(ApiCacheEntry).where(ApiCacheEntry.namespace == namespace)
+    result = await db.execute(stmt)
+    await db.commit()
+    return int(result.rowcount or 0)
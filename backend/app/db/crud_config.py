@@ -7,9 +7,13 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import select, and_, func
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.config import Configuration, ServiceConfig
+from app.models.config import Configuration, ConfigVersion, ServiceConfig
+
+# 配置版本号所在行的主键
+CONFIG_VERSION_ID = 1
 
 
 # ---------- ServiceConfig ----------
@@ -64,6 +68,8 @@ async def create_service_config(
     password: Optional[str],
     extra_config: Optional[str],
     is_active: bool = True,
+    api_key_masked: Optional[str] = None,
+    api_key_length: Optional[int] = None,
 ) -> ServiceConfig:
     item = ServiceConfig(
         service_name=service_name,
@@ -71,6 +77,8 @@ async def create_service_config(
         name=name,
         url=url,
         api_key=api_key,
+        api_key_masked=api_key_masked,
+        api_key_length=api_key_length,
         username=username,
         password=password,
         extra_config=extra_config,
@@ -173,3 +181,20 @@ async def delete_configuration(db: AsyncSession, *, obj: Configuration) -> None:
     await db.commit()
 
 
+# ---------- 配置版本号 ----------
+
+async def get_config_version(db: AsyncSession) -> int:
+    stmt = select(ConfigVersion.version).where(ConfigVersion.id == CONFIG_VERSION_ID)
+    res = await db.execute(stmt)
+    return int(res.scalar() or 0)
+
+
+async def bump_config_version(db: AsyncSession) -> int:
+    stmt = insert(ConfigVersion).values(id=CONFIG_VERSION_ID, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ConfigVersion.id],
+        set_={"version": ConfigVersion.version + 1},
+    )
+    await db.execute(stmt)
+    await db.commit()
+    return await get_config_version(db)
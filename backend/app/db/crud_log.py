@@ -0,0 +1,103 @@
+"""
+日志记录的数据库操作 (CRUD)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.log import LogRecord
+
+
+def _filtered(stmt, *, level: Optional[str], start: Optional[float], end: Optional[float]):
+    if level is not None:
+        stmt = stmt.where(LogRecord.level == level)
+    if start is not None:
+        stmt = stmt.where(LogRecord.timestamp >= start)
+    if end is not None:
+        stmt = stmt.where(LogRecord.timestamp <= end)
+    return stmt
+
+
+async def add_log_records(db: AsyncSession, *, rows: List[Dict[str, Any]]) -> None:
+    """批量写入日志记录（一条 executemany 语句）"""
+    if not rows:
+        return
+    await db.execute(insert(LogRecord), rows)
+    await db.commit()
+
+
+async def get_log_records(
+    db: AsyncSession,
+    *,
+    level: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    page: int = 1,
+    size: int = 50,
+) -> Tuple[List[LogRecord], bool]:
+    """
+    按级别与时间范围分页查询日志（时间倒序，不执行 COUNT）
+
+    Args:
+        db: 数据库会话
+        level: 日志级别（精确匹配）
+        start: 起始时间（Unix 时间戳，含）
+        end: 结束时间（Unix 时间戳，含）
+        page: 页码
+        size: 每页条数
+
+    Returns:
+        (日志列表, 是否还有下一页)
+    """
+    stmt = _filtered(select(LogRecord), level=level, start=start, end=end)
+    stmt = stmt.order_by(LogRecord.timestamp.desc(), LogRecord.id.desc())
+    stmt = stmt.offset((page - 1) * size).limit(size + 1)
+    result = await db.execute(stmt)
+    items = list(result.scalars().all())
+    return items[:size], len(items) > size
+
+
+async def count_log_records(
+    db: AsyncSession,
+    *,
+    level: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> int:
+    """
+    统计符合条件的日志条数
+
+    Args:
+        db: 数据库会话
+        level: 日志级别（精确匹配）
+        start: 起始时间（Unix 时间戳，含）
+        end: 结束时间（Unix 时间戳，含）
+        limit: 计数上限，达到后停止扫描并返回该值，None 表示不限
+
+    Returns:
+        日志条数（不超过 limit）
+    """
+    matched = _filtered(select(LogRecord.id), level=level, start=start, end=end)
+    if limit is not None:
+        matched = matched.limit(limit)
+    stmt = select(func.count()).select_from(matched.subquery())
+    return int((await db.execute(stmt)).scalar() or 0)
+
+
+async def delete_log_records_before(db: AsyncSession, *, before: float) -> int:
+    """删除早于指定时间的日志，返回删除条数"""
+    result = await db.execute(delete(LogRecord).where(LogRecord.timestamp < before))
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+async def clear_log_records(db: AsyncSession) -> int:
+    """清空日志（不带条件的 DELETE，SQLite 直接截断整表），返回删除条数"""
+    result = await db.execute(delete(LogRecord))
+    await db.commit()
+    return int(result.rowcount or 0)
@@ -4,12 +4,46 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, and_, func, tuple_
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.models.config import Configuration
 from app.models.dict import DictType, DictItem
+from app.utils.ttl_cache import MISSING, TTLCache
+
+# 游标分页可选总数的计数缓存（本进程内的变更立即清空，其他 worker 的变更最长延迟 DICT_COUNT_CACHE_TTL）
+_count_cache = TTLCache(maxsize=256, ttl=settings.DICT_COUNT_CACHE_TTL)
+
+# 记录已初始化过的内置字典类型编码（JSON 列表）的配置键；用户删除的内置类型不会在重启后被重新写入
+SEEDED_TYPES_KEY = "system.dict_seeded_types"
+
+
+def _on_dict_changed() -> None:
+    """字典变更后清空计数缓存（选项树与解析规则按类型版本号自行失效）"""
+    _count_cache.clear()
+
+
+async def _bump_version(db: AsyncSession, dict_type_code: str) -> None:
+    """递增字典类型版本号（与变更在同一事务中提交），各进程的选项树缓存据此失效"""
+    await db.execute(
+        update(DictType)
+        .where(DictType.code == dict_type_code)
+        .values(version=DictType.version + 1)
+    )
+
+
+async def _cached_count(db: AsyncSession, key: str, stmt) -> int:
+    """执行计数查询并缓存结果"""
+    total = _count_cache.get(key)
+    if total is MISSING:
+        total = int((await db.execute(stmt)).scalar() or 0)
+        _count_cache.set(key, total)
+    return total
 
 
 # ---------- 字典类型 CRUD ----------
@@ -56,6 +90,44 @@ async def get_dict_types(
     return items, total
 
 
+async def get_dict_types_after(
+    db: AsyncSession,
+    *,
+    is_active: Optional[bool] = None,
+    after_id: Optional[int] = None,
+    limit: int = 20,
+) -> Tuple[List[DictType], bool]:
+    """
+    获取字典类型列表（游标分页，按 id 升序）
+
+    Args:
+        db: 数据库会话
+        is_active: 是否启用筛选
+        after_id: 上一页最后一条的 id，None 表示第一页
+        limit: 每页条数
+
+    Returns:
+        (字典类型列表, 是否还有下一页)
+    """
+    stmt = select(DictType).order_by(DictType.id).limit(limit + 1)
+    if is_active is not None:
+        stmt = stmt.where(DictType.is_active == is_active)
+    if after_id is not None:
+        stmt = stmt.where(DictType.id > after_id)
+
+    result = await db.execute(stmt)
+    items = list(result.scalars().all())
+    return items[:limit], len(items) > limit
+
+
+async def count_dict_types(db: AsyncSession, *, is_active: Optional[bool] = None) -> int:
+    """统计字典类型数量（带缓存）"""
+    stmt = select(func.count(DictType.id))
+    if is_active is not None:
+        stmt = stmt.where(DictType.is_active == is_active)
+    return await _cached_count(db, f"types:{is_active}", stmt)
+
+
 async def get_dict_type_by_id(db: AsyncSession, *, type_id: int) -> Optional[DictType]:
     """根据ID获取字典类型"""
     stmt = select(DictType).where(DictType.id == type_id)
@@ -99,6 +171,7 @@ async def create_dict_type(
     db.add(item)
     await db.commit()
     await db.refresh(item)
+    _on_dict_changed()
     return item
 
 
@@ -112,8 +185,10 @@ async def update_dict_type(
     for key, value in data.items():
         if value is not None:  # 只更新非 None 的值
             setattr(obj, key, value)
+    await _bump_version(db, obj.code)
     await db.commit()
     await db.refresh(obj)
+    _on_dict_changed()
     return obj
 
 
@@ -121,10 +196,21 @@ async def delete_dict_type(db: AsyncSession, *, obj: DictType) -> None:
     """删除字典类型（级联删除所有字典项）"""
     await db.delete(obj)
     await db.commit()
+    _on_dict_changed()
 
 
 # ---------- 字典项 CRUD ----------
 
+def _item_conditions(dict_type_code: str, is_active: Optional[bool], parent_id: Optional[int]) -> list:
+    """字典项列表的筛选条件"""
+    conditions = [DictItem.dict_type_code == dict_type_code]
+    if is_active is not None:
+        conditions.append(DictItem.is_active == is_active)
+    if parent_id is not None:
+        conditions.append(DictItem.parent_id == parent_id)
+    return conditions
+
+
 async def get_dict_items(
     db: AsyncSession,
     *,
@@ -148,12 +234,7 @@ async def get_dict_items(
     Returns:
         (字典项列表, 总数)
     """
-    conditions = [DictItem.dict_type_code == dict_type_code]
-    
-    if is_active is not None:
-        conditions.append(DictItem.is_active == is_active)
-    if parent_id is not None:
-        conditions.append(DictItem.parent_id == parent_id)
+    conditions = _item_conditions(dict_type_code, is_active, parent_id)
     
     # 查询总数
     count_stmt = select(func.count(DictItem.id)).where(and_(*conditions))
@@ -175,6 +256,58 @@ async def get_dict_items(
     return items, total
 
 
+async def get_dict_items_after(
+    db: AsyncSession,
+    *,
+    dict_type_code: str,
+    is_active: Optional[bool] = None,
+    parent_id: Optional[int] = None,
+    after: Optional[Tuple[int, int]] = None,
+    limit: int = 50,
+) -> Tuple[List[DictItem], bool]:
+    """
+    获取字典项列表（游标分页，按 (sort_order, id) 升序）
+
+    从上一页最后一条的排序键之后沿索引继续读取，耗时与页码无关，且不执行 COUNT。
+
+    Args:
+        db: 数据库会话
+        dict_type_code: 字典类型编码（必填）
+        is_active: 是否启用筛选
+        parent_id: 父项ID筛选
+        after: 上一页最后一条的 (sort_order, id)，None 表示第一页
+        limit: 每页条数
+
+    Returns:
+        (字典项列表, 是否还有下一页)
+    """
+    conditions = _item_conditions(dict_type_code, is_active, parent_id)
+    if after is not None:
+        conditions.append(tuple_(DictItem.sort_order, DictItem.id) > tuple_(*after))
+
+    stmt = (
+        select(DictItem)
+        .where(and_(*conditions))
+        .order_by(DictItem.sort_order, DictItem.id)
+        .limit(limit + 1)
+    )
+    result = await db.execute(stmt)
+    items = list(result.scalars().all())
+    return items[:limit], len(items) > limit
+
+
+async def count_dict_items(
+    db: AsyncSession,
+    *,
+    dict_type_code: str,
+    is_active: Optional[bool] = None,
+    parent_id: Optional[int] = None,
+) -> int:
+    """统计字典项数量（带缓存）"""
+    stmt = select(func.count(DictItem.id)).where(and_(*_item_conditions(dict_type_code, is_active, parent_id)))
+    return await _cached_count(db, f"items:{dict_type_code}:{is_active}:{parent_id}", stmt)
+
+
 async def get_dict_item_by_id(db: AsyncSession, *, item_id: int) -> Optional[DictItem]:
     """根据ID获取字典项"""
     stmt = select(DictItem).where(DictItem.id == item_id)
@@ -228,8 +361,10 @@ async def create_dict_item(
         extra_data=extra_data,
     )
     db.add(item)
+    await _bump_version(db, dict_type_code)
     await db.commit()
     await db.refresh(item)
+    _on_dict_changed()
     return item
 
 
@@ -243,15 +378,108 @@ async def update_dict_item(
     for key, value in data.items():
         if value is not None:  # 只更新非 None 的值
             setattr(obj, key, value)
+    await _bump_version(db, obj.dict_type_code)
     await db.commit()
     await db.refresh(obj)
+    _on_dict_changed()
     return obj
 
 
 async def delete_dict_item(db: AsyncSession, *, obj: DictItem) -> None:
     """删除字典项（级联删除子项）"""
+    dict_type_code = obj.dict_type_code
     await db.delete(obj)
+    await _bump_version(db, dict_type_code)
+    await db.commit()
+    _on_dict_changed()
+
+
+# ---------- 批量初始化 ----------
+
+async def _get_seeded_codes(db: AsyncSession) -> Optional[set]:
+    """读取已初始化过的内置字典类型编码，None 表示尚无记录（旧版本数据库或全新数据库）"""
+    result = await db.execute(select(Configuration.value).where(Configuration.key == SEEDED_TYPES_KEY))
+    value = result.scalar_one_or_none()
+    if value is None:
+        return None
+    try:
+        return set(json.loads(value))
+    except (TypeError, ValueError):
+        return None
+
+
+async def seed_dict_data(db: AsyncSession, *, seeds: Sequence[Dict[str, Any]]) -> List[str]:
+    """
+    批量写入内置字典类型及其字典项
+
+    只写入从未初始化过的类型（连同其字典项）：已初始化的类型编码记录在 SEEDED_TYPES_KEY 配置项中，
+    用户之后删除的内置类型与字典项不会在重启后被恢复；没有记录时（旧版本数据库）以数据库中已有的类型为准。
+    类型与字典项各一条 insert ... on conflict do nothing（executemany），与记录一起在同一事务中提交。
+    多个 worker 同时初始化时，后提交者因唯一约束冲突被忽略，不会报错或产生重复数据。
+
+    Args:
+        db: 数据库会话
+        seeds: 字典类型列表，每项包含 code/name/remark 以及 items（字典项字段列表）
+
+    Returns:
+        本次写入的字典类型编码（并发时可能已由其他 worker 写入）
+    """
+    codes = [seed["code"] for seed in seeds]
+    result = await db.execute(select(DictType.code).where(DictType.code.in_(codes)))
+    existing = set(result.scalars().all())
+    seeded = await _get_seeded_codes(db)
+    done = existing if seeded is None else existing | seeded
+    pending = [seed for seed in seeds if seed["code"] not in done]
+    marker = sorted(done | set(codes))
+    if not pending and seeded is not None and set(marker) == seeded:
+        return []
+
+    type_rows = [
+        {
+            "code": seed["code"],
+            "name": seed["name"],
+            "remark": seed.get("remark"),
+            "is_active": seed.get("is_active", True),
+        }
+        for seed in pending
+    ]
+    item_rows = [
+        {
+            "dict_type_code": seed["code"],
+            "code": item["code"],
+            "name": item["name"],
+            "value": item["value"],
+            "sort_order": item.get("sort_order", 0),
+            "remark": item.get("remark"),
+            "is_active": item.get("is_active", True),
+            "extra_data": item.get("extra_data"),
+        }
+        for seed in pending
+        for item in seed.get("items", [])
+    ]
+
+    if type_rows:
+        await db.execute(insert(DictType).on_conflict_do_nothing(index_elements=["code"]), type_rows)
+    if item_rows:
+        await db.execute(
+            insert(DictItem).on_conflict_do_nothing(index_elements=["dict_type_code", "code"]),
+            item_rows,
+        )
+    value = json.dumps(marker)
+    await db.execute(
+        insert(Configuration)
+        .values(
+            key=SEEDED_TYPES_KEY,
+            value=value,
+            description="已初始化的内置字典类型（系统维护，删除后以现有字典类型为准）",
+            is_encrypted=False,
+            is_active=False,
+        )
+        .on_conflict_do_update(index_elements=["key"], set_={"value": value})
+    )
     await db.commit()
+    _count_cache.clear()
+    return [seed["code"] for seed in pending]
 
 
 # ---------- 选项查询 ----------
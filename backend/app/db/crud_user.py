@@ -5,7 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from app.models.user import User
-from app.core.security import get_password_hash, verify_password
+from app.core.security import aget_password_hash, averify_password
+from app.services.auth_cache import user_cache
 
 
 async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
@@ -31,7 +32,7 @@ async def create_user(
     user = User(
         username=username,
         email=email,
-        hashed_password=get_password_hash(password),
+        hashed_password=await aget_password_hash(password),
         is_superuser=is_superuser,
         is_active=True,
     )
@@ -47,7 +48,7 @@ async def authenticate_user(
     user = await get_user_by_username(db, username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await averify_password(password, user.hashed_password):
         return None
     if not user.is_active:
         return None
@@ -60,6 +61,18 @@ async def delete_user_by_username(db: AsyncSession, username: str) -> bool:
         return False
     await db.delete(user)
     await db.commit()
+    user_cache.invalidate(username)
     return True
 
 
+async def set_user_active(db: AsyncSession, *, username: str, is_active: bool) -> Optional[User]:
+    user = await get_user_by_username(db, username)
+    if not user:
+        return None
+    user.is_active = is_active
+    await db.commit()
+    await db.refresh(user)
+    user_cache.invalidate(username)
+    return user
+
+
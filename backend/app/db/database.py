@@ -7,6 +7,7 @@ from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import MetaData
 
 from app.core.config import settings
+from app.db.sqlite import install_pragmas
 
 # 创建异步数据库引擎
 engine = create_async_engine(
@@ -16,6 +17,9 @@ engine = create_async_engine(
     pool_pre_ping=True,
 )
 
+# SQLite 连接参数（WAL、同步级别、缓存、锁等待）
+install_pragmas(engine, settings.SQLITE_PRAGMA_PROFILE)
+
 # 创建异步会话工厂
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -56,7 +60,7 @@ async def get_db() -> AsyncSession:
 
 
 async def create_tables() -> None:
-    """创建所有数据表"""
+    """创建所有数据表（仅用于开发/测试，正式启动使用 app.db.migrate 执行迁移）"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -2,142 +2,107 @@
 初始化系统字典数据
 """
 
+import json
+from typing import Any, Dict, List
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import crud_system_dict
-import json
+
+
+# 内置字典（声明式）：新增字典类型只需在此追加，启动时与其余类型在同一事务中批量写入
+DICT_SEED: List[Dict[str, Any]] = [
+    {
+        "code": "language",
+        "name": "语言选项",
+        "remark": "系统支持的语言列表，用于TMDB API查询、前端界面显示等场景",
+        "items": [
+            {"code": "zh-CN", "name": "简体中文", "value": "zh-CN", "sort_order": 1,
+             "remark": "中国大陆使用的简体中文，TMDB语言代码", "extra_data": {"icon": "🇨🇳"}},
+            {"code": "zh-TW", "name": "繁體中文", "value": "zh-TW", "sort_order": 2,
+             "remark": "台湾地区使用的繁体中文", "extra_data": {"icon": "🇹🇼"}},
+            {"code": "en-US", "name": "English (US)", "value": "en-US", "sort_order": 3,
+             "remark": "美式英语，用于英文资源标题匹配", "extra_data": {"icon": "🇺🇸"}},
+            {"code": "ja-JP", "name": "日本語", "value": "ja-JP", "sort_order": 4,
+             "remark": "日本语言选项，用于日语内容匹配", "extra_data": {"icon": "🇯🇵"}},
+            {"code": "ko-KR", "name": "한국어", "value": "ko-KR", "sort_order": 5,
+             "remark": "韩语选项", "extra_data": {"icon": "🇰🇷"}},
+        ],
+    },
+    {
+        "code": "region",
+        "name": "地区选项",
+        "remark": "内容地区分类，用于TMDB地区筛选，影响搜索结果和内容推荐",
+        "items": [
+            {"code": "CN", "name": "中国大陆", "value": "CN", "sort_order": 1,
+             "remark": "中国大陆地区", "extra_data": {"icon": "🇨🇳"}},
+            {"code": "TW", "name": "台湾", "value": "TW", "sort_order": 2,
+             "remark": "台湾地区", "extra_data": {"icon": "🇹🇼"}},
+            {"code": "HK", "name": "香港", "value": "HK", "sort_order": 3,
+             "remark": "香港特别行政区", "extra_data": {"icon": "🇭🇰"}},
+            {"code": "US", "name": "美国", "value": "US", "sort_order": 4,
+             "remark": "美国地区", "extra_data": {"icon": "🇺🇸"}},
+            {"code": "JP", "name": "日本", "value": "JP", "sort_order": 5,
+             "remark": "日本地区", "extra_data": {"icon": "🇯🇵"}},
+            {"code": "KR", "name": "韩国", "value": "KR", "sort_order": 6,
+             "remark": "韩国地区", "extra_data": {"icon": "🇰🇷"}},
+        ],
+    },
+    {
+        "code": "quality",
+        "name": "质量标签",
+        "remark": "视频质量分类，用于资源标题解析和质量筛选，优先级：8K > 4K > 1080p > 720p > 480p",
+        "items": [
+            {"code": "8K", "name": "8K超高清", "value": "8K", "sort_order": 1,
+             "remark": "7680×4320分辨率", "extra_data": {"priority": 10, "resolution": "7680x4320"}},
+            {"code": "4K", "name": "4K超高清", "value": "4K", "sort_order": 2,
+             "remark": "3840×2160分辨率（UHD）", "extra_data": {"priority": 9, "resolution": "3840x2160"}},
+            {"code": "1080p", "name": "1080p全高清", "value": "1080p", "sort_order": 3,
+             "remark": "1920×1080分辨率（FHD）", "extra_data": {"priority": 8, "resolution": "1920x1080"}},
+            {"code": "720p", "name": "720p高清", "value": "720p", "sort_order": 4,
+             "remark": "1280×720分辨率（HD）", "extra_data": {"priority": 7, "resolution": "1280x720"}},
+            {"code": "480p", "name": "480p标清", "value": "480p", "sort_order": 5,
+             "remark": "720×480分辨率（SD）", "extra_data": {"priority": 6, "resolution": "720x480"}},
+        ],
+    },
+    {
+        # 内置解析规则在代码中，此处仅保存用户自定义规则
+        "code": "parse_rule",
+        "name": "标题解析规则",
+        "remark": "自定义标题解析正则：值为正则（需包含命名分组 episode），排序即优先级（内置规则为 10~60），"
+                  "扩展数据可设置 style（bracket/plain/any）与 hint（必须出现的字面量）；与内置规则同编码时覆盖内置规则",
+        "items": [],
+    },
+]
+
+
+def _seed_rows(seed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """将声明式数据中的扩展数据序列化为 JSON 字符串"""
+    rows = []
+    for dict_type in seed:
+        items = [
+            {**item, "extra_data": json.dumps(item["extra_data"]) if "extra_data" in item else None}
+            for item in dict_type.get("items", [])
+        ]
+        rows.append({**dict_type, "items": items})
+    return rows
 
 
 async def init_dict_data(db: AsyncSession) -> None:
     """
     初始化系统字典数据
-    
+
+    只写入从未初始化过的字典类型（连同其字典项），已存在的类型不做任何修改，
+    已有数据库升级后会补齐新增的内置类型，用户删除的内置类型则不会被恢复。
+
     Args:
         db: 数据库会话
     """
-    # 检查是否已有数据
-    existing_types, _ = await crud_system_dict.get_dict_types(db, page=1, page_size=1)
-    if existing_types:
+    created = await crud_system_dict.seed_dict_data(db, seeds=_seed_rows(DICT_SEED))
+    if not created:
         print("⏭️  字典数据已存在，跳过初始化")
         return
-    
-    print("📝 开始初始化字典数据...")
-    
-    # 1. 创建语言字典类型
-    language_type = await crud_system_dict.create_dict_type(
-        db,
-        code="language",
-        name="语言选项",
-        remark="系统支持的语言列表，用于TMDB API查询、前端界面显示等场景",
-        is_active=True,
-    )
-    
-    # 添加语言选项
-    languages = [
-        {"code": "zh-CN", "name": "简体中文", "value": "zh-CN", "sort_order": 1, 
-         "remark": "中国大陆使用的简体中文，TMDB语言代码", 
-         "extra_data": json.dumps({"icon": "🇨🇳"})},
-        {"code": "zh-TW", "name": "繁體中文", "value": "zh-TW", "sort_order": 2,
-         "remark": "台湾地区使用的繁体中文",
-         "extra_data": json.dumps({"icon": "🇹🇼"})},
-        {"code": "en-US", "name": "English (US)", "value": "en-US", "sort_order": 3,
-         "remark": "美式英语，用于英文资源标题匹配",
-         "extra_data": json.dumps({"icon": "🇺🇸"})},
-        {"code": "ja-JP", "name": "日本語", "value": "ja-JP", "sort_order": 4,
-         "remark": "日本语言选项，用于日语内容匹配",
-         "extra_data": json.dumps({"icon": "🇯🇵"})},
-        {"code": "ko-KR", "name": "한국어", "value": "ko-KR", "sort_order": 5,
-         "remark": "韩语选项",
-         "extra_data": json.dumps({"icon": "🇰🇷"})},
-    ]
-    
-    for lang in languages:
-        await crud_system_dict.create_dict_item(
-            db,
-            dict_type_code="language",
-            **lang,
-            is_active=True,
-        )
-    
-    print(f"  ✓ 创建语言字典类型及 {len(languages)} 个选项")
-    
-    # 2. 创建地区字典类型
-    region_type = await crud_system_dict.create_dict_type(
-        db,
-        code="region",
-        name="地区选项",
-        remark="内容地区分类，用于TMDB地区筛选，影响搜索结果和内容推荐",
-        is_active=True,
-    )
-    
-    # 添加地区选项
-    regions = [
-        {"code": "CN", "name": "中国大陆", "value": "CN", "sort_order": 1,
-         "remark": "中国大陆地区",
-         "extra_data": json.dumps({"icon": "🇨🇳"})},
-        {"code": "TW", "name": "台湾", "value": "TW", "sort_order": 2,
-         "remark": "台湾地区",
-         "extra_data": json.dumps({"icon": "🇹🇼"})},
-        {"code": "HK", "name": "香港", "value": "HK", "sort_order": 3,
-         "remark": "香港特别行政区",
-         "extra_data": json.dumps({"icon": "🇭🇰"})},
-        {"code": "US", "name": "美国", "value": "US", "sort_order": 4,
-         "remark": "美国地区",
-         "extra_data": json.dumps({"icon": "🇺🇸"})},
-        {"code": "JP", "name": "日本", "value": "JP", "sort_order": 5,
-         "remark": "日本地区",
-         "extra_data": json.dumps({"icon": "🇯🇵"})},
-        {"code": "KR", "name": "韩国", "value": "KR", "sort_order": 6,
-         "remark": "韩国地区",
-         "extra_data": json.dumps({"icon": "🇰🇷"})},
-    ]
-    
-    for region in regions:
-        await crud_system_dict.create_dict_item(
-            db,
-            dict_type_code="region",
-            **region,
-            is_active=True,
-        )
-    
-    print(f"  ✓ 创建地区字典类型及 {len(regions)} 个选项")
-    
-    # 3. 创建质量标签字典类型
-    quality_type = await crud_system_dict.create_dict_type(
-        db,
-        code="quality",
-        name="质量标签",
-        remark="视频质量分类，用于资源标题解析和质量筛选，优先级：8K > 4K > 1080p > 720p > 480p",
-        is_active=True,
-    )
-    
-    # 添加质量标签选项
-    qualities = [
-        {"code": "8K", "name": "8K超高清", "value": "8K", "sort_order": 1,
-         "remark": "7680×4320分辨率",
-         "extra_data": json.dumps({"priority": 10, "resolution": "7680x4320"})},
-        {"code": "4K", "name": "4K超高清", "value": "4K", "sort_order": 2,
-         "remark": "3840×2160分辨率（UHD）",
-         "extra_data": json.dumps({"priority": 9, "resolution": "3840x2160"})},
-        {"code": "1080p", "name": "1080p全高清", "value": "1080p", "sort_order": 3,
-         "remark": "1920×1080分辨率（FHD）",
-         "extra_data": json.dumps({"priority": 8, "resolution": "1920x1080"})},
-        {"code": "720p", "name": "720p高清", "value": "720p", "sort_order": 4,
-         "remark": "1280×720分辨率（HD）",
-         "extra_data": json.dumps({"priority": 7, "resolution": "1280x720"})},
-        {"code": "480p", "name": "480p标清", "value": "480p", "sort_order": 5,
-         "remark": "720×480分辨率（SD）",
-         "extra_data": json.dumps({"priority": 6, "resolution": "720x480"})},
-    ]
-    
-    for quality in qualities:
-        await crud_system_dict.create_dict_item(
-            db,
-            dict_type_code="quality",
-            **quality,
-            is_active=True,
-        )
-    
-    print(f"  ✓ 创建质量标签字典类型及 {len(qualities)} 个选项")
-    
-    print("✅ 字典数据初始化完成！")
 
+    for dict_type in DICT_SEED:
+        if dict_type["code"] in created:
+            print(f"  ✓ 创建字典类型 {dict_type['name']}（{dict_type['code']}）及 {len(dict_type['items'])} 个选项")
+    print("✅ 字典数据初始化完成！")
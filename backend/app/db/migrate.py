@@ -0,0 +1,174 @@
+"""
+数据库迁移（Alembic）
+启动时先用一次查询判断数据库是否已是最新版本；否则在文件锁保护下执行升级，
+多个 worker 同时启动时只有一个执行迁移，其余等待锁释放后直接通过版本检查
+"""
+
+import asyncio
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+ALEMBIC_INI = BACKEND_DIR / "alembic.ini"
+
+# 引入迁移前由 create_all 建立的数据库视为处于该版本，再从此升级
+BASELINE_REVISION = "0001"
+
+
+def alembic_config() -> Config:
+    """
+    构建 Alembic 配置（与工作目录无关）
+
+    Returns:
+        Alembic 配置对象
+    """
+    cfg = Config(str(ALEMBIC_INI))
+    cfg.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    return cfg
+
+
+@lru_cache(maxsize=1)
+def head_revisions() -> Tuple[str, ...]:
+    """迁移脚本的最新版本（进程内只解析一次）"""
+    return tuple(sorted(ScriptDirectory.from_config(alembic_config()).get_heads()))
+
+
+def _current_revisions(sync_conn) -> Tuple[str, ...]:
+    """读取数据库当前版本（不存在版本表时为空）"""
+    return tuple(sorted(MigrationContext.configure(sync_conn).get_current_heads()))
+
+
+def _upgrade(sync_conn) -> None:
+    """在给定连接上升级到最新版本"""
+    cfg = alembic_config()
+    cfg.attributes["connection"] = sync_conn
+    if not _current_revisions(sync_conn) and inspect(sync_conn).has_table("users"):
+        command.stamp(cfg, BASELINE_REVISION)
+    command.upgrade(cfg, "head")
+
+
+class MigrationLock:
+    """跨进程文件锁"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = None
+
+    def acquire(self) -> None:
+        """阻塞直到获得锁"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(self._fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+
+    def release(self) -> None:
+        """释放锁"""
+        if self._fh is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            else:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._fh.close()
+            self._fh = None
+
+
+def lock_path(engine: AsyncEngine) -> Path:
+    """
+    迁移锁文件路径：SQLite 文件数据库放在数据库文件旁，其他情况放在临时目录
+
+    Args:
+        engine: 异步数据库引擎
+
+    Returns:
+        锁文件路径
+    """
+    database: Optional[str] = engine.url.database
+    if engine.dialect.name == "sqlite" and database and database != ":memory:":
+        return Path(database).resolve().with_name(Path(database).name + ".migrate.lock")
+    return Path(tempfile.gettempdir()) / "queqiao-arr.migrate.lock"
+
+
+async def is_at_head(engine: AsyncEngine) -> bool:
+    """
+    判断数据库是否已是最新版本
+
+    Args:
+        engine: 异步数据库引擎
+
+    Returns:
+        是否无需迁移
+    """
+    async with engine.connect() as conn:
+        current = await conn.run_sync(_current_revisions)
+    return current == head_revisions()
+
+
+async def upgrade_database(engine: AsyncEngine) -> bool:
+    """
+    将数据库升级到最新版本
+
+    已是最新版本时只做一次版本查询；否则获取文件锁后再次检查并执行迁移。
+    尚无版本表但已有数据表的旧数据库先标记为基线版本再升级。
+
+    Args:
+        engine: 异步数据库引擎
+
+    Returns:
+        本次是否执行了迁移
+    """
+    if await is_at_head(engine):
+        return False
+
+    lock = MigrationLock(lock_path(engine))
+    await asyncio.to_thread(lock.acquire)
+    try:
+        async with engine.begin() as conn:
+            if await conn.run_sync(_current_revisions) == head_revisions():
+                return False
+            await conn.run_sync(_upgrade)
+        return True
+    finally:
+        lock.release()
+
+
+async def _main() -> None:
+    """命令行入口：在启动 worker 之前执行迁移"""
+    from app.db.database import engine
+
+    database = engine.url.database
+    if engine.dialect.name == "sqlite" and database and database != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(database)), exist_ok=True)
+    migrated = await upgrade_database(engine)
+    await engine.dispose()
+    print(f"📊 数据库已升级到 {', '.join(head_revisions())}" if migrated else "📊 数据库结构已是最新版本")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
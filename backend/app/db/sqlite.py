@@ -0,0 +1,93 @@
+"""
+SQLite 连接参数（PRAGMA）配置
+每个新连接建立时按 SQLITE_PRAGMA_PROFILE 选择的方案设置 WAL、同步级别、缓存与锁等待，
+使多 worker 共享同一数据库文件时读写互不阻塞，并在写锁冲突时等待而不是立即报 database is locked
+"""
+
+from typing import Any, Dict
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+# 预置方案：off 不修改任何参数；balanced 为 WAL + NORMAL（断电最多丢失最近提交，不会损坏数据库）；
+# durable 为 WAL + FULL（每次提交都落盘）
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    "off": {},
+    "balanced": {"journal_mode": "WAL", "synchronous": "NORMAL", "temp_store": "MEMORY"},
+    "durable": {"journal_mode": "WAL", "synchronous": "FULL", "temp_store": "MEMORY"},
+}
+
+# 启动时报告的参数
+REPORTED_PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "busy_timeout")
+
+
+def build_pragmas(profile: str) -> Dict[str, Any]:
+    """
+    生成指定方案的 PRAGMA 列表
+
+    Args:
+        profile: 方案名称（off / balanced / durable）
+
+    Returns:
+        按执行顺序排列的 PRAGMA 名称与取值
+
+    Raises:
+        ValueError: 方案不存在
+    """
+    if profile not in PRAGMA_PROFILES:
+        raise ValueError(f"未知的 SQLite 配置方案: {profile}（可选: {', '.join(PRAGMA_PROFILES)}）")
+    pragmas = dict(PRAGMA_PROFILES[profile])
+    if pragmas:
+        # 负数表示以 KiB 为单位
+        pragmas["cache_size"] = -max(0, settings.SQLITE_CACHE_SIZE_KB)
+        pragmas["mmap_size"] = max(0, settings.SQLITE_MMAP_SIZE_MB) * 1024 * 1024
+        pragmas["busy_timeout"] = max(0, settings.SQLITE_BUSY_TIMEOUT_MS)
+    return pragmas
+
+
+def install_pragmas(engine: AsyncEngine, profile: str) -> None:
+    """
+    注册连接事件，在每个新建的 SQLite 连接上执行 PRAGMA
+
+    非 SQLite 数据库或方案为 off 时不做任何处理。
+
+    Args:
+        engine: 异步数据库引擎
+        profile: 方案名称
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = build_pragmas(profile)
+    if not pragmas:
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+async def read_pragmas(engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    读取当前连接实际生效的 PRAGMA（用于启动日志）
+
+    Args:
+        engine: 异步数据库引擎
+
+    Returns:
+        PRAGMA 名称与当前值；非 SQLite 数据库返回空字典
+    """
+    if engine.dialect.name != "sqlite":
+        return {}
+    values: Dict[str, Any] = {}
+    async with engine.connect() as conn:
+        for name in REPORTED_PRAGMAS:
+            result = await conn.execute(text(f"PRAGMA {name}"))
+            values[name] = result.scalar()
+    return values
@@ -11,9 +11,17 @@ import os
 from pathlib import Path
 
 from app.core.config import settings
+from app.utils.response import FastJSONResponse
+from app.core.executor import shutdown_crypto_executor
 from app.api.routes import api_router
-from app.db.database import create_tables, AsyncSessionLocal
+from app.db.database import AsyncSessionLocal, engine
+from app.db.migrate import head_revisions, upgrade_database
+from app.db.sqlite import read_pragmas
 from app.db.init_dict_data import init_dict_data
+from app.services.clients import http_client_pool
+from app.services.parser import parser_pool, reload_parse_rules
+from app.services.log_store import log_store
+from app.utils.logger import log_sink
 
 
 @asynccontextmanager
@@ -32,9 +40,21 @@ async def lifespan(app: FastAPI):
     os.makedirs("runtime/data", exist_ok=True)
     print("📁 目录结构创建完成")
     
-    # 创建数据库表
-    await create_tables()
-    print("📊 数据库表创建完成")
+    # 数据库迁移（已是最新版本时仅做一次版本查询）
+    if await upgrade_database(engine):
+        print(f"📊 数据库已升级到 {', '.join(head_revisions())}")
+    else:
+        print("📊 数据库结构已是最新版本")
+
+    # 日志入库（供日志查询接口使用，需在迁移建表之后启动）
+    if settings.LOG_STORE_ENABLED:
+        log_store.start()
+
+    # 报告实际生效的 SQLite 连接参数
+    pragmas = await read_pragmas(engine)
+    if pragmas:
+        summary = ", ".join(f"{name}={value}" for name, value in pragmas.items())
+        print(f"🗄️  SQLite 配置方案 {settings.SQLITE_PRAGMA_PROFILE}: {summary}")
     
     # 初始化字典数据
     async with AsyncSessionLocal() as session:
@@ -42,11 +62,29 @@ async def lifespan(app: FastAPI):
             await init_dict_data(session)
         except Exception as e:
             print(f"⚠️  字典数据初始化失败: {e}")
+        
+        # 编译标题解析规则（内置规则 + 字典中的自定义规则）
+        try:
+            await reload_parse_rules(session)
+        except Exception as e:
+            print(f"⚠️  解析规则加载失败，使用内置规则: {e}")
     
     yield
     
     # 关闭时执行
     print("👋 应用正在关闭...")
+    
+    # 关闭外部服务连接池
+    await http_client_pool.aclose()
+    
+    # 关闭标题解析进程池与加密线程池
+    parser_pool.shutdown()
+    shutdown_crypto_executor()
+    
+    # 写完排队中的文件日志，再将其余日志入库
+    log_sink.flush()
+    if settings.LOG_STORE_ENABLED:
+        await log_store.stop()
 
 
 # 创建FastAPI应用实例
@@ -56,6 +94,7 @@ app = FastAPI(
     version=settings.VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url="/api/docs" if settings.DEBUG else None,
     redoc_url="/api/redoc" if settings.DEBUG else None,
 )
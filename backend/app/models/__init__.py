@@ -1,7 +1,9 @@
 """数据模型定义"""
 
 from app.models.user import User
-from app.models.config import Configuration, ServiceConfig
+from app.models.config import Configuration, ConfigVersion, ServiceConfig
 from app.models.dict import DictType, DictItem
+from app.models.cache import ApiCacheEntry
+from app.models.log import LogRecord
 
-__all__ = ["User", "Configuration", "ServiceConfig", "DictType", "DictItem"]
+__all__ = ["User", "Configuration", "ConfigVersion", "ServiceConfig", "DictType", "DictItem", "ApiCacheEntry", "LogRecord"]
@@ -0,0 +1,21 @@
+"""
+外部接口响应缓存模型
+"""
+
+from sqlalchemy import Column, String, Text, Float
+
+from app.db.database import Base
+
+
+class ApiCacheEntry(Base):
+    """外部接口响应缓存（持久层，跨进程/重启共享）"""
+    
+    __tablename__ = "api_cache"
+    
+    key = Column(String(64), primary_key=True, comment="缓存键（SHA-256）")
+    namespace = Column(String(50), nullable=False, index=True, comment="缓存命名空间，如 tmdb")
+    value = Column(Text, nullable=False, comment="响应数据（JSON）")
+    expires_at = Column(Float, nullable=False, index=True, comment="过期时间（Unix 时间戳）")
+    
+    def __repr__(self) -> str:
+        return f"<ApiCacheEntry(key='{self.key}', namespace='{self.namespace}')>"
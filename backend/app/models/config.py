@@ -3,7 +3,7 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 
 from app.db.database import Base
@@ -42,6 +42,8 @@ class ServiceConfig(Base):
     name = Column(String(100), nullable=False)  # 配置名称
     url = Column(String(255), nullable=False)
     api_key = Column(Text, nullable=True)  # 加密存储
+    api_key_masked = Column(String(255), nullable=True)  # 写入时计算的掩码（前后各4位可见）
+    api_key_length = Column(Integer, nullable=True)  # 明文长度
     username = Column(String(100), nullable=True)
     password = Column(Text, nullable=True)  # 加密存储
     extra_config = Column(Text, nullable=True)  # JSON格式的额外配置
@@ -53,5 +55,24 @@ class ServiceConfig(Base):
         onupdate=func.now()
     )
     
+    __table_args__ = (
+        # 按服务类型查询启用配置（代理配置、配置快照）
+        Index("ix_service_configs_service_name_is_active", "service_name", "is_active"),
+        # 同服务下配置名称查重
+        Index("ix_service_configs_service_name_name", "service_name", "name"),
+    )
+    
     def __repr__(self) -> str:
         return f"<ServiceConfig(id={self.id}, service_name='{self.service_name}', name='{self.name}')>"
+
+
+class ConfigVersion(Base):
+    """配置版本号（单行），配置每次增删改时递增，用于各进程内配置快照的失效判断"""
+    
+    __tablename__ = "config_version"
+    
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return f"<ConfigVersion(version={self.version})>"
@@ -3,7 +3,7 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 
 from app.db.database import Base
@@ -19,6 +19,13 @@ class DictType(Base):
     name = Column(String(100), nullable=False, comment="类型名称")
     remark = Column(Text, nullable=True, comment="备注说明")
     is_active = Column(Boolean, default=True, comment="是否启用")
+    version = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="版本号（类型或其字典项变更时递增，用于选项树缓存失效）"
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), 
@@ -46,7 +53,7 @@ class DictItem(Base):
     code = Column(String(50), nullable=False, index=True, comment="项编码")
     name = Column(String(100), nullable=False, comment="显示名称")
     value = Column(String(200), nullable=False, comment="实际值")
-    sort_order = Column(Integer, default=0, comment="排序（升序）")
+    sort_order = Column(Integer, nullable=False, default=0, server_default="0", comment="排序（升序）")
     parent_id = Column(
         Integer, 
         ForeignKey("dict_items.id", ondelete="CASCADE"), 
@@ -65,6 +72,10 @@ class DictItem(Base):
     
     __table_args__ = (
         UniqueConstraint('dict_type_code', 'code', name='uq_dict_item_type_code'),
+        # 启用选项查询（按类型 + 启用状态筛选，按 sort_order, id 排序）
+        Index('ix_dict_items_type_active_order', 'dict_type_code', 'is_active', 'sort_order', 'id'),
+        # 管理端分页列表（按类型筛选，按 sort_order, id 排序）
+        Index('ix_dict_items_type_order', 'dict_type_code', 'sort_order', 'id'),
     )
     
     def __repr__(self) -> str:
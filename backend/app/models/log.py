@@ -0,0 +1,29 @@
+"""
+日志记录模型
+"""
+
+from sqlalchemy import Column, Float, Index, Integer, String, Text
+
+from app.db.database import Base
+
+
+class LogRecord(Base):
+    """应用日志（由文件日志的后台写入线程同步写入，供日志查询接口按级别与时间筛选）"""
+    
+    __tablename__ = "log_records"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    timestamp = Column(Float, nullable=False, comment="记录时间（Unix 时间戳）")
+    level = Column(String(16), nullable=False, comment="日志级别")
+    module = Column(String(255), nullable=True, comment="来源（模块:函数:行号）")
+    message = Column(Text, nullable=False, comment="日志内容")
+    exception = Column(Text, nullable=True, comment="异常堆栈")
+    
+    # 按时间倒序分页、按级别 + 时间范围筛选均可走索引（主键隐含在索引末尾，用作同一时间的次序）
+    __table_args__ = (
+        Index("ix_log_records_timestamp", "timestamp"),
+        Index("ix_log_records_level_timestamp", "level", "timestamp"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<LogRecord(id={self.id}, level='{self.level}')>"
@@ -0,0 +1,92 @@
+"""
+已认证用户缓存
+按用户名缓存轻量、不可变的用户主体，避免每个鉴权请求都查询数据库
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.utils.ttl_cache import MISSING, TTLCache
+
+
+@dataclass(frozen=True)
+class Principal:
+    """已认证用户主体（不持有 ORM 对象与密码哈希）"""
+
+    id: int
+    username: str
+    email: Optional[str]
+    is_active: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user: Any) -> "Principal":
+        """由 User 模型构建"""
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+        )
+
+
+class UserCache:
+    """短 TTL 的用户主体缓存"""
+
+    def __init__(self, ttl: Optional[float] = None, maxsize: Optional[int] = None):
+        """
+        初始化用户缓存
+
+        Args:
+            ttl: 缓存时间（秒），默认读取 AUTH_USER_CACHE_TTL
+            maxsize: 最大条目数，默认读取 AUTH_CACHE_MAXSIZE
+        """
+        self._cache = TTLCache(
+            maxsize=maxsize or settings.AUTH_CACHE_MAXSIZE,
+            ttl=settings.AUTH_USER_CACHE_TTL if ttl is None else ttl,
+        )
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, username: str) -> Optional[Principal]:
+        """
+        读取用户主体
+
+        Args:
+            username: 用户名
+
+        Returns:
+            用户主体，未命中返回 None
+        """
+        principal = self._cache.get(username)
+        if principal is MISSING:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        """写入用户主体"""
+        self._cache.set(principal.username, principal)
+
+    def invalidate(self, username: str) -> None:
+        """使指定用户的缓存失效（删除、启用状态变更时调用）"""
+        self._cache.pop(username)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取命中统计
+
+        Returns:
+            命中、未命中次数与当前条目数
+        """
+        return {**self._stats, "size": len(self._cache)}
+
+
+# 全局已认证用户缓存
+user_cache = UserCache()
@@ -0,0 +1,215 @@
+"""
+外部接口响应缓存
+一级为进程内 LRU + TTL 缓存，二级为 SQLite 持久缓存（跨 worker、跨重启共享）
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.db import crud_cache
+from app.db.database import AsyncSessionLocal
+from app.utils.logger import logger
+from app.utils.ttl_cache import MISSING, TTLCache
+
+# 不参与缓存键计算的参数（凭据类）
+SECRET_PARAMS = frozenset({"api_key"})
+
+
+class ResponseCache:
+    """两级响应缓存（进程内 LRU + SQLite 持久层）"""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        maxsize: int,
+        persistent: bool = True,
+        purge_interval: Optional[float] = None,
+    ):
+        """
+        初始化响应缓存
+
+        Args:
+            namespace: 命名空间，用于区分不同外部服务的持久缓存
+            ttl: 缓存存活时间（秒）
+            maxsize: 进程内缓存的最大条目数
+            persistent: 是否启用 SQLite 持久层
+            purge_interval: 持久层过期条目的清理间隔（秒），默认读取 CACHE_PURGE_INTERVAL
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.persistent = persistent
+        self.purge_interval = settings.CACHE_PURGE_INTERVAL if purge_interval is None else purge_interval
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._next_purge = 0.0
+        self._stats = {
+            "memory_hits": 0, "persistent_hits": 0, "misses": 0, "writes": 0, "errors": 0, "purged": 0,
+        }
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None, language: Optional[str] = None) -> str:
+        """
+        构建缓存键：(endpoint, 去除凭据的参数, language) 的 SHA-256
+
+        Args:
+            endpoint: 接口路径
+            params: 查询参数（api_key 等凭据不参与计算）
+            language: 语言代码，缺省时从 params 中读取
+
+        Returns:
+            缓存键
+        """
+        params = {k: v for k, v in (params or {}).items() if k not in SECRET_PARAMS}
+        if language is None:
+            language = params.pop("language", None)
+        else:
+            params.pop("language", None)
+        raw = json.dumps([endpoint, params, language], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_local(self, key: str) -> Any:
+        """
+        仅查询进程内缓存（供同步调用路径使用）
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存值，未命中返回 MISSING
+        """
+        value = self.memory.get(key)
+        if value is MISSING:
+            self._stats["misses"] += 1
+        else:
+            self._stats["memory_hits"] += 1
+        return value
+
+    def set_local(self, key: str, value: Any) -> None:
+        """
+        仅写入进程内缓存
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+        """
+        self.memory.set(key, value)
+        self._stats["writes"] += 1
+
+    async def get(self, key: str) -> Any:
+        """
+        依次查询进程内缓存与持久缓存，持久层命中时回填进程内缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存值，未命中返回 MISSING
+        """
+        value = self.memory.get(key)
+        if value is not MISSING:
+            self._stats["memory_hits"] += 1
+            return value
+
+        if self.persistent:
+            now = time.time()
+            try:
+                async with AsyncSessionLocal() as db:
+                    entry = await crud_cache.get_cache_entry(db, key=key, now=now)
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.warning(f"读取持久缓存失败 [{self.namespace}]: {e}")
+                entry = None
+            if entry is not None:
+                value = json.loads(entry.value)
+                self.memory.set(key, value, ttl=entry.expires_at - now)
+                self._stats["persistent_hits"] += 1
+                return value
+
+        self._stats["misses"] += 1
+        return MISSING
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        写入两级缓存
+
+        Args:
+            key: 缓存键
+            value: 可 JSON 序列化的缓存值
+        """
+        self.memory.set(key, value)
+        self._stats["writes"] += 1
+        if not self.persistent:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                await crud_cache.upsert_cache_entry(
+                    db,
+                    key=key,
+                    namespace=self.namespace,
+                    value=json.dumps(value, ensure_ascii=False),
+                    expires_at=time.time() + self.ttl,
+                )
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"写入持久缓存失败 [{self.namespace}]: {e}")
+            return
+        if time.monotonic() >= self._next_purge:
+            await self.purge_expired()
+
+    async def purge_expired(self) -> int:
+        """
+        删除持久层中本命名空间的过期条目（写入时按清理间隔自动调用）
+
+        Returns:
+            删除条数
+        """
+        self._next_purge = time.monotonic() + self.purge_interval
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted = await crud_cache.purge_expired_entries(db, now=time.time(), namespace=self.namespace)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"清理过期持久缓存失败 [{self.namespace}]: {e}")
+            return 0
+        self._stats["purged"] += deleted
+        return deleted
+
+    async def clear(self) -> None:
+        """清空两级缓存"""
+        self.memory.clear()
+        if self.persistent:
+            async with AsyncSessionLocal() as db:
+                await crud_cache.clear_cache_entries(db, namespace=self.namespace)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取命中统计
+
+        Returns:
+            统计信息字典
+        """
+        hits = self._stats["memory_hits"] + self._stats["persistent_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            "namespace": self.namespace,
+            **self._stats,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_size": len(self.memory),
+            "memory_maxsize": self.memory.maxsize,
+        }
+
+    def reset_stats(self) -> None:
+        """重置命中统计"""
+        for k in self._stats:
+            self._stats[k] = 0
+
+
+# TMDB 响应缓存实例
+tmdb_cache = ResponseCache(
+    namespace="tmdb",
+    ttl=settings.TMDB_CACHE_TTL,
+    maxsize=settings.TMDB_CACHE_MAXSIZE,
+)
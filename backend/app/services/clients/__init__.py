@@ -4,6 +4,11 @@
 """
 
 from .base import ExternalServiceClient
+from .pool import HTTPClientPool, http_client_pool
+from .retry import DeadlineExceeded, RetryPolicy, NO_RETRY
+from .ratelimit import TokenBucket, RateLimiterRegistry, rate_limiters
+from .circuit import CircuitBreaker, CircuitBreakerRegistry, circuit_breakers
+from .singleflight import SingleFlight, request_group
 from .sonarr import SonarrClient
 from .prowlarr import ProwlarrClient
 from .tmdb import TMDBClient
@@ -11,6 +16,19 @@ from .factory import make_client
 
 __all__ = [
     "ExternalServiceClient",
+    "HTTPClientPool",
+    "http_client_pool",
+    "DeadlineExceeded",
+    "RetryPolicy",
+    "NO_RETRY",
+    "TokenBucket",
+    "RateLimiterRegistry",
+    "rate_limiters",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "circuit_breakers",
+    "SingleFlight",
+    "request_group",
     "SonarrClient",
     "ProwlarrClient",
     "TMDBClient",
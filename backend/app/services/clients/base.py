@@ -3,9 +3,17 @@
 提供统一的 HTTP 请求封装、超时、代理、Header 管理等功能
 """
 
+import asyncio
+import time
 from typing import Any, Dict, Optional
 import httpx
+from app.core.config import settings
 from app.utils.logger import logger
+from .pool import http_client_pool
+from .circuit import CircuitBreaker
+from .ratelimit import TokenBucket
+from .retry import DeadlineExceeded, RetryPolicy
+from .singleflight import request_group
 
 
 class ExternalServiceClient:
@@ -16,7 +24,10 @@ class ExternalServiceClient:
         base_url: str,
         api_key: Optional[str] = None,
         proxies: Optional[Dict[str, str]] = None,
-        timeout: int = 30,
+        timeout: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """
         初始化外部服务客户端
@@ -25,12 +36,18 @@ class ExternalServiceClient:
             base_url: 服务的基础 URL（例如: http://localhost:8989）
             api_key: API 密钥（如果服务需要）
             proxies: 代理配置字典（例如: {"http://": "...", "https://": "..."}）
-            timeout: 请求超时时间（秒）
+            timeout: 请求超时时间（秒），默认读取 REQUEST_TIMEOUT
+            retry_policy: 异步请求的重试策略，默认按 MAX_RETRIES/RETRY_DELAY/REQUEST_DEADLINE 构建
+            rate_limiter: 出站限流器（同一服务的客户端共享），None 表示不限流
+            circuit_breaker: 熔断器（同一服务的客户端共享），None 表示不熔断
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.proxies = proxies
-        self.timeout = timeout
+        self.timeout = settings.REQUEST_TIMEOUT if timeout is None else timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
 
     def _build_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
@@ -57,6 +74,81 @@ class ExternalServiceClient:
 
         return headers
 
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Any:
+        """
+        解析响应体：优先 JSON，失败时返回文本
+
+        Args:
+            response: httpx 响应对象
+
+        Returns:
+            解析后的响应数据
+        """
+        try:
+            return response.json()
+        except Exception:
+            return response.text
+
+    @staticmethod
+    def _error_result(url: str, exc: Exception) -> tuple[bool, str]:
+        """
+        将请求异常转换为统一的 (False, 错误消息) 结果并记录日志
+
+        Args:
+            url: 请求 URL
+            exc: 捕获到的异常
+
+        Returns:
+            (False, 错误消息)
+        """
+        if isinstance(exc, httpx.TimeoutException):
+            error_msg = f"请求超时: {url}"
+        elif isinstance(exc, httpx.HTTPStatusError):
+            error_msg = f"HTTP 错误 {exc.response.status_code}: {url}"
+        elif isinstance(exc, httpx.RequestError):
+            error_msg = f"网络请求失败: {url}"
+        else:
+            error_msg = f"未知错误: {str(exc)}"
+            logger.error(f"请求 {url} 时发生未知错误: {str(exc)}")
+            return False, error_msg
+        logger.error(f"{error_msg} - {str(exc)}")
+        return False, error_msg
+
+    @staticmethod
+    def _budget_exhausted_result(url: str) -> tuple[bool, str]:
+        """
+        时间预算在请求发出前已耗尽（本地限流排队或重试等待所致）时的结果
+
+        请求未到达上游，不代表上游故障，调用方不应计入熔断失败。
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            (False, 错误消息)
+        """
+        error_msg = f"请求时间预算已耗尽，未发出请求: {url}"
+        logger.warning(error_msg)
+        return False, error_msg
+
+    @staticmethod
+    def _is_upstream_failure(exc: Exception) -> bool:
+        """
+        判断异常是否意味着上游不可用（计入熔断失败次数）
+
+        网络错误、超时与 5xx 视为上游故障；4xx/429 说明上游仍可响应，不计入。
+
+        Args:
+            exc: 请求异常
+
+        Returns:
+            是否为上游故障
+        """
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code >= 500
+        return isinstance(exc, httpx.TransportError)
+
     def _get(
         self,
         path: str,
@@ -91,33 +183,10 @@ class ExternalServiceClient:
             with httpx.Client(**client_kwargs) as client:
                 response = client.get(url, headers=request_headers, params=params)
                 response.raise_for_status()
-
-                # 尝试解析 JSON 响应
-                try:
-                    return True, response.json()
-                except Exception:
-                    # 如果不是 JSON，返回文本
-                    return True, response.text
-
-        except httpx.TimeoutException as e:
-            error_msg = f"请求超时: {url}"
-            logger.error(f"{error_msg} - {str(e)}")
-            return False, error_msg
-
-        except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP 错误 {e.response.status_code}: {url}"
-            logger.error(f"{error_msg} - {str(e)}")
-            return False, error_msg
-
-        except httpx.RequestError as e:
-            error_msg = f"网络请求失败: {url}"
-            logger.error(f"{error_msg} - {str(e)}")
-            return False, error_msg
+                return True, self._parse_response(response)
 
         except Exception as e:
-            error_msg = f"未知错误: {str(e)}"
-            logger.error(f"请求 {url} 时发生未知错误: {str(e)}")
-            return False, error_msg
+            return self._error_result(url, e)
 
     def _post(
         self,
@@ -153,31 +222,199 @@ class ExternalServiceClient:
             with httpx.Client(**client_kwargs) as client:
                 response = client.post(url, headers=request_headers, json=data)
                 response.raise_for_status()
+                return True, self._parse_response(response)
 
-                # 尝试解析 JSON 响应
-                try:
-                    return True, response.json()
-                except Exception:
-                    # 如果不是 JSON，返回文本
-                    return True, response.text
+        except Exception as e:
+            return self._error_result(url, e)
 
-        except httpx.TimeoutException as e:
-            error_msg = f"请求超时: {url}"
-            logger.error(f"{error_msg} - {str(e)}")
-            return False, error_msg
+    async def _arequest(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        coalesce: bool = True,
+    ) -> tuple[bool, Any]:
+        """
+        通过连接池发送异步请求，复用同一 (base_url, proxies) 的长连接
 
-        except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP 错误 {e.response.status_code}: {url}"
-            logger.error(f"{error_msg} - {str(e)}")
-            return False, error_msg
+        无请求体的 GET 请求默认经 single-flight 合并：并发的相同请求只向上游发送一次，
+        所有调用方共享同一结果（调用方不应修改返回的数据）。
 
-        except httpx.RequestError as e:
-            error_msg = f"网络请求失败: {url}"
-            logger.error(f"{error_msg} - {str(e)}")
-            return False, error_msg
+        Args:
+            method: HTTP 方法
+            path: API 路径
+            params: 查询参数
+            data: 请求体数据
+            headers: 额外的请求头
+            idempotent: 是否幂等，None 时按 HTTP 方法及 Idempotency-Key 头判断
+            coalesce: 是否合并并发的相同 GET 请求
 
-        except Exception as e:
-            error_msg = f"未知错误: {str(e)}"
-            logger.error(f"请求 {url} 时发生未知错误: {str(e)}")
+        Returns:
+            (成功标志, 响应数据或错误消息)
+        """
+        url = f"{self.base_url}{path}"
+        request_headers = self._build_headers(headers)
+        if idempotent is None and "Idempotency-Key" in request_headers:
+            idempotent = True
+
+        if coalesce and method.upper() == "GET" and data is None:
+            key = request_group.make_key(method, url, params, request_headers, self.proxies)
+            return await request_group.do(
+                key,
+                lambda: self._asend(method, url, request_headers, params, data, idempotent),
+            )
+        return await self._asend(method, url, request_headers, params, data, idempotent)
+
+    async def _acquire_send_slot(self, deadline_at: Optional[float]) -> Optional[float]:
+        """
+        发送前获取限流令牌，令牌不足时排队等待，最长等待至总时间预算耗尽
+
+        Args:
+            deadline_at: 截止时间点（time.monotonic 基准），None 表示不限时
+
+        Returns:
+            剩余时间预算（秒），不限时返回 None
+
+        Raises:
+            DeadlineExceeded: 排队等待超出预算或预算已耗尽
+        """
+        remaining = None if deadline_at is None else deadline_at - time.monotonic()
+        if self.rate_limiter is not None:
+            try:
+                await self.rate_limiter.acquire(timeout=remaining)
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded("限流排队超出时间预算") from None
+            if deadline_at is not None:
+                remaining = deadline_at - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded("时间预算已耗尽")
+        return remaining
+
+    async def _asend(
+        self,
+        method: str,
+        url: str,
+        request_headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        idempotent: Optional[bool],
+    ) -> tuple[bool, Any]:
+        """
+        发送异步请求并按 retry_policy 重试
+
+        熔断器处于 open 状态时立即返回失败；对瞬时故障（连接失败、超时、429/502/503/504）重试，
+        遵循 Retry-After，且所有尝试的总耗时（含限流排队）不超过策略的时间预算。
+        预算在请求发出前耗尽时直接返回失败，不计入熔断。
+
+        Args:
+            method: HTTP 方法
+            url: 完整请求 URL
+            request_headers: 完整请求头
+            params: 查询参数
+            data: 请求体数据
+            idempotent: 是否幂等
+
+        Returns:
+            (成功标志, 响应数据或错误消息)
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow_request():
+            error_msg = f"服务已熔断，暂停请求: {url}"
+            logger.debug(error_msg)
             return False, error_msg
 
+        policy = self.retry_policy
+        deadline_at = policy.start_deadline()
+        attempt = 0
+
+        while True:
+            try:
+                remaining = await self._acquire_send_slot(deadline_at)
+            except DeadlineExceeded:
+                if breaker is not None:
+                    breaker.release()
+                return self._budget_exhausted_result(url)
+
+            timeout = self.timeout if remaining is None else min(self.timeout, remaining)
+
+            try:
+                client = http_client_pool.get_client(self.base_url, self.proxies)
+                response = await client.request(
+                    method,
+                    url,
+                    headers=request_headers,
+                    params=params,
+                    json=data,
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+                if breaker is not None:
+                    breaker.record_success()
+                return True, self._parse_response(response)
+
+            except asyncio.CancelledError:
+                # 调用方取消（如索引器超时），结果未知，不计入熔断
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            except Exception as e:
+                delay = None
+                if policy.is_retryable(method, e, idempotent):
+                    delay = policy.next_delay(attempt, e, deadline_at)
+                if delay is None:
+                    if breaker is not None:
+                        if self._is_upstream_failure(e):
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
+                    return self._error_result(url, e)
+                logger.warning(f"请求 {url} 失败（{type(e).__name__}），{delay:.2f}s 后进行第 {attempt + 1} 次重试")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _aget(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> tuple[bool, Any]:
+        """
+        发送异步 GET 请求（连接池复用）
+
+        Args:
+            path: API 路径（例如: /api/v3/system/status）
+            params: 查询参数
+            headers: 额外的请求头
+
+        Returns:
+            (成功标志, 响应数据或错误消息)
+        """
+        return await self._arequest("GET", path, params=params, headers=headers)
+
+    async def _apost(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+    ) -> tuple[bool, Any]:
+        """
+        发送异步 POST 请求（连接池复用）
+
+        POST 默认视为非幂等，仅在连接阶段失败时重试；
+        携带 Idempotency-Key 头或显式指定 idempotent=True 时按幂等请求重试。
+
+        Args:
+            path: API 路径
+            data: 请求体数据
+            headers: 额外的请求头
+            idempotent: 是否幂等
+
+        Returns:
+            (成功标志, 响应数据或错误消息)
+        """
+        return await self._arequest("POST", path, data=data, headers=headers, idempotent=idempotent)
@@ -0,0 +1,192 @@
+"""
+外部服务熔断器
+按服务配置维护 closed / open / half_open 三态熔断器，上游持续故障时快速失败
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from app.core.config import settings
+from app.utils.logger import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """三态熔断器"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None,
+    ):
+        """
+        初始化熔断器
+
+        Args:
+            name: 熔断器名称（用于日志）
+            failure_threshold: 连续失败多少次后熔断，默认读取 CIRCUIT_FAILURE_THRESHOLD
+            recovery_timeout: 熔断后多久放行一次探测请求（秒），默认读取 CIRCUIT_RECOVERY_TIMEOUT
+        """
+        self.name = name
+        self.configure(failure_threshold, recovery_timeout)
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def configure(self, failure_threshold: Optional[int] = None, recovery_timeout: Optional[float] = None) -> None:
+        """
+        更新熔断参数
+
+        Args:
+            failure_threshold: 连续失败阈值
+            recovery_timeout: 探测间隔（秒）
+        """
+        self.failure_threshold = max(1, failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD)
+        self.recovery_timeout = recovery_timeout or settings.CIRCUIT_RECOVERY_TIMEOUT
+
+    @property
+    def state(self) -> str:
+        """当前状态（open 状态超过探测间隔后视为 half_open）"""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        判断是否放行请求
+
+        closed 状态全部放行；open 状态全部拒绝；
+        half_open 状态仅放行一个探测请求，其结果决定恢复或继续熔断。
+
+        Returns:
+            是否放行
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probe_in_flight:
+            self._state = HALF_OPEN
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """记录一次成功请求，恢复为 closed"""
+        if self._state != CLOSED:
+            logger.info(f"熔断器 [{self.name}] 探测成功，恢复请求")
+        self._state = CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """请求未到达上游（本地取消或时间预算耗尽）时归还探测名额，不影响状态与失败计数"""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """记录一次失败请求，达到阈值或探测失败时进入 open"""
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                logger.warning(
+                    f"熔断器 [{self.name}] 打开：连续失败 {self._failures} 次，"
+                    f"{self.recovery_timeout}s 后探测"
+                )
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取熔断器状态
+
+        Returns:
+            状态、连续失败次数与参数
+        """
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+        }
+
+
+class CircuitBreakerRegistry:
+    """按服务配置 ID 维护熔断器"""
+
+    def __init__(self):
+        self._breakers: Dict[Hashable, CircuitBreaker] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None,
+    ) -> CircuitBreaker:
+        """
+        获取（或创建）熔断器，并同步最新参数
+
+        Args:
+            key: 熔断器键（通常为服务配置 ID）
+            failure_threshold: 连续失败阈值
+            recovery_timeout: 探测间隔（秒）
+
+        Returns:
+            熔断器
+        """
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(str(key), failure_threshold, recovery_timeout)
+            self._breakers[key] = breaker
+        else:
+            breaker.configure(failure_threshold, recovery_timeout)
+        return breaker
+
+    def from_extra_config(self, key: Hashable, extra: Optional[Dict[str, Any]]) -> CircuitBreaker:
+        """
+        根据 ServiceConfig.extra_config 中的 circuit_failure_threshold / circuit_recovery_timeout 获取熔断器
+
+        Args:
+            key: 熔断器键（通常为服务配置 ID）
+            extra: 解析后的 extra_config
+
+        Returns:
+            熔断器（未配置时使用全局默认参数）
+        """
+        extra = extra or {}
+        try:
+            threshold = int(extra.get("circuit_failure_threshold") or 0) or None
+        except (TypeError, ValueError):
+            threshold = None
+        try:
+            timeout = float(extra.get("circuit_recovery_timeout") or 0) or None
+        except (TypeError, ValueError):
+            timeout = None
+        return self.get(key, threshold, timeout)
+
+    def reset(self, key: Hashable) -> None:
+        """将指定熔断器恢复为 closed"""
+        breaker = self._breakers.get(key)
+        if breaker is not None:
+            breaker.record_success()
+
+    def discard(self, key: Hashable) -> None:
+        """移除熔断器"""
+        self._breakers.pop(key, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取所有熔断器状态
+
+        Returns:
+            以键为索引的熔断器状态
+        """
+        return {str(key): breaker.stats() for key, breaker in self._breakers.items()}
+
+
+# 外部服务熔断器注册表（键为 ServiceConfig.id）
+circuit_breakers = CircuitBreakerRegistry()
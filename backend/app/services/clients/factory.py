@@ -8,6 +8,9 @@ from .base import ExternalServiceClient
 from .sonarr import SonarrClient
 from .prowlarr import ProwlarrClient
 from .tmdb import TMDBClient
+from .circuit import CircuitBreaker
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
 
 
 def make_client(
@@ -15,7 +18,10 @@ def make_client(
     url: Optional[str] = None,
     api_key: Optional[str] = None,
     proxies: Optional[Dict[str, str]] = None,
-    timeout: int = 30,
+    timeout: Optional[int] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
 ) -> ExternalServiceClient:
     """
     根据服务名称创建对应的客户端实例
@@ -26,6 +32,9 @@ def make_client(
         api_key: API 密钥
         proxies: 代理配置
         timeout: 请求超时时间
+        retry_policy: 重试策略
+        rate_limiter: 出站限流器
+        circuit_breaker: 熔断器
 
     Returns:
         对应的客户端实例
@@ -38,17 +47,40 @@ def make_client(
     if service_name == "sonarr":
         if not url or not api_key:
             raise ValueError("Sonarr 客户端需要 url 和 api_key 参数")
-        return SonarrClient(base_url=url, api_key=api_key, proxies=proxies, timeout=timeout)
+        return SonarrClient(
+            base_url=url,
+            api_key=api_key,
+            proxies=proxies,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+        )
 
     elif service_name == "prowlarr":
         if not url or not api_key:
             raise ValueError("Prowlarr 客户端需要 url 和 api_key 参数")
-        return ProwlarrClient(base_url=url, api_key=api_key, proxies=proxies, timeout=timeout)
+        return ProwlarrClient(
+            base_url=url,
+            api_key=api_key,
+            proxies=proxies,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+        )
 
     elif service_name == "tmdb":
         if not api_key:
             raise ValueError("TMDB 客户端需要 api_key 参数")
-        return TMDBClient(api_key=api_key, proxies=proxies, timeout=timeout)
+        return TMDBClient(
+            api_key=api_key,
+            proxies=proxies,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+        )
 
     else:
         raise ValueError(f"未知的服务名称: {service_name}. 支持的服务: sonarr, prowlarr, tmdb")
@@ -0,0 +1,140 @@
+"""
+外部服务 HTTP 连接池
+按 (base_url, proxies) 维度复用长连接的 httpx.AsyncClient，由应用生命周期统一关闭
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.utils.logger import logger
+
+PoolKey = Tuple[str, Optional[Tuple[Tuple[str, str], ...]]]
+
+
+class HTTPClientPool:
+    """异步 HTTP 客户端连接池"""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+    ):
+        """
+        初始化连接池
+
+        Args:
+            max_connections: 单个客户端的最大连接数，默认读取配置
+            max_keepalive_connections: 单个客户端的最大空闲长连接数，默认读取配置
+            keepalive_expiry: 空闲长连接的保活时间（秒），默认读取配置
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections or settings.HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=max_keepalive_connections or settings.HTTP_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=keepalive_expiry or settings.HTTP_POOL_KEEPALIVE_EXPIRY,
+        )
+        self._clients: Dict[PoolKey, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 绑定在旧事件循环上、尚未关闭的客户端，以及在当前事件循环中释放它们的任务
+        self._stale: List[httpx.AsyncClient] = []
+        self._releasing: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def make_key(base_url: str, proxies: Optional[Dict[str, str]] = None) -> PoolKey:
+        """
+        构建连接池键
+
+        Args:
+            base_url: 服务基础 URL
+            proxies: 代理配置字典
+
+        Returns:
+            可哈希的连接池键
+        """
+        proxy_key = tuple(sorted(proxies.items())) if proxies else None
+        return base_url.rstrip("/"), proxy_key
+
+    def get_client(self, base_url: str, proxies: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+        """
+        获取（或创建）指定 base_url + 代理 组合对应的客户端
+
+        Args:
+            base_url: 服务基础 URL
+            proxies: 代理配置字典
+
+        Returns:
+            复用长连接的 httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 连接绑定在创建它的事件循环上，事件循环变化后旧客户端不可再用，需关闭而不是直接丢弃
+            self._retire(self._loop)
+            self._loop = loop
+
+        key = self.make_key(base_url, proxies)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client_kwargs = {
+                "limits": self.limits,
+                "follow_redirects": True,
+            }
+            if proxies:
+                client_kwargs["proxies"] = proxies
+            client = httpx.AsyncClient(**client_kwargs)
+            self._clients[key] = client
+        return client
+
+    def _retire(self, old_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        关闭绑定在旧事件循环上的客户端
+
+        旧事件循环仍在（其他线程中）运行时交由它关闭；否则在当前事件循环中尽力释放，
+        无法释放的留待 aclose 再次尝试。
+
+        Args:
+            old_loop: 客户端所属的事件循环
+        """
+        clients = list(self._clients.values())
+        self._clients = {}
+        for client in clients:
+            if old_loop is not None and old_loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), old_loop)
+            else:
+                self._stale.append(client)
+        if self._stale:
+            task = asyncio.get_running_loop().create_task(self._release_stale())
+            self._releasing.add(task)
+            task.add_done_callback(self._releasing.discard)
+
+    async def _release_stale(self) -> None:
+        """尽力关闭旧事件循环遗留的客户端（其上的长连接若随事件循环一起关闭则只能交由 GC 回收）"""
+        stale, self._stale = self._stale, []
+        for client in stale:
+            try:
+                await client.aclose()
+            except RuntimeError as e:
+                logger.debug(f"关闭旧事件循环上的 HTTP 客户端失败: {e}")
+
+    @property
+    def size(self) -> int:
+        """当前持有的客户端数量"""
+        return len(self._clients)
+
+    async def aclose(self) -> None:
+        """关闭所有客户端（含旧事件循环遗留的客户端）并释放连接"""
+        clients = list(self._clients.values())
+        self._clients = {}
+        for client in clients:
+            await client.aclose()
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._releasing if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self._release_stale()
+
+
+# 全局连接池实例
+http_client_pool = HTTPClientPool()
@@ -3,8 +3,13 @@ Prowlarr API 客户端
 提供对 Prowlarr 服务的访问接口
 """
 
-from typing import Dict, Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from app.core.config import settings
 from .base import ExternalServiceClient
+from .circuit import CircuitBreaker
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
 
 
 class ProwlarrClient(ExternalServiceClient):
@@ -15,7 +20,10 @@ class ProwlarrClient(ExternalServiceClient):
         base_url: str,
         api_key: str,
         proxies: Optional[Dict[str, str]] = None,
-        timeout: int = 30,
+        timeout: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """
         初始化 Prowlarr 客户端
@@ -25,8 +33,11 @@ class ProwlarrClient(ExternalServiceClient):
             api_key: Prowlarr API 密钥
             proxies: 代理配置
             timeout: 请求超时时间
+            retry_policy: 重试策略
+            rate_limiter: 出站限流器
+            circuit_breaker: 熔断器
         """
-        super().__init__(base_url, api_key, proxies, timeout)
+        super().__init__(base_url, api_key, proxies, timeout, retry_policy, rate_limiter, circuit_breaker)
 
     def check_status(self) -> tuple[bool, str]:
         """
@@ -36,7 +47,30 @@ class ProwlarrClient(ExternalServiceClient):
             (是否成功, 状态描述信息)
         """
         ok, result = self._get("/api/v1/system/status")
+        return self._status_result(ok, result)
 
+    async def acheck_status(self) -> tuple[bool, str]:
+        """
+        异步检查 Prowlarr 服务状态（连接池复用）
+
+        Returns:
+            (是否成功, 状态描述信息)
+        """
+        ok, result = await self._aget("/api/v1/system/status")
+        return self._status_result(ok, result)
+
+    @staticmethod
+    def _status_result(ok: bool, result: Any) -> tuple[bool, str]:
+        """
+        将状态接口的响应转换为 (是否成功, 状态描述信息)
+
+        Args:
+            ok: 请求是否成功
+            result: 响应数据或错误消息
+
+        Returns:
+            (是否成功, 状态描述信息)
+        """
         if ok:
             # 解析响应，提取有用信息
             if isinstance(result, dict):
@@ -46,3 +80,119 @@ class ProwlarrClient(ExternalServiceClient):
         else:
             return False, f"Prowlarr 连接失败: {result}"
 
+    async def aget_indexers(self, enabled_only: bool = True) -> tuple[bool, Any]:
+        """
+        获取 Prowlarr 中配置的索引器列表
+
+        Args:
+            enabled_only: 是否仅返回已启用的索引器
+
+        Returns:
+            (是否成功, 索引器列表或错误消息)
+        """
+        ok, result = await self._aget("/api/v1/indexer")
+        if not ok or not isinstance(result, list):
+            return ok, result
+        if enabled_only:
+            result = [item for item in result if item.get("enable", True)]
+        return True, result
+
+    async def _asearch_indexer(
+        self,
+        indexer_id: int,
+        params: Dict[str, Any],
+        timeout: float,
+    ) -> tuple[int, bool, Any]:
+        """
+        在单个索引器上执行搜索，超时即放弃
+
+        不经 single-flight 合并（合并的请求被 shield 保护，取消调用方不会中止上游请求），
+        超时或被取消时底层 HTTP 请求随之中止，立即归还连接与限流令牌。
+
+        Args:
+            indexer_id: 索引器 ID
+            params: 公共查询参数
+            timeout: 该索引器的超时时间（秒）
+
+        Returns:
+            (索引器ID, 是否成功, 结果列表或错误消息)
+        """
+        try:
+            ok, result = await asyncio.wait_for(
+                self._arequest(
+                    "GET", "/api/v1/search", params={**params, "indexerIds": [indexer_id]}, coalesce=False
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            return indexer_id, False, f"索引器 {indexer_id} 搜索超时（{timeout}s）"
+        if ok and not isinstance(result, list):
+            return indexer_id, False, f"索引器 {indexer_id} 返回了无法识别的结果"
+        return indexer_id, ok, result
+
+    async def asearch(
+        self,
+        query: str,
+        indexer_ids: Optional[Sequence[int]] = None,
+        categories: Optional[Sequence[int]] = None,
+        search_type: str = "search",
+        limit: Optional[int] = None,
+        indexer_timeout: Optional[float] = None,
+    ) -> AsyncIterator[tuple[int, bool, Any]]:
+        """
+        并发在多个索引器上搜索，按索引器响应先后流式产出结果
+
+        每个索引器独立请求并受 indexer_timeout 约束，快的索引器结果立即交给下游，
+        慢的索引器不会阻塞整体响应。跨索引器按 guid 去重。
+        调用方提前结束迭代（或取消）时，未完成的索引器请求会被取消，并在迭代结束前中止。
+
+        Args:
+            query: 搜索关键词
+            indexer_ids: 索引器 ID 列表，None 时使用全部已启用的索引器
+            categories: Newznab 分类 ID 列表（如 5000 表示 TV）
+            search_type: 搜索类型（search / tvsearch 等）
+            limit: 每个索引器返回的最大条数
+            indexer_timeout: 单个索引器的超时时间（秒），默认读取 PROWLARR_INDEXER_TIMEOUT
+
+        Yields:
+            (索引器ID, 是否成功, 去重后的结果列表或错误消息)
+        """
+        if indexer_ids is None:
+            ok, indexers = await self.aget_indexers()
+            if not ok:
+                yield 0, False, f"获取索引器列表失败: {indexers}"
+                return
+            indexer_ids = [item["id"] for item in indexers if "id" in item]
+
+        params: Dict[str, Any] = {"query": query, "type": search_type}
+        if categories:
+            params["categories"] = list(categories)
+        if limit:
+            params["limit"] = limit
+        timeout = indexer_timeout or settings.PROWLARR_INDEXER_TIMEOUT
+
+        tasks: List[asyncio.Task] = [
+            asyncio.ensure_future(self._asearch_indexer(indexer_id, params, timeout))
+            for indexer_id in indexer_ids
+        ]
+        seen_guids = set()
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indexer_id, ok, result = await next_done
+                if ok:
+                    releases = []
+                    for release in result:
+                        guid = release.get("guid") or release.get("downloadUrl") or release.get("title")
+                        if guid in seen_guids:
+                            continue
+                        seen_guids.add(guid)
+                        releases.append(release)
+                    result = releases
+                yield indexer_id, ok, result
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            # 等待取消完成，确保退出时上游请求已中止
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,165 @@
+"""
+外部服务出站限流
+基于令牌桶的异步限流器：令牌不足时排队等待而不是直接失败（可限定最长等待时间）
+"""
+
+import asyncio
+import math
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class TokenBucket:
+    """异步令牌桶限流器（先到先得）"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 令牌生成速率（每秒请求数）
+            burst: 桶容量（允许的突发请求数），默认为 ceil(rate)
+        """
+        self._tokens = 0.0
+        self.configure(rate, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._waiting = 0
+
+    def configure(self, rate: float, burst: Optional[int] = None) -> None:
+        """
+        更新限流参数（已有令牌保留，超出新容量的部分截断）
+
+        Args:
+            rate: 令牌生成速率（每秒请求数）
+            burst: 桶容量
+        """
+        if rate <= 0:
+            raise ValueError("限流速率必须大于 0")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst) if burst else math.ceil(rate))
+        self._tokens = min(self._tokens, float(self.burst))
+
+    def _refill(self) -> None:
+        """按流逝时间补充令牌"""
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        获取一个令牌，令牌不足时排队等待
+
+        按到达顺序预占令牌（令牌数可为负，表示已被排队者预订），再等待至该令牌生成；
+        预计等待超出 timeout 时立即放弃且不占用令牌，等待中被取消时归还预占的令牌。
+
+        Args:
+            timeout: 最长等待时间（秒），None 表示不限
+
+        Returns:
+            本次排队等待的秒数
+
+        Raises:
+            asyncio.TimeoutError: 无法在 timeout 内获得令牌
+        """
+        self._refill()
+        wait = max(0.0, (1 - self._tokens) / self.rate)
+        if timeout is not None and wait > timeout:
+            raise asyncio.TimeoutError
+        self._tokens -= 1
+        if wait > 0:
+            self._waiting += 1
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
+            finally:
+                self._waiting -= 1
+        return wait
+
+    @property
+    def queue_depth(self) -> int:
+        """当前排队等待令牌的请求数"""
+        return self._waiting
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取限流器状态
+
+        Returns:
+            速率、容量、剩余令牌与排队深度
+        """
+        self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(max(0.0, self._tokens), 2),
+            "queue_depth": self.queue_depth,
+        }
+
+
+class RateLimiterRegistry:
+    """按服务配置维护限流器，保证同一服务的所有请求共享同一个令牌桶"""
+
+    def __init__(self):
+        self._limiters: Dict[Hashable, TokenBucket] = {}
+
+    def get(self, key: Hashable, rate: float, burst: Optional[int] = None) -> TokenBucket:
+        """
+        获取（或创建）限流器，参数变化时原地更新
+
+        Args:
+            key: 限流器键（通常为服务配置 ID）
+            rate: 每秒请求数
+            burst: 桶容量
+
+        Returns:
+            令牌桶限流器
+        """
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = TokenBucket(rate, burst)
+            self._limiters[key] = limiter
+        elif limiter.rate != rate or (burst and limiter.burst != burst):
+            limiter.configure(rate, burst)
+        return limiter
+
+    def from_extra_config(self, key: Hashable, extra: Optional[Dict[str, Any]]) -> Optional[TokenBucket]:
+        """
+        根据 ServiceConfig.extra_config 中的 rate_limit / rate_burst 获取限流器
+
+        Args:
+            key: 限流器键（通常为服务配置 ID）
+            extra: 解析后的 extra_config
+
+        Returns:
+            令牌桶限流器；未配置或配置无效时返回 None（并移除旧限流器）
+        """
+        try:
+            rate = float((extra or {}).get("rate_limit") or 0)
+            burst = (extra or {}).get("rate_burst")
+            burst = int(burst) if burst else None
+        except (TypeError, ValueError):
+            rate = 0
+        if rate <= 0:
+            self._limiters.pop(key, None)
+            return None
+        return self.get(key, rate, burst)
+
+    def discard(self, key: Hashable) -> None:
+        """移除限流器"""
+        self._limiters.pop(key, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取所有限流器状态
+
+        Returns:
+            以键为索引的限流器状态
+        """
+        return {str(key): limiter.stats() for key, limiter in self._limiters.items()}
+
+
+# 外部服务限流器注册表（键为 ServiceConfig.id）
+rate_limiters = RateLimiterRegistry()
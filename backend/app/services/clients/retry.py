@@ -0,0 +1,171 @@
+"""
+外部服务请求重试策略
+提供指数退避 + 抖动、Retry-After 解析、幂等性判断与总时间预算（deadline）控制
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Mapping, Optional
+
+import httpx
+
+from app.core.config import settings
+
+# 幂等的 HTTP 方法：重复发送不会产生额外副作用
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 可重试的 HTTP 状态码：限流与网关/上游暂时不可用
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+# 请求尚未发出即失败的异常：即便非幂等请求也可以安全重试
+CONNECT_PHASE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class DeadlineExceeded(Exception):
+    """时间预算在请求发出前已耗尽（本地限流排队或重试等待所致，请求未到达上游，不代表上游故障）"""
+
+
+class RetryPolicy:
+    """重试策略"""
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        deadline: Optional[float] = None,
+        jitter: bool = True,
+    ):
+        """
+        初始化重试策略
+
+        Args:
+            max_retries: 最大重试次数（不含首次请求），默认读取 MAX_RETRIES
+            base_delay: 退避基础延迟（秒），默认读取 RETRY_DELAY
+            max_delay: 单次退避的延迟上限（秒），默认读取 RETRY_MAX_DELAY
+            deadline: 含重试在内的总时间预算（秒），默认读取 REQUEST_DEADLINE；<=0 表示不限
+            jitter: 是否启用全抖动（full jitter）
+        """
+        self.max_retries = settings.MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = settings.RETRY_DELAY if base_delay is None else base_delay
+        self.max_delay = settings.RETRY_MAX_DELAY if max_delay is None else max_delay
+        deadline = settings.REQUEST_DEADLINE if deadline is None else deadline
+        self.deadline = deadline if deadline > 0 else None
+        self.jitter = jitter
+
+    def start_deadline(self) -> Optional[float]:
+        """
+        计算本次调用的截止时间点（time.monotonic 基准）
+
+        Returns:
+            截止时间点，不限时返回 None
+        """
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+    def backoff(self, attempt: int) -> float:
+        """
+        计算第 attempt 次重试前的退避时间
+
+        Args:
+            attempt: 重试序号（从 0 开始）
+
+        Returns:
+            退避时间（秒）
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
+
+    @staticmethod
+    def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """
+        解析 Retry-After 响应头（支持秒数与 HTTP 日期两种格式）
+
+        Args:
+            headers: 响应头
+
+        Returns:
+            需等待的秒数，无法解析时返回 None
+        """
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def is_retryable(self, method: str, exc: Exception, idempotent: Optional[bool] = None) -> bool:
+        """
+        判断请求异常是否可以重试
+
+        非幂等请求（如未携带 Idempotency-Key 的 POST）仅在连接阶段失败时重试，
+        因为此时请求必然未被上游处理。
+
+        Args:
+            method: HTTP 方法
+            exc: 请求异常
+            idempotent: 显式指定是否幂等，None 时按 HTTP 方法判断
+
+        Returns:
+            是否可以重试
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if isinstance(exc, CONNECT_PHASE_ERRORS):
+            return True
+        if not idempotent:
+            return False
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(exc, (httpx.TimeoutException, httpx.TransportError))
+
+    def next_delay(
+        self,
+        attempt: int,
+        exc: Exception,
+        deadline_at: Optional[float],
+    ) -> Optional[float]:
+        """
+        计算下一次重试前的等待时间
+
+        优先遵循 Retry-After；Retry-After 超过单次延迟上限 max_delay（不限总时间预算时也不例外），
+        或等待后已超出总时间预算，则放弃重试。
+
+        Args:
+            attempt: 重试序号（从 0 开始）
+            exc: 本次请求异常
+            deadline_at: 截止时间点（time.monotonic 基准）
+
+        Returns:
+            等待秒数；不应再重试时返回 None
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        delay: Optional[float] = None
+        if isinstance(exc, httpx.HTTPStatusError):
+            delay = self.parse_retry_after(exc.response.headers)
+            if delay is not None and delay > self.max_delay:
+                return None
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+            return None
+        return delay
+
+
+# 不重试、不限时的策略（用于连接测试等交互式场景）
+NO_RETRY = RetryPolicy(max_retries=0, deadline=0)
@@ -0,0 +1,84 @@
+"""
+请求合并（single-flight）
+同一时刻对相同请求键的并发调用只执行一次，所有调用方共享同一结果
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """并发请求合并器"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._stats = {"executed": 0, "shared": 0}
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        *extra: Any,
+    ) -> str:
+        """
+        构建请求键
+
+        Args:
+            method: HTTP 方法
+            url: 完整请求 URL
+            params: 查询参数
+            extra: 其他影响响应的因素（如凭据、代理）
+
+        Returns:
+            请求键
+        """
+        return json.dumps([method.upper(), url, params or {}, *extra], sort_keys=True, default=str)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行（或加入正在执行的）调用
+
+        首个调用方以独立任务执行 func，后续相同 key 的调用方等待同一任务；
+        某个调用方被取消不会影响任务本身及其他调用方。
+
+        Args:
+            key: 请求键
+            func: 无参协程工厂
+
+        Returns:
+            func 的执行结果（所有调用方共享同一对象，调用方不应修改）
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            self._stats["executed"] += 1
+            future.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            self._stats["shared"] += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """任务结束后移除 in-flight 记录"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    @property
+    def inflight(self) -> int:
+        """当前执行中的请求数"""
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取合并统计
+
+        Returns:
+            实际执行次数、被合并的调用次数与当前执行中的请求数
+        """
+        return {**self._stats, "inflight": self.inflight}
+
+
+# 外部服务请求合并器实例
+request_group = SingleFlight()
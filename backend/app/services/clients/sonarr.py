@@ -3,8 +3,11 @@ Sonarr API 客户端
 提供对 Sonarr 服务的访问接口
 """
 
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from .base import ExternalServiceClient
+from .circuit import CircuitBreaker
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
 
 
 class SonarrClient(ExternalServiceClient):
@@ -15,7 +18,10 @@ class SonarrClient(ExternalServiceClient):
         base_url: str,
         api_key: str,
         proxies: Optional[Dict[str, str]] = None,
-        timeout: int = 30,
+        timeout: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """
         初始化 Sonarr 客户端
@@ -25,8 +31,11 @@ class SonarrClient(ExternalServiceClient):
             api_key: Sonarr API 密钥
             proxies: 代理配置
             timeout: 请求超时时间
+            retry_policy: 重试策略
+            rate_limiter: 出站限流器
+            circuit_breaker: 熔断器
         """
-        super().__init__(base_url, api_key, proxies, timeout)
+        super().__init__(base_url, api_key, proxies, timeout, retry_policy, rate_limiter, circuit_breaker)
 
     def check_status(self) -> tuple[bool, str]:
         """
@@ -36,7 +45,30 @@ class SonarrClient(ExternalServiceClient):
             (是否成功, 状态描述信息)
         """
         ok, result = self._get("/api/v3/system/status")
+        return self._status_result(ok, result)
 
+    async def acheck_status(self) -> tuple[bool, str]:
+        """
+        异步检查 Sonarr 服务状态（连接池复用）
+
+        Returns:
+            (是否成功, 状态描述信息)
+        """
+        ok, result = await self._aget("/api/v3/system/status")
+        return self._status_result(ok, result)
+
+    @staticmethod
+    def _status_result(ok: bool, result: Any) -> tuple[bool, str]:
+        """
+        将状态接口的响应转换为 (是否成功, 状态描述信息)
+
+        Args:
+            ok: 请求是否成功
+            result: 响应数据或错误消息
+
+        Returns:
+            (是否成功, 状态描述信息)
+        """
         if ok:
             # 解析响应，提取有用信息
             if isinstance(result, dict):
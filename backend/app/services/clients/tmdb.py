@@ -4,7 +4,12 @@ TMDB API 客户端
 """
 
 from typing import Dict, Optional, Any
+from app.services.cache import ResponseCache, tmdb_cache
+from app.utils.ttl_cache import MISSING
 from .base import ExternalServiceClient
+from .circuit import CircuitBreaker
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
 
 
 class TMDBClient(ExternalServiceClient):
@@ -14,7 +19,11 @@ class TMDBClient(ExternalServiceClient):
         self,
         api_key: str,
         proxies: Optional[Dict[str, str]] = None,
-        timeout: int = 30,
+        timeout: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[ResponseCache] = tmdb_cache,
     ):
         """
         初始化 TMDB 客户端
@@ -23,10 +32,15 @@ class TMDBClient(ExternalServiceClient):
             api_key: TMDB API 密钥
             proxies: 代理配置
             timeout: 请求超时时间
+            retry_policy: 重试策略
+            rate_limiter: 出站限流器
+            circuit_breaker: 熔断器
+            cache: 响应缓存，传 None 禁用缓存
         """
         # TMDB 使用固定的 API 地址
         base_url = "https://api.themoviedb.org/3"
-        super().__init__(base_url, api_key, proxies, timeout)
+        super().__init__(base_url, api_key, proxies, timeout, retry_policy, rate_limiter, circuit_breaker)
+        self.cache = cache
 
     def _build_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
@@ -65,6 +79,50 @@ class TMDBClient(ExternalServiceClient):
         params["api_key"] = self.api_key
         return params
 
+    def _cached_get(self, path: str, params: Dict[str, Any]) -> tuple[bool, Any]:
+        """
+        带缓存的同步 GET（仅使用进程内缓存层）
+
+        Args:
+            path: API 路径
+            params: 查询参数
+
+        Returns:
+            (是否成功, 响应数据或错误消息)
+        """
+        if self.cache is None:
+            return self._get(path, params=params)
+        key = self.cache.make_key(path, params)
+        cached = self.cache.get_local(key)
+        if cached is not MISSING:
+            return True, cached
+        ok, result = self._get(path, params=params)
+        if ok:
+            self.cache.set_local(key, result)
+        return ok, result
+
+    async def _acached_get(self, path: str, params: Dict[str, Any]) -> tuple[bool, Any]:
+        """
+        带两级缓存的异步 GET，仅缓存成功响应
+
+        Args:
+            path: API 路径
+            params: 查询参数
+
+        Returns:
+            (是否成功, 响应数据或错误消息)
+        """
+        if self.cache is None:
+            return await self._aget(path, params=params)
+        key = self.cache.make_key(path, params)
+        cached = await self.cache.get(key)
+        if cached is not MISSING:
+            return True, cached
+        ok, result = await self._aget(path, params=params)
+        if ok:
+            await self.cache.set(key, result)
+        return ok, result
+
     def search_tv(self, query: str, language: str = "zh-CN") -> tuple[bool, Any]:
         """
         搜索电视剧
@@ -76,13 +134,30 @@ class TMDBClient(ExternalServiceClient):
         Returns:
             (是否成功, 搜索结果或错误消息)
 
-        注意：当前为占位实现，待 B-04 任务时完善
+        结果按 TMDB_CACHE_TTL 缓存。注意：当前为占位实现，待 B-04 任务时完善
+        """
+        params = self._add_api_key_to_params({
+            "query": query,
+            "language": language,
+        })
+        return self._cached_get("/search/tv", params)
+
+    async def asearch_tv(self, query: str, language: str = "zh-CN") -> tuple[bool, Any]:
+        """
+        异步搜索电视剧（连接池复用）
+
+        Args:
+            query: 搜索关键词
+            language: 语言代码（默认: zh-CN）
+
+        Returns:
+            (是否成功, 搜索结果或错误消息)
         """
         params = self._add_api_key_to_params({
             "query": query,
             "language": language,
         })
-        return self._get("/search/tv", params=params)
+        return await self._acached_get("/search/tv", params)
 
     def get_alternative_titles(self, tv_id: int) -> tuple[bool, Any]:
         """
@@ -94,10 +169,23 @@ class TMDBClient(ExternalServiceClient):
         Returns:
             (是否成功, 别名列表或错误消息)
 
-        注意：当前为占位实现，待 B-04 任务时完善
+        结果按 TMDB_CACHE_TTL 缓存。注意：当前为占位实现，待 B-04 任务时完善
+        """
+        params = self._add_api_key_to_params()
+        return self._cached_get(f"/tv/{tv_id}/alternative_titles", params)
+
+    async def aget_alternative_titles(self, tv_id: int) -> tuple[bool, Any]:
+        """
+        异步获取电视剧的别名/替代标题（连接池复用）
+
+        Args:
+            tv_id: TMDB 电视剧 ID
+
+        Returns:
+            (是否成功, 别名列表或错误消息)
         """
         params = self._add_api_key_to_params()
-        return self._get(f"/tv/{tv_id}/alternative_titles", params=params)
+        return await self._acached_get(f"/tv/{tv_id}/alternative_titles", params)
 
     def check_status(self) -> tuple[bool, str]:
         """
@@ -110,7 +198,31 @@ class TMDBClient(ExternalServiceClient):
         # 使用 configuration API 来检查连接状态
         params = self._add_api_key_to_params()
         ok, result = self._get("/configuration", params=params)
+        return self._status_result(ok, result)
 
+    async def acheck_status(self) -> tuple[bool, str]:
+        """
+        异步检查 TMDB 服务状态（连接池复用）
+
+        Returns:
+            (是否成功, 状态描述信息)
+        """
+        params = self._add_api_key_to_params()
+        ok, result = await self._aget("/configuration", params=params)
+        return self._status_result(ok, result)
+
+    @staticmethod
+    def _status_result(ok: bool, result: Any) -> tuple[bool, str]:
+        """
+        将状态接口的响应转换为 (是否成功, 状态描述信息)
+
+        Args:
+            ok: 请求是否成功
+            result: 响应数据或错误消息
+
+        Returns:
+            (是否成功, 状态描述信息)
+        """
         if ok:
             return True, "TMDB 连接成功"
         else:
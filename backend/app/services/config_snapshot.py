@@ -0,0 +1,165 @@
+"""
+配置快照缓存
+将所有启用的 ServiceConfig 与 Configuration 读取为不可变快照（密钥只解密一次），
+通过数据库中的配置版本号判断失效：每次读取只需一次版本号查询，多个 worker 各自按需刷新
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import crud_config
+from app.utils.config_helpers import adecrypt_if_present, build_proxy_config, parse_extra_config
+from app.utils.logger import logger
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class ServiceSnapshot:
+    """单个服务配置的只读视图（api_key / password 为明文）"""
+
+    id: int
+    service_name: str
+    service_type: str
+    name: str
+    url: str
+    api_key: Optional[str] = None
+    username: Optional[str] = None
+    password: Optional[str] = None
+    extra: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """某一配置版本下所有启用配置的只读视图"""
+
+    version: int
+    services: Tuple[ServiceSnapshot, ...] = ()
+    kv: Mapping[str, Optional[str]] = field(default_factory=lambda: _EMPTY)
+    proxy: Optional[Mapping[str, str]] = None
+
+    def get_services(self, service_name: str) -> Tuple[ServiceSnapshot, ...]:
+        """按服务名获取启用的服务配置（按 ID 升序）"""
+        return tuple(s for s in self.services if s.service_name == service_name)
+
+    def get_service(self, config_id: int) -> Optional[ServiceSnapshot]:
+        """按 ID 获取启用的服务配置"""
+        return next((s for s in self.services if s.id == config_id), None)
+
+    def get_kv(self, key: str) -> Optional[str]:
+        """获取启用的 KV 配置值（已解密）"""
+        return self.kv.get(key)
+
+
+async def load_snapshot(db: AsyncSession, version: int) -> ConfigSnapshot:
+    """
+    从数据库读取启用配置并构建快照
+
+    Args:
+        db: 数据库会话
+        version: 读取前查得的配置版本号
+
+    Returns:
+        配置快照
+    """
+    services = []
+    for svc in sorted(await crud_config.get_service_configs(db, is_active=True), key=lambda s: s.id):
+        extra = parse_extra_config(svc.extra_config)
+        services.append(
+            ServiceSnapshot(
+                id=svc.id,
+                service_name=svc.service_name,
+                service_type=svc.service_type,
+                name=svc.name,
+                url=svc.url,
+                api_key=await adecrypt_if_present(svc.api_key),
+                username=svc.username,
+                password=await adecrypt_if_present(svc.password),
+                extra=MappingProxyType(extra) if isinstance(extra, dict) else _EMPTY,
+            )
+        )
+
+    kv: Dict[str, Optional[str]] = {}
+    for item in await crud_config.get_configurations(db, is_active=True):
+        kv[item.key] = await adecrypt_if_present(item.value) if item.is_encrypted else item.value
+
+    proxy = next(
+        (build_proxy_config(s.url, dict(s.extra)) for s in services if s.service_name == "proxy"),
+        None,
+    )
+    return ConfigSnapshot(
+        version=version,
+        services=tuple(services),
+        kv=MappingProxyType(kv),
+        proxy=MappingProxyType(proxy) if proxy else None,
+    )
+
+
+class ConfigSnapshotCache:
+    """按配置版本号失效的进程内配置快照"""
+
+    def __init__(self):
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._lock = asyncio.Lock()
+        self._stats = {"hits": 0, "reloads": 0}
+
+    async def get(self, db: AsyncSession) -> ConfigSnapshot:
+        """
+        获取当前配置快照：版本号未变时直接返回，否则重新加载
+
+        Args:
+            db: 数据库会话
+
+        Returns:
+            配置快照
+        """
+        version = await crud_config.get_config_version(db)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            self._stats["hits"] += 1
+            return snapshot
+        async with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = await load_snapshot(db, version)
+                self._snapshot = snapshot
+                self._stats["reloads"] += 1
+                logger.debug(f"配置快照已加载: 版本 {version}，服务 {len(snapshot.services)} 个")
+            else:
+                self._stats["hits"] += 1
+        return snapshot
+
+    async def invalidate(self, db: AsyncSession) -> int:
+        """
+        递增配置版本号并丢弃本进程快照（其他进程在下次读取时发现版本变化后刷新）
+
+        Args:
+            db: 数据库会话
+
+        Returns:
+            新版本号
+        """
+        self._snapshot = None
+        return await crud_config.bump_config_version(db)
+
+    def clear(self) -> None:
+        """仅丢弃本进程快照"""
+        self._snapshot = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取快照统计
+
+        Returns:
+            命中、重新加载次数与当前版本号
+        """
+        snapshot = self._snapshot
+        return {**self._stats, "version": snapshot.version if snapshot else None}
+
+
+# 全局配置快照缓存
+config_snapshots = ConfigSnapshotCache()
@@ -0,0 +1,233 @@
+"""
+字典选项树缓存
+将每个字典类型的启用项一次性读取并物化为树（含预先序列化的响应体与 ETag），
+通过 dict_types.version 判断失效：每次读取只需一次按编码的类型查询，仅该类型变更后才重建
+"""
+
+import asyncio
+import hashlib
+import json
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import crud_system_dict
+from app.utils import success_response
+from app.utils.logger import logger
+
+
+class DictTree:
+    """单个字典类型的只读选项树"""
+
+    def __init__(
+        self,
+        code: str,
+        name: str,
+        version: int,
+        is_active: bool,
+        options: Tuple[Mapping[str, Any], ...],
+        children: Mapping[Optional[int], Tuple[int, ...]],
+    ):
+        """
+        Args:
+            code: 字典类型编码
+            name: 字典类型名称
+            version: 构建时的类型版本号
+            is_active: 类型是否启用
+            options: 全部启用项（按 sort_order, id 排序），每项含 id/parent_id/code/name/value/extra_data
+            children: 父项 ID -> 子项在 options 中的下标（None 对应根节点，含父项未启用的项）
+        """
+        self.code = code
+        self.name = name
+        self.version = version
+        self.is_active = is_active
+        self.options = options
+        # 启用项取值集合，供 is_valid_dict_value 校验语言/地区等配置
+        self.values: FrozenSet[str] = frozenset(option["value"] for option in options)
+        self._children = children
+        self._rendered: Dict[Tuple[Optional[int], bool], Tuple[bytes, str]] = {}
+
+    def _option(self, index: int, nested: bool) -> Dict[str, Any]:
+        option = self.options[index]
+        node = {key: option[key] for key in ("code", "name", "value", "extra_data")}
+        node["children"] = (
+            [self._option(child, True) for child in self._children.get(option["id"], ())]
+            if nested else []
+        )
+        return node
+
+    def render(self, parent_id: Optional[int] = None, tree: bool = False) -> Tuple[bytes, str]:
+        """
+        获取选项响应体与强 ETag（同一参数只序列化一次；不存在子项的 parent_id 每次现算，不占用缓存）
+
+        Args:
+            parent_id: 只返回该父项的直接子项；为空时返回全部启用项
+            tree: 是否返回树形结构（子项嵌套在 children 中，顶层仅为根节点或 parent_id 的子项）
+
+        Returns:
+            (JSON 响应体, ETag)
+        """
+        key = (parent_id, tree)
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            if tree or parent_id is not None:
+                indexes = self._children.get(parent_id, ())
+            else:
+                indexes = range(len(self.options))
+            body = json.dumps(
+                success_response({
+                    "dict_type": {"code": self.code, "name": self.name},
+                    "options": [self._option(i, tree) for i in indexes],
+                }),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            rendered = (body, etag)
+            # 缓存键只来自已有父项，条目数以选项数为上限，不随请求参数增长
+            if parent_id is None or parent_id in self._children:
+                self._rendered[key] = rendered
+        return rendered
+
+
+async def load_tree(db: AsyncSession, code: str, name: str, version: int, is_active: bool) -> DictTree:
+    """
+    读取字典类型的全部启用项并构建选项树
+
+    Args:
+        db: 数据库会话
+        code: 字典类型编码
+        name: 字典类型名称
+        version: 当前类型版本号
+        is_active: 类型是否启用
+
+    Returns:
+        选项树
+    """
+    items = await crud_system_dict.get_dict_options(db, dict_type_code=code)
+    options = tuple(
+        MappingProxyType({
+            "id": item.id,
+            "parent_id": item.parent_id,
+            "code": item.code,
+            "name": item.name,
+            "value": item.value,
+            "extra_data": item.extra_data,
+        })
+        for item in items
+    )
+    ids = {option["id"] for option in options}
+    children: Dict[Optional[int], List[int]] = {}
+    for index, option in enumerate(options):
+        parent_id = option["parent_id"]
+        if parent_id is not None:
+            children.setdefault(parent_id, []).append(index)
+        # 父项未启用的项同时挂到根节点下，避免从树中消失
+        if parent_id is None or parent_id not in ids:
+            children.setdefault(None, []).append(index)
+    return DictTree(
+        code=code,
+        name=name,
+        version=version,
+        is_active=is_active,
+        options=options,
+        children=MappingProxyType({key: tuple(value) for key, value in children.items()}),
+    )
+
+
+class DictTreeCache:
+    """按字典类型版本号失效的进程内选项树缓存"""
+
+    def __init__(self):
+        self._trees: Dict[str, DictTree] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._stats = {"hits": 0, "builds": 0, "not_modified": 0}
+
+    async def get(self, db: AsyncSession, code: str) -> Optional[DictTree]:
+        """
+        获取字典类型的选项树：版本号未变时直接返回，否则重建
+
+        Args:
+            db: 数据库会话
+            code: 字典类型编码
+
+        Returns:
+            选项树，类型不存在时返回 None
+        """
+        dict_type = await crud_system_dict.get_dict_type_by_code(db, code=code)
+        if dict_type is None:
+            self._trees.pop(code, None)
+            return None
+        tree = self._trees.get(code)
+        if tree is not None and tree.version == dict_type.version:
+            self._stats["hits"] += 1
+            return tree
+        async with self._locks.setdefault(code, asyncio.Lock()):
+            tree = self._trees.get(code)
+            if tree is None or tree.version != dict_type.version:
+                tree = await load_tree(db, code, dict_type.name, dict_type.version, bool(dict_type.is_active))
+                self._trees[code] = tree
+                self._stats["builds"] += 1
+                logger.debug(f"字典选项树已构建: {code} 版本 {tree.version}，选项 {len(tree.options)} 个")
+            else:
+                self._stats["hits"] += 1
+        return tree
+
+    def record_not_modified(self) -> None:
+        """记录一次 304 响应"""
+        self._stats["not_modified"] += 1
+
+    def clear(self) -> None:
+        """丢弃本进程的全部选项树"""
+        self._trees.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计
+
+        Returns:
+            命中、重建、304 次数与已缓存的类型版本
+        """
+        return {**self._stats, "types": {code: tree.version for code, tree in self._trees.items()}}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    判断 If-None-Match 请求头是否匹配 ETag
+
+    Args:
+        if_none_match: 请求头取值
+        etag: 当前 ETag
+
+    Returns:
+        是否匹配（可返回 304）
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+async def is_valid_dict_value(db: AsyncSession, code: str, value: str) -> bool:
+    """
+    校验取值是否为字典类型的启用项（读取选项树，不额外查询字典项）
+
+    字典类型不存在或未启用时不做限制。
+
+    Args:
+        db: 数据库会话
+        code: 字典类型编码
+        value: 待校验的取值
+
+    Returns:
+        是否合法
+    """
+    tree = await dict_trees.get(db, code)
+    if tree is None or not tree.is_active:
+        return True
+    return value in tree.values
+
+
+# 全局字典选项树缓存
+dict_trees = DictTreeCache()
@@ -0,0 +1,158 @@
+"""
+日志查询存储
+文件日志的后台写入线程把每条结构化记录交给本模块缓冲，事件循环中的任务定期批量写入 log_records 表，
+日志查询接口按级别与时间索引分页读取，不再需要扫描（含已压缩的）轮转日志文件
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.db import crud_log
+from app.db.database import AsyncSessionLocal
+from app.utils.logger import log_sink, logger
+
+# 过期日志的清理间隔（秒）
+PRUNE_INTERVAL = 3600.0
+
+
+class LogStore:
+    """日志缓冲与批量入库"""
+
+    def __init__(self, maxsize: int, flush_interval: float, retention_days: int):
+        """
+        初始化日志存储
+
+        Args:
+            maxsize: 待写入缓冲的容量，写满后丢弃新记录并计数
+            flush_interval: 批量写入间隔（秒）
+            retention_days: 保留天数，0 表示不清理
+        """
+        self.maxsize = max(1, maxsize)
+        self.flush_interval = max(0.1, flush_interval)
+        self.retention_days = retention_days
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+        self._stats = {"stored": 0, "dropped": 0, "flushes": 0, "errors": 0, "pruned": 0}
+
+    def collect(self, data: Dict[str, Any]) -> None:
+        """
+        接收一条结构化日志（在日志后台写入线程中调用）
+
+        Args:
+            data: QueuedLogSink.to_dict 的结果
+        """
+        row = {
+            "timestamp": datetime.fromisoformat(data["time"]).timestamp(),
+            "level": data["level"],
+            "module": f"{data['name']}:{data['function']}:{data['line']}"[:255],
+            "message": data["message"],
+            "exception": data["exception"],
+        }
+        with self._lock:
+            if len(self._pending) >= self.maxsize:
+                self._stats["dropped"] += 1
+                return
+            self._pending.append(row)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = list(self._pending)
+            self._pending.clear()
+        return rows
+
+    async def flush(self) -> int:
+        """
+        将缓冲中的日志写入数据库
+
+        Returns:
+            写入条数
+        """
+        rows = self._drain()
+        if not rows:
+            return 0
+        async with AsyncSessionLocal() as db:
+            await crud_log.add_log_records(db, rows=rows)
+        self._stats["stored"] += len(rows)
+        self._stats["flushes"] += 1
+        return len(rows)
+
+    async def prune(self) -> int:
+        """
+        删除超过保留天数的日志
+
+        Returns:
+            删除条数
+        """
+        self._last_prune = time.monotonic()
+        if self.retention_days <= 0:
+            return 0
+        async with AsyncSessionLocal() as db:
+            deleted = await crud_log.delete_log_records_before(
+                db, before=time.time() - self.retention_days * 86400
+            )
+        self._stats["pruned"] += deleted
+        return deleted
+
+    async def clear(self) -> int:
+        """
+        清空日志（含尚未写入的缓冲）
+
+        Returns:
+            删除条数
+        """
+        self._drain()
+        async with AsyncSessionLocal() as db:
+            return await crud_log.clear_log_records(db)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                if time.monotonic() - self._last_prune >= PRUNE_INTERVAL:
+                    await self.prune()
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.warning(f"日志入库失败: {e}")
+
+    def start(self) -> None:
+        """注册为文件日志的消费者并启动批量写入任务（需在事件循环中调用）"""
+        log_sink.add_consumer(self.collect)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止批量写入任务并写入剩余缓冲"""
+        log_sink.remove_consumer(self.collect)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计
+
+        Returns:
+            待写入条数与累计写入/丢弃/批次/失败/清理条数
+        """
+        return {**self._stats, "pending": len(self._pending)}
+
+
+# 全局日志存储
+log_store = LogStore(
+    maxsize=settings.LOG_QUEUE_SIZE,
+    flush_interval=settings.LOG_STORE_FLUSH_INTERVAL,
+    retention_days=settings.LOG_STORE_RETENTION_DAYS,
+)
@@ -0,0 +1,34 @@
+"""
+资源标题解析
+"""
+
+from app.services.parser.engine import RuleSet, TitleParser, parse_many, parse_title, title_parser
+from app.services.parser.models import ParsedTitle
+from app.services.parser.pool import ParserPool, aparse_many, parser_pool
+from app.services.parser.rules import BUILTIN_RULES, ParseRule
+from app.services.parser.store import (
+    PARSE_RULE_DICT_TYPE,
+    aparse_titles,
+    ensure_parse_rules,
+    reload_parse_rules,
+    validate_rule,
+)
+
+__all__ = [
+    "BUILTIN_RULES",
+    "PARSE_RULE_DICT_TYPE",
+    "ParseRule",
+    "ParsedTitle",
+    "ParserPool",
+    "RuleSet",
+    "TitleParser",
+    "aparse_many",
+    "aparse_titles",
+    "ensure_parse_rules",
+    "parse_many",
+    "parse_title",
+    "parser_pool",
+    "reload_parse_rules",
+    "title_parser",
+    "validate_rule",
+]
@@ -0,0 +1,311 @@
+"""
+标题解析引擎
+规则在加载时一次性编译为只读规则表；解析时先按标题风格、字面量提示做廉价预过滤，
+再依优先级尝试正则，结果按标题记忆化
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.parser.models import ParsedTitle
+from app.services.parser.rules import (
+    BILINGUAL_RE,
+    BRACKET_SEGMENT_RE,
+    BUILTIN_RULES,
+    CODEC_PATTERNS,
+    NORMALIZE_TABLE,
+    PLAIN_GROUP_RE,
+    RESOLUTION_RE,
+    SEASON_PATTERNS,
+    SEASON_STRIP_RE,
+    SOURCE_PATTERNS,
+    STYLE_BRACKET,
+    STYLE_PLAIN,
+    STYLES,
+    SUBTITLE_PATTERNS,
+    TAG_RE,
+    ParseRule,
+    cn_to_int,
+)
+from app.utils.logger import logger
+
+_has_digit = re.compile(r"\d").search
+
+# 被误识别为发布组的常见片源后缀（如标题以 WEB-DL 结尾）
+_NOT_GROUPS = frozenset({"dl", "rip"})
+
+CompiledRule = Tuple[ParseRule, "re.Pattern[str]"]
+
+
+def compile_rules(rules: Iterable[ParseRule]) -> List[CompiledRule]:
+    """
+    编译规则并按优先级排序，无效规则记录警告后跳过
+
+    Args:
+        rules: 规则定义
+
+    Returns:
+        (规则, 已编译正则) 列表
+    """
+    compiled: List[CompiledRule] = []
+    for rule in rules:
+        if rule.style not in STYLES:
+            logger.warning(f"解析规则 [{rule.name}] 风格无效: {rule.style}，已跳过")
+            continue
+        try:
+            regex = re.compile(rule.pattern, re.IGNORECASE)
+        except re.error as e:
+            logger.warning(f"解析规则 [{rule.name}] 正则无效: {e}，已跳过")
+            continue
+        if "episode" not in regex.groupindex:
+            logger.warning(f"解析规则 [{rule.name}] 缺少命名分组 episode，已跳过")
+            continue
+        compiled.append((rule, regex))
+    compiled.sort(key=lambda item: item[0].priority)
+    return compiled
+
+
+class RuleSet:
+    """编译后的只读规则表，解析结果在本规则表内记忆化"""
+
+    def __init__(self, rules: Iterable[ParseRule], cache_size: int, version: int = 0):
+        """
+        初始化规则表
+
+        Args:
+            rules: 规则定义
+            cache_size: 记忆化缓存的最大条目数
+            version: 规则表版本号
+        """
+        compiled = compile_rules(rules)
+        self.version = version
+        self.rules = tuple(rule for rule, _ in compiled)
+        self.rule_names = tuple(rule.name for rule in self.rules)
+        self._bracket_rules = tuple(c for c in compiled if c[0].style != STYLE_PLAIN)
+        self._plain_rules = tuple(c for c in compiled if c[0].style != STYLE_BRACKET)
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def parse_many(self, titles: Iterable[str]) -> List[ParsedTitle]:
+        """
+        批量解析标题
+
+        Args:
+            titles: 标题列表
+
+        Returns:
+            与输入顺序一致的解析结果
+        """
+        parse = self.parse
+        return [parse(title) for title in titles]
+
+    def _match(self, text: str, bracket: bool):
+        """按预过滤条件依次尝试规则，返回首个命中的 (规则, 匹配)"""
+        if not _has_digit(text):
+            return None, None
+        lower = text.lower()
+        for rule, regex in self._bracket_rules if bracket else self._plain_rules:
+            if rule.hint and rule.hint not in lower:
+                continue
+            match = regex.search(text)
+            if match:
+                return rule, match
+        return None, None
+
+    def _parse(self, title: str) -> ParsedTitle:
+        """解析单条标题（未经记忆化）"""
+        text = title.translate(NORMALIZE_TABLE).strip()
+        bracket = text.startswith("[")
+        rule, match = self._match(text, bracket)
+        groups = {k: v for k, v in match.groupdict().items() if v} if match else {}
+        prefix = text[: match.start()] if match else text
+
+        episode = int(groups["episode"]) if "episode" in groups else None
+        episode_end = int(groups["episode_end"]) if "episode_end" in groups else None
+        if episode_end is not None and episode_end <= (episode or 0):
+            episode_end = None
+
+        group = groups.get("group")
+        raw_name = groups.get("name")
+        if bracket:
+            segments = [s.strip() for s in BRACKET_SEGMENT_RE.findall(prefix)]
+            if group is None and segments:
+                group = segments[0]
+            if raw_name is None:
+                free_text = BRACKET_SEGMENT_RE.sub(" ", prefix).strip(" -[")
+                candidates = [free_text] + segments[1:]
+                raw_name = " / ".join(s for s in candidates if s and not TAG_RE.match(s)) or None
+        else:
+            if group is None:
+                found = PLAIN_GROUP_RE.search(text)
+                if found and found.group(1).lower() not in _NOT_GROUPS:
+                    group = found.group(1)
+            if raw_name is None and match:
+                raw_name = re.sub(r"[._]", " ", prefix).strip(" -[")
+
+        season = int(groups["season"]) if "season" in groups else None
+        if season is None:
+            season = _find_season(text)
+        name, aliases = _split_name(raw_name)
+
+        return ParsedTitle(
+            title=title,
+            name=name,
+            aliases=aliases,
+            group=group,
+            season=season,
+            episode=episode,
+            episode_end=episode_end,
+            resolution=_find_resolution(text),
+            source=_first_label(SOURCE_PATTERNS, text),
+            codec=_first_label(CODEC_PATTERNS, text),
+            subtitles=tuple(label for regex, label in SUBTITLE_PATTERNS if regex.search(text)),
+            rule=rule.name if rule else None,
+        )
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        获取记忆化缓存统计
+
+        Returns:
+            命中、未命中次数与当前条目数
+        """
+        info = self.parse.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+
+
+def _find_season(text: str) -> Optional[int]:
+    """从标题中查找季号"""
+    for regex in SEASON_PATTERNS:
+        found = regex.search(text)
+        if found:
+            return cn_to_int(found.group(1))
+    return None
+
+
+def _find_resolution(text: str) -> Optional[str]:
+    """查找分辨率，统一为 1080p 形式"""
+    found = RESOLUTION_RE.search(text)
+    if not found:
+        return None
+    value = next(g for g in found.groups() if g)
+    return "2160p" if value.upper() == "4K" else f"{value}p"
+
+
+def _first_label(patterns, text: str) -> Optional[str]:
+    """返回首个命中模式对应的标签"""
+    for regex, label in patterns:
+        if regex.search(text):
+            return label
+    return None
+
+
+def _split_name(raw: Optional[str]) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """
+    拆分剧名与别名：按 / 分隔，去除季号文本，中英双语名拆为两个名称
+
+    Args:
+        raw: 原始剧名文本
+
+    Returns:
+        (剧名, 别名元组)
+    """
+    if not raw:
+        return None, ()
+    names: List[str] = []
+    for part in raw.split("/"):
+        part = SEASON_STRIP_RE.sub(" ", part).strip(" -")
+        part = " ".join(part.split())
+        if not part:
+            continue
+        bilingual = BILINGUAL_RE.match(part)
+        for item in bilingual.groups() if bilingual else (part,):
+            item = item.strip()
+            if item and item not in names:
+                names.append(item)
+    if not names:
+        return None, ()
+    return names[0], tuple(names[1:])
+
+
+class TitleParser:
+    """标题解析器：持有当前规则表，规则变更时整体替换"""
+
+    def __init__(self, rules: Iterable[ParseRule] = BUILTIN_RULES, cache_size: Optional[int] = None):
+        """
+        初始化解析器
+
+        Args:
+            rules: 初始规则，默认为内置规则
+            cache_size: 记忆化缓存大小，默认读取 PARSER_CACHE_SIZE
+        """
+        self.cache_size = cache_size or settings.PARSER_CACHE_SIZE
+        self._ruleset = RuleSet(rules, self.cache_size)
+
+    @property
+    def ruleset(self) -> RuleSet:
+        """当前规则表"""
+        return self._ruleset
+
+    def load_rules(self, rules: Iterable[ParseRule]) -> RuleSet:
+        """
+        编译新规则表并整体替换当前规则表（旧规则表的记忆化结果随之失效）
+
+        Args:
+            rules: 规则定义
+
+        Returns:
+            新规则表
+        """
+        ruleset = RuleSet(rules, self.cache_size, version=self._ruleset.version + 1)
+        self._ruleset = ruleset
+        return ruleset
+
+    def parse(self, title: str) -> ParsedTitle:
+        """
+        解析单条标题
+
+        Args:
+            title: 资源标题
+
+        Returns:
+            解析结果
+        """
+        return self._ruleset.parse(title)
+
+    def parse_many(self, titles: Iterable[str]) -> List[ParsedTitle]:
+        """
+        批量解析标题（整批使用同一规则表）
+
+        Args:
+            titles: 标题列表
+
+        Returns:
+            与输入顺序一致的解析结果
+        """
+        return self._ruleset.parse_many(titles)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取解析器状态
+
+        Returns:
+            规则表版本、规则名与缓存统计
+        """
+        ruleset = self._ruleset
+        return {"version": ruleset.version, "rules": list(ruleset.rule_names), "cache": ruleset.cache_info()}
+
+
+# 全局标题解析器实例
+title_parser = TitleParser()
+
+
+def parse_title(title: str) -> ParsedTitle:
+    """使用全局解析器解析单条标题"""
+    return title_parser.parse(title)
+
+
+def parse_many(titles: Iterable[str]) -> List[ParsedTitle]:
+    """使用全局解析器批量解析标题"""
+    return title_parser.parse_many(titles)
@@ -0,0 +1,37 @@
+"""
+标题解析结果模型
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ParsedTitle:
+    """
+    单条资源标题的解析结果
+
+    实例不可变：记忆化缓存会在多个调用方之间共享同一个对象。
+    """
+
+    title: str
+    name: Optional[str] = None
+    aliases: Tuple[str, ...] = ()
+    group: Optional[str] = None
+    season: Optional[int] = None
+    episode: Optional[int] = None
+    episode_end: Optional[int] = None
+    resolution: Optional[str] = None
+    source: Optional[str] = None
+    codec: Optional[str] = None
+    subtitles: Tuple[str, ...] = ()
+    rule: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """是否解析出集号（未解析出集号的条目应被丢弃）"""
+        return self.episode is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return asdict(self)
@@ -0,0 +1,138 @@
+"""
+进程池批量解析
+正则解析持有 GIL，大批量标题在事件循环中同步解析会阻塞其他请求；
+超过阈值的批次按块分发到子进程解析，阈值以下仍在当前进程内联解析
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from app.core.config import settings
+from app.services.parser.engine import RuleSet, title_parser
+from app.services.parser.models import ParsedTitle
+from app.services.parser.rules import ParseRule
+from app.utils.logger import logger
+
+# 子进程内的规则表（由 _init_worker 初始化）
+_worker_ruleset: Optional[RuleSet] = None
+
+
+def _init_worker(rules: Sequence[ParseRule], cache_size: int) -> None:
+    """子进程初始化：编译一次规则表"""
+    global _worker_ruleset
+    _worker_ruleset = RuleSet(rules, cache_size)
+
+
+def _parse_chunk(titles: List[str]) -> List[ParsedTitle]:
+    """子进程内解析一块标题"""
+    return _worker_ruleset.parse_many(titles)
+
+
+class ParserPool:
+    """按批次大小在内联解析与进程池解析之间切换的批量解析器"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        threshold: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        初始化批量解析器
+
+        Args:
+            max_workers: 子进程数，<=0 表示禁用进程池，默认读取 PARSER_POOL_WORKERS
+            threshold: 启用进程池的最小批次（去重后标题数），默认读取 PARSER_POOL_THRESHOLD
+            chunk_size: 每次分发给子进程的标题数，默认读取 PARSER_POOL_CHUNK_SIZE
+        """
+        self.max_workers = settings.PARSER_POOL_WORKERS if max_workers is None else max_workers
+        self.threshold = threshold or settings.PARSER_POOL_THRESHOLD
+        self.chunk_size = max(1, chunk_size or settings.PARSER_POOL_CHUNK_SIZE)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._version: Optional[int] = None
+        self._stats = {"inline_batches": 0, "pool_batches": 0, "pool_failures": 0}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """获取与当前规则表版本一致的进程池，规则变更后重建"""
+        ruleset = title_parser.ruleset
+        if self._executor is None or self._version != ruleset.version:
+            old = self._executor
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(ruleset.rules, title_parser.cache_size),
+            )
+            self._version = ruleset.version
+            if old is not None:
+                # 已提交的块仍按旧规则完成，不等待
+                old.shutdown(wait=False)
+        return self._executor
+
+    async def parse_many(self, titles: Iterable[str]) -> List[ParsedTitle]:
+        """
+        批量解析标题：去重后不足阈值时内联解析，否则分块交给进程池
+
+        进程池不可用时记录警告并回退为内联解析。
+
+        Args:
+            titles: 标题列表
+
+        Returns:
+            与输入顺序一致的解析结果
+        """
+        titles = list(titles)
+        unique = list(dict.fromkeys(titles))
+        if self.max_workers <= 0 or len(unique) < self.threshold:
+            self._stats["inline_batches"] += 1
+            return title_parser.parse_many(titles)
+
+        loop = asyncio.get_running_loop()
+        chunks = [unique[i:i + self.chunk_size] for i in range(0, len(unique), self.chunk_size)]
+        try:
+            executor = self._get_executor()
+            parsed_chunks = await asyncio.gather(
+                *(loop.run_in_executor(executor, _parse_chunk, chunk) for chunk in chunks)
+            )
+        except BrokenProcessPool as e:
+            logger.warning(f"解析进程池异常，回退为内联解析: {e}")
+            self._stats["pool_failures"] += 1
+            self._executor = None
+            return title_parser.parse_many(titles)
+
+        self._stats["pool_batches"] += 1
+        results = {parsed.title: parsed for chunk in parsed_chunks for parsed in chunk}
+        return [results[title] for title in titles]
+
+    def shutdown(self) -> None:
+        """关闭进程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取批量解析统计
+
+        Returns:
+            参数与内联/进程池批次计数
+        """
+        return {
+            "max_workers": self.max_workers,
+            "threshold": self.threshold,
+            "chunk_size": self.chunk_size,
+            "running": self._executor is not None,
+            **self._stats,
+        }
+
+
+# 全局批量解析器实例
+parser_pool = ParserPool()
+
+
+async def aparse_many(titles: Iterable[str]) -> List[ParsedTitle]:
+    """使用全局批量解析器解析标题（大批量时不阻塞事件循环）"""
+    return await parser_pool.parse_many(titles)
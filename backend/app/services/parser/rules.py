@@ -0,0 +1,163 @@
+"""
+标题解析规则
+内置规则按常见国漫/动漫资源命名格式编写，pattern 使用命名分组：
+episode（必需）、episode_end、season、name、group
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# 规则适用的标题风格（预过滤用）
+STYLE_BRACKET = "bracket"  # 以 [ 或 【 开头：[字幕组][剧名][集号]...
+STYLE_PLAIN = "plain"      # 其他：Name.S01E01.1080p-GROUP / 剧名 - 01 ...
+STYLE_ANY = "any"
+STYLES = (STYLE_BRACKET, STYLE_PLAIN, STYLE_ANY)
+
+
+@dataclass(frozen=True)
+class ParseRule:
+    """标题解析规则定义"""
+
+    name: str
+    pattern: str
+    style: str = STYLE_ANY
+    # 标题中必须出现的字面量（小写比较），不满足时不执行正则
+    hint: Optional[str] = None
+    # 数值越小越先尝试
+    priority: int = 100
+
+
+BUILTIN_RULES: Tuple[ParseRule, ...] = (
+    # [Lilith-Raws] 斗罗大陆 / Douluo Dalu - 156 [Baha][WEB-DL][1080p]
+    ParseRule(
+        name="bracket_dash",
+        pattern=(
+            r"^\[(?P<group>[^\]]+)\]\s*(?P<name>[^\[\]]+?)\s+-\s+(?P<episode>\d{1,4})(?:v\d)?"
+            r"(?:\s*-\s*(?P<episode_end>\d{1,4}))?(?:\s*END)?\s*(?:[\[(]|$)"
+        ),
+        style=STYLE_BRACKET,
+        hint=" - ",
+        priority=10,
+    ),
+    # Douluo.Dalu.S01E156.2160p.WEB-DL / S01E01-E12
+    ParseRule(
+        name="season_episode",
+        pattern=(
+            r"(?<![A-Za-z0-9])S(?P<season>\d{1,2})\s?E(?P<episode>\d{1,4})"
+            r"(?:\s?-\s?E?(?P<episode_end>\d{1,4}))?(?!\d)"
+        ),
+        priority=20,
+    ),
+    # 【幻樱字幕组】【斗罗大陆】【第156话】 / 斗罗大陆 第01-26集
+    ParseRule(
+        name="cn_episode",
+        pattern=r"第\s*(?P<episode>\d{1,4})(?:\s*[-~]\s*(?P<episode_end>\d{1,4}))?\s*[话話集回期]",
+        hint="第",
+        priority=30,
+    ),
+    # [VCB-Studio][斗罗大陆][156][1080p] / [01-26]（排除 [2018] 这类年份）
+    ParseRule(
+        name="bracket_number",
+        pattern=(
+            r"\[(?!(?:19|20)\d{2}\])(?P<episode>\d{1,4})(?:v\d)?"
+            r"(?:\s*[-~]\s*(?P<episode_end>\d{1,4}))?(?:\s*(?:END|Fin|完))?\]"
+        ),
+        style=STYLE_BRACKET,
+        priority=40,
+    ),
+    # 斗罗大陆.Douluo.Dalu.EP156.1080p.WEB-DL
+    ParseRule(
+        name="ep_prefix",
+        pattern=(
+            r"(?<![A-Za-z0-9])EP\.?\s?(?P<episode>\d{1,4})"
+            r"(?:\s?-\s?(?:EP)?(?P<episode_end>\d{1,4}))?(?![\dpPkK])"
+        ),
+        hint="ep",
+        priority=50,
+    ),
+    # 斗罗大陆 - 156 [1080P]
+    ParseRule(
+        name="plain_dash",
+        pattern=r"^(?P<name>[^\[\]]+?)\s+-\s+(?P<episode>\d{1,4})(?:v\d)?(?!\d)",
+        style=STYLE_PLAIN,
+        hint=" - ",
+        priority=60,
+    ),
+)
+
+
+# 全角括号/空格归一化
+NORMALIZE_TABLE = str.maketrans({"【": "[", "】": "]", "［": "[", "］": "]", "　": " "})
+
+# 方括号分段
+BRACKET_SEGMENT_RE = re.compile(r"\[([^\]]*)\]")
+
+# 非剧名的方括号标签（用于从方括号分段中挑选剧名）
+TAG_RE = re.compile(
+    r"^(?:\d+(?:v\d)?|\d{3,4}[pi]|4k|(?:19|20)\d{2}|x26[45]|h\.?26[45]|hevc|avc|aac.*|flac|"
+    r"mp4|mkv|web-?dl|web-?rip|bd(?:rip)?|blu-?ray|hdtv|baha|b-global|cr|gb|big5|chs|cht|"
+    r"简.*|繁.*|国漫|国产动漫|新番|\d+月新番|合集|全集|完结|.*招募.*)$",
+    re.IGNORECASE,
+)
+
+# 季号
+SEASON_PATTERNS = (
+    re.compile(r"第\s*([一二三四五六七八九十\d]+)\s*季"),
+    re.compile(r"Season\s*(\d{1,2})", re.IGNORECASE),
+    re.compile(r"(\d{1,2})(?:st|nd|rd|th)\s+Season", re.IGNORECASE),
+    re.compile(r"(?<![A-Za-z0-9])S(\d{1,2})(?![\dE])"),
+)
+SEASON_STRIP_RE = re.compile(
+    r"\s*(?:第\s*[一二三四五六七八九十\d]+\s*季|Season\s*\d{1,2}|\d{1,2}(?:st|nd|rd|th)\s+Season|"
+    r"(?<![A-Za-z0-9])S\d{1,2}(?![\dE]))\s*",
+    re.IGNORECASE,
+)
+
+# 中文名在前、英文名在后的双语剧名：斗罗大陆 Douluo Dalu
+BILINGUAL_RE = re.compile(r"^([一-鿿][^A-Za-z]*?)\s+([A-Za-z].*)$")
+
+# 纯文本风格标题末尾的发布组：...-GROUP
+PLAIN_GROUP_RE = re.compile(r"-([A-Za-z0-9@]+)$")
+
+# 质量属性
+RESOLUTION_RE = re.compile(
+    r"(?<!\d)(?:\d{3,4}[x×])?(2160|1080|720|576|480)[pi]?(?![\da-z])|(?<![A-Za-z0-9])(4K)(?![A-Za-z0-9])",
+    re.IGNORECASE,
+)
+SOURCE_PATTERNS = (
+    (re.compile(r"WEB-?DL", re.IGNORECASE), "WEB-DL"),
+    (re.compile(r"WEB-?Rip", re.IGNORECASE), "WEBRip"),
+    (re.compile(r"Blu-?Ray|BDRip|(?<![A-Za-z])BD(?![A-Za-z])", re.IGNORECASE), "BluRay"),
+    (re.compile(r"HDTV", re.IGNORECASE), "HDTV"),
+    (re.compile(r"DVDRip|(?<![A-Za-z])DVD(?![A-Za-z])", re.IGNORECASE), "DVD"),
+)
+CODEC_PATTERNS = (
+    (re.compile(r"HEVC|[xh]\.?265", re.IGNORECASE), "H.265"),
+    (re.compile(r"(?<![A-Za-z])AVC(?![A-Za-z])|[xh]\.?264", re.IGNORECASE), "H.264"),
+)
+SUBTITLE_PATTERNS = (
+    (re.compile(r"(?<![A-Za-z])(?:CHS|GB|SC)(?![A-Za-z])|简", re.IGNORECASE), "CHS"),
+    (re.compile(r"(?<![A-Za-z])(?:CHT|BIG5|TC)(?![A-Za-z])|繁", re.IGNORECASE), "CHT"),
+)
+
+CN_DIGITS = {"一": 1, "二": 2, "三": 3, "四": 4, "五": 5, "六": 6, "七": 7, "八": 8, "九": 9}
+
+
+def cn_to_int(text: str) -> Optional[int]:
+    """
+    将季号文本（阿拉伯数字或一至九十九的中文数字）转换为整数
+
+    Args:
+        text: 数字文本
+
+    Returns:
+        整数，无法识别时返回 None
+    """
+    if text.isdigit():
+        return int(text)
+    if "十" in text:
+        tens, _, ones = text.partition("十")
+        value = (CN_DIGITS.get(tens, 0) if tens else 1) * 10
+        return value + (CN_DIGITS.get(ones, 0) if ones else 0)
+    return CN_DIGITS.get(text)
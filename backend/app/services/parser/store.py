@@ -0,0 +1,173 @@
+"""
+自定义解析规则存储
+用户规则以字典项形式保存在 parse_rule 字典类型下：
+value 为正则（须含命名分组 episode），sort_order 为优先级，
+extra_data 为可选 JSON：{"style": "bracket|plain|any", "hint": "必须出现的字面量"}
+规则表记录加载时 parse_rule 字典类型的版本戳，读取前比对版本戳即可发现其他 worker 的修改
+"""
+
+import asyncio
+import json
+import re
+from typing import Any, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.dict import DictItem, DictType
+from app.services.parser.engine import RuleSet, title_parser
+from app.services.parser.models import ParsedTitle
+from app.services.parser.pool import parser_pool
+from app.services.parser.rules import BUILTIN_RULES, STYLE_ANY, STYLES, ParseRule
+from app.utils.logger import logger
+
+# 解析规则字典类型编码
+PARSE_RULE_DICT_TYPE = "parse_rule"
+
+# 当前规则表对应的字典类型版本戳（类型 ID、版本号、创建时间；类型不存在时为 None），未加载过时为 _UNLOADED
+_UNLOADED = object()
+_loaded_stamp: Any = _UNLOADED
+_reload_lock = asyncio.Lock()
+
+
+def rule_from_item(code: str, value: str, sort_order: Optional[int], extra_data: Optional[str]) -> ParseRule:
+    """
+    将字典项字段转换为解析规则
+
+    Args:
+        code: 字典项编码（规则名，与内置规则同名时覆盖内置规则）
+        value: 正则表达式
+        sort_order: 排序（即优先级，越小越先尝试）
+        extra_data: 扩展数据 JSON
+
+    Returns:
+        解析规则
+
+    Raises:
+        ValueError: extra_data 不是合法的 JSON 对象
+    """
+    extra = json.loads(extra_data) if extra_data else {}
+    if not isinstance(extra, dict):
+        raise ValueError("extra_data 必须是 JSON 对象")
+    hint = extra.get("hint")
+    return ParseRule(
+        name=code,
+        pattern=value,
+        style=extra.get("style") or STYLE_ANY,
+        hint=hint.lower() if hint else None,
+        priority=sort_order or 0,
+    )
+
+
+def validate_rule(code: str, value: str, sort_order: Optional[int], extra_data: Optional[str]) -> Optional[str]:
+    """
+    校验自定义解析规则
+
+    Returns:
+        错误信息，校验通过返回 None
+    """
+    try:
+        rule = rule_from_item(code, value, sort_order, extra_data)
+    except ValueError as e:
+        return f"解析规则扩展数据无效: {e}"
+    if rule.style not in STYLES:
+        return f"解析规则风格无效: {rule.style}，可选值: {', '.join(STYLES)}"
+    try:
+        regex = re.compile(rule.pattern)
+    except re.error as e:
+        return f"解析规则正则无效: {e}"
+    if "episode" not in regex.groupindex:
+        return "解析规则正则必须包含命名分组 (?P<episode>...)"
+    return None
+
+
+def build_rules(items: Iterable[DictItem]) -> List[ParseRule]:
+    """
+    合并内置规则与自定义规则（同名自定义规则覆盖内置规则）
+
+    Args:
+        items: 启用的解析规则字典项
+
+    Returns:
+        规则列表
+    """
+    rules = {rule.name: rule for rule in BUILTIN_RULES}
+    for item in items:
+        try:
+            rules[item.code] = rule_from_item(item.code, item.value, item.sort_order, item.extra_data)
+        except ValueError as e:
+            logger.warning(f"解析规则 [{item.code}] 扩展数据无效: {e}，已跳过")
+    return list(rules.values())
+
+
+async def _rule_stamp(db: AsyncSession) -> Optional[Tuple[Any, ...]]:
+    """读取 parse_rule 字典类型的版本戳（字典项增删改与类型启停都会递增版本号）"""
+    stmt = select(DictType.id, DictType.version, DictType.created_at).where(DictType.code == PARSE_RULE_DICT_TYPE)
+    row = (await db.execute(stmt)).first()
+    return tuple(row) if row is not None else None
+
+
+async def reload_parse_rules(db: AsyncSession) -> RuleSet:
+    """
+    从字典读取自定义规则，编译后整体替换全局解析器的规则表
+
+    Args:
+        db: 数据库会话
+
+    Returns:
+        新规则表
+    """
+    global _loaded_stamp
+    stamp = await _rule_stamp(db)
+    stmt = (
+        select(DictItem)
+        .join(DictType, DictType.code == DictItem.dict_type_code)
+        .where(
+            DictItem.dict_type_code == PARSE_RULE_DICT_TYPE,
+            DictItem.is_active.is_(True),
+            DictType.is_active.is_(True),
+        )
+        .order_by(DictItem.sort_order, DictItem.id)
+    )
+    result = await db.execute(stmt)
+    items = list(result.scalars().all())
+    ruleset = title_parser.load_rules(build_rules(items))
+    _loaded_stamp = stamp
+    logger.info(f"解析规则已重新加载: 版本 {ruleset.version}，共 {len(ruleset.rule_names)} 条（自定义 {len(items)} 条）")
+    return ruleset
+
+
+async def ensure_parse_rules(db: AsyncSession) -> RuleSet:
+    """
+    确保全局解析器的规则表与数据库一致：版本戳未变时只做一次类型查询，否则重新加载
+
+    规则表整体替换后，进程池按新的规则表版本重建子进程，因此同样随之更新。
+
+    Args:
+        db: 数据库会话
+
+    Returns:
+        当前规则表
+    """
+    stamp = await _rule_stamp(db)
+    if stamp == _loaded_stamp:
+        return title_parser.ruleset
+    async with _reload_lock:
+        if await _rule_stamp(db) != _loaded_stamp:
+            return await reload_parse_rules(db)
+    return title_parser.ruleset
+
+
+async def aparse_titles(db: AsyncSession, titles: Iterable[str]) -> List[ParsedTitle]:
+    """
+    按数据库中最新的规则批量解析标题（大批量时交给进程池）
+
+    Args:
+        db: 数据库会话
+        titles: 标题列表
+
+    Returns:
+        与输入顺序一致的解析结果
+    """
+    await ensure_parse_rules(db)
+    return await parser_pool.parse_many(titles)
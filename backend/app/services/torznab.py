@@ -0,0 +1,238 @@
+"""
+Torznab XML 生成
+基于 lxml 增量写入（xmlfile）逐条输出 RSS/Torznab 内容，不在内存中构建完整 DOM
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from lxml import etree
+
+from app.core.config import settings
+
+TORZNAB_NS = "http://torznab.com/schemas/2015/feed"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+NSMAP = {"atom": ATOM_NS, "torznab": TORZNAB_NS}
+
+# Torznab 错误码
+ERROR_INCORRECT_CREDENTIALS = 100
+ERROR_MISSING_PARAMETER = 200
+ERROR_UNSUPPORTED_FUNCTION = 202
+ERROR_UNKNOWN = 900
+
+# 对外声明的分类（Newznab 标准 TV 分类）
+TV_CATEGORIES = [
+    (5000, "TV", [(5030, "TV/SD"), (5040, "TV/HD"), (5045, "TV/UHD"), (5070, "TV/Anime")]),
+]
+
+
+class _ChunkSink:
+    """收集 xmlfile 输出的字节块，供流式响应逐段取出"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self._chunks.append(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _write_text(xf, tag: str, text: Any) -> None:
+    """写入简单文本节点"""
+    with xf.element(tag):
+        xf.write(str(text))
+
+
+def _write_empty(xf, tag: str, attrib: Dict[str, str]) -> None:
+    """写入仅含属性的节点"""
+    with xf.element(tag, attrib):
+        pass
+
+
+def _format_pub_date(value: Any) -> Optional[str]:
+    """将 ISO8601 时间转换为 RSS 要求的 RFC 822 格式"""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt)
+
+
+def write_release(xf, release: Dict[str, Any]) -> None:
+    """
+    写入单条 Prowlarr 搜索结果为 Torznab <item>
+
+    Args:
+        xf: lxml xmlfile 写入上下文
+        release: Prowlarr /api/v1/search 返回的单条结果
+    """
+    link = release.get("downloadUrl") or release.get("magnetUrl") or ""
+    size = release.get("size") or 0
+    categories = [c.get("id") for c in release.get("categories") or [] if c.get("id") is not None]
+    attr_tag = f"{{{TORZNAB_NS}}}attr"
+
+    with xf.element("item"):
+        _write_text(xf, "title", release.get("title") or "")
+        _write_text(xf, "guid", release.get("guid") or link)
+        if link:
+            _write_text(xf, "link", link)
+        if release.get("infoUrl"):
+            _write_text(xf, "comments", release["infoUrl"])
+        pub_date = _format_pub_date(release.get("publishDate"))
+        if pub_date:
+            _write_text(xf, "pubDate", pub_date)
+        _write_text(xf, "size", size)
+        for category in categories:
+            _write_text(xf, "category", category)
+        if link:
+            _write_empty(xf, "enclosure", {
+                "url": link,
+                "length": str(size),
+                "type": "application/x-bittorrent",
+            })
+
+        attrs = [("size", size)]
+        attrs.extend(("category", c) for c in categories)
+        for name, key in [
+            ("seeders", "seeders"),
+            ("peers", "leechers"),
+            ("infohash", "infoHash"),
+            ("magneturl", "magnetUrl"),
+            ("downloadvolumefactor", "downloadVolumeFactor"),
+            ("uploadvolumefactor", "uploadVolumeFactor"),
+        ]:
+            if release.get(key) is not None:
+                attrs.append((name, release[key]))
+        for name, value in attrs:
+            _write_empty(xf, attr_tag, {"name": name, "value": str(value)})
+
+
+def _release_sort_key(release: Dict[str, Any]) -> tuple:
+    """分页排序键：发布时间倒序，同一时间按 guid 升序（与索引器的返回先后无关）"""
+    try:
+        dt = datetime.fromisoformat(str(release.get("publishDate") or "").replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        published = dt.timestamp()
+    except ValueError:
+        published = float("-inf")
+    guid = release.get("guid") or release.get("downloadUrl") or release.get("magnetUrl") or ""
+    return -published, str(guid)
+
+
+async def stream_feed(
+    batches: AsyncIterator[Iterable[Dict[str, Any]]],
+    title: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    将按批到达的搜索结果流式写成 Torznab RSS
+
+    头部立即输出。第一页（offset 为 0）每批结果写完即刷新输出，最多输出 limit 条，
+    达到上限后停止消费上游（由上游负责取消未完成的请求）；翻页（offset 大于 0）时各索引器的返回先后
+    每次请求都不同，因此先收齐全部结果，按发布时间倒序、guid 升序排序后再跳过前 offset 条，
+    保证同一组结果的各页之间不重复、不遗漏。
+
+    Args:
+        batches: 搜索结果批次的异步迭代器
+        title: 频道标题
+        offset: 跳过的条数
+        limit: 最大输出条数
+
+    Yields:
+        XML 字节块
+    """
+    sink = _ChunkSink()
+    written = 0
+    with etree.xmlfile(sink, encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("rss", {"version": "2.0"}, nsmap=NSMAP):
+            with xf.element("channel"):
+                _write_empty(xf, f"{{{ATOM_NS}}}link", {"rel": "self", "type": "application/rss+xml"})
+                _write_text(xf, "title", title or settings.APP_NAME)
+                _write_text(xf, "description", f"{settings.APP_NAME} Torznab Feed")
+                xf.flush()
+                yield sink.drain()
+
+                try:
+                    if offset > 0:
+                        releases: List[Dict[str, Any]] = []
+                        async for batch in batches:
+                            releases.extend(batch)
+                        releases.sort(key=_release_sort_key)
+                        end = None if limit is None else offset + limit
+                        for release in releases[offset:end]:
+                            write_release(xf, release)
+                        xf.flush()
+                        yield sink.drain()
+                    else:
+                        async for batch in batches:
+                            for release in batch:
+                                if limit is not None and written >= limit:
+                                    break
+                                write_release(xf, release)
+                                written += 1
+                            xf.flush()
+                            chunk = sink.drain()
+                            if chunk:
+                                yield chunk
+                            if limit is not None and written >= limit:
+                                break
+                finally:
+                    aclose = getattr(batches, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
+    yield sink.drain()
+
+
+def render_caps() -> bytes:
+    """
+    生成 t=caps 能力声明
+
+    Returns:
+        XML 字节串
+    """
+    sink = _ChunkSink()
+    with etree.xmlfile(sink, encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("caps"):
+            _write_empty(xf, "server", {"version": settings.VERSION, "title": settings.APP_NAME})
+            _write_empty(xf, "limits", {"max": "1000", "default": "100"})
+            with xf.element("searching"):
+                _write_empty(xf, "search", {"available": "yes", "supportedParams": "q"})
+                _write_empty(xf, "tv-search", {"available": "yes", "supportedParams": "q,season,ep"})
+                _write_empty(xf, "movie-search", {"available": "no", "supportedParams": "q"})
+            with xf.element("categories"):
+                for cat_id, name, subcats in TV_CATEGORIES:
+                    with xf.element("category", {"id": str(cat_id), "name": name}):
+                        for sub_id, sub_name in subcats:
+                            _write_empty(xf, "subcat", {"id": str(sub_id), "name": sub_name})
+    return sink.drain()
+
+
+def render_error(code: int, description: str) -> bytes:
+    """
+    生成 Torznab 错误响应
+
+    Args:
+        code: Torznab 错误码
+        description: 错误描述
+
+    Returns:
+        XML 字节串
+    """
+    sink = _ChunkSink()
+    with etree.xmlfile(sink, encoding="utf-8") as xf:
+        xf.write_declaration()
+        _write_empty(xf, "error", {"code": str(code), "description": description})
+    return sink.drain()
@@ -3,9 +3,11 @@
 导出公共工具。
 """
 
-from .response import success_response, error_response
+from .response import success_response, error_response, json_response, FastJSONResponse
 
 __all__ = [
     "success_response",
     "error_response",
+    "json_response",
+    "FastJSONResponse",
 ]
@@ -6,7 +6,6 @@ import json
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import crud_config
 from app.utils.encryption import encryption_manager
 
 
@@ -32,6 +31,22 @@ def mask_api_key(value: Optional[str]) -> Optional[str]:
     return f"{prefix}{'*' * middle_len}{suffix}"
 
 
+def api_key_fields(value: Optional[str]) -> Dict[str, Any]:
+    """
+    根据明文 API Key 计算随密文一起存储的掩码与长度（写入时计算一次，读取时无需解密）
+
+    Args:
+        value: 明文 API Key
+
+    Returns:
+        {"api_key_masked": 掩码, "api_key_length": 明文长度}，值为空时均为 None
+    """
+    return {
+        "api_key_masked": mask_api_key(value),
+        "api_key_length": len(value) if value else None,
+    }
+
+
 def parse_extra_config(extra_config_str: Optional[str]) -> Optional[Dict[str, Any]]:
     """
     安全地解析 extra_config JSON 字符串
@@ -76,14 +91,64 @@ def decrypt_if_present(value: Optional[str]) -> Optional[str]:
     return encryption_manager.decrypt(value) if value else None
 
 
-async def get_active_proxy_config(db: AsyncSession) -> Optional[Dict[str, str]]:
+async def aencrypt_if_present(value: Optional[str]) -> Optional[str]:
+    """
+    encrypt_if_present 的异步版本（在加密线程池中执行）
+    
+    Args:
+        value: 待加密的字符串
+        
+    Returns:
+        加密后的字符串或 None
+    """
+    return await encryption_manager.aencrypt(value) if value else None
+
+
+async def adecrypt_if_present(value: Optional[str]) -> Optional[str]:
+    """
+    decrypt_if_present 的异步版本（在加密线程池中执行）
+    
+    Args:
+        value: 待解密的字符串
+        
+    Returns:
+        解密后的字符串或 None
     """
-    读取启用中的 proxy 类型 ServiceConfig，构造 httpx proxies。
+    return await encryption_manager.adecrypt(value) if value else None
+
+
+def build_proxy_config(url: Optional[str], extra: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """
+    由 proxy 类型 ServiceConfig 的 url 与 extra_config 构造 httpx proxies。
     
     优先使用 extra_config.http / extra_config.https；
     若缺失且 url 为完整代理URL，则回填到 http/https 两个协议。
     若存在 socks5 字段，可同时回填 http/https。
     
+    Args:
+        url: 代理服务配置的 url
+        extra: 解析后的 extra_config
+        
+    Returns:
+        httpx proxies 格式的字典，如 {"http://": "...", "https://": "..."}，无法构造时返回 None
+    """
+    extra = extra or {}
+    proxies: Dict[str, str] = {}
+    if extra.get("http"):
+        proxies["http://"] = extra["http"]
+    if extra.get("https"):
+        proxies["https://"] = extra["https"]
+    if not proxies and extra.get("socks5"):
+        proxies = {"http://": extra["socks5"], "https://": extra["socks5"]}
+    if not proxies and url and "://" in url:
+        proxies = {"http://": url, "https://": url}
+    return proxies or None
+
+
+async def get_active_proxy_config(db: AsyncSession) -> Optional[Dict[str, str]]:
+    """
+    读取启用中的 proxy 类型 ServiceConfig 对应的 httpx proxies（来自配置快照，不重复查库与解析）
+    
     Args:
         db: 数据库会话
         
@@ -91,27 +156,13 @@ async def get_active_proxy_config(db: AsyncSession) -> Optional[Dict[str, str]]:
         httpx proxies 格式的字典，如 {"http://": "...", "https://": "..."}
         若未配置或加载失败则返回 None
     """
+    from app.services.config_snapshot import config_snapshots
+
     try:
-        items = await crud_config.get_service_configs(db, service_name="proxy", is_active=True)
-        if not items:
-            return None
-        svc = items[0]
-        proxies: Dict[str, str] = {}
-        
-        extra = parse_extra_config(getattr(svc, "extra_config", None)) or {}
-        
-        if extra.get("http"):
-            proxies["http://"] = extra["http"]
-        if extra.get("https"):
-            proxies["https://"] = extra["https"]
-        if not proxies and extra.get("socks5"):
-            proxies = {"http://": extra["socks5"], "https://": extra["socks5"]}
-        if not proxies and getattr(svc, "url", None) and "://" in svc.url:
-            proxies = {"http://": svc.url, "https://": svc.url}
-        
-        return proxies or None
+        snapshot = await config_snapshots.get(db)
     except Exception:
         return None
+    return dict(snapshot.proxy) if snapshot.proxy else None
 
 
 def normalize_proxy_dict(proxy: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
@@ -3,16 +3,42 @@
 """
 
 import base64
+from functools import lru_cache
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Optional
+
+from app.core.config import settings
+from app.core.executor import run_crypto
 
 # 使用内置类型作为别名，避免从 typing 导入内置类型
 String = str
 Bytes = bytes
 
-from app.core.config import settings
+
+@lru_cache(maxsize=8)
+def _derive_fernet(password: Bytes, salt: Bytes) -> Fernet:
+    """
+    按 (password, salt) 派生并缓存 Fernet 实例
+
+    PBKDF2 迭代 100,000 次，单次派生耗时在数十毫秒量级；
+    同一组参数派生出的密钥恒定，因此进程内只需计算一次。
+
+    Args:
+        password: 加密密码
+        salt: 盐值
+
+    Returns:
+        Fernet: 可复用的 Fernet 实例
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    key = base64.urlsafe_b64encode(kdf.derive(password))
+    return Fernet(key)
 
 
 class EncryptionManager:
@@ -31,21 +57,14 @@ class EncryptionManager:
         self._password = password.encode()
         self._salt = b'queqiao-arr-salt'  # 在生产环境中应该使用随机salt
         
-    def _get_key(self) -> Bytes:
+    def _get_fernet(self) -> Fernet:
         """
-        生成加密密钥
+        获取（缓存的）Fernet 实例
         
         Returns:
-            bytes: 加密密钥
+            Fernet: 基于当前密码与盐值派生的 Fernet 实例
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self._salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(self._password))
-        return key
+        return _derive_fernet(self._password, self._salt)
     
     def encrypt(self, data: String) -> String:
         """
@@ -60,8 +79,7 @@ class EncryptionManager:
         if not data:
             return data
         
-        key = self._get_key()
-        f = Fernet(key)
+        f = self._get_fernet()
         encrypted_data = f.encrypt(data.encode())
         return base64.urlsafe_b64encode(encrypted_data).decode()
     
@@ -79,13 +97,20 @@ class EncryptionManager:
             return encrypted_data
         
         try:
-            key = self._get_key()
-            f = Fernet(key)
+            f = self._get_fernet()
             decoded_data = base64.urlsafe_b64decode(encrypted_data.encode())
             decrypted_data = f.decrypt(decoded_data)
             return decrypted_data.decode()
         except Exception as e:
             raise ValueError(f"解密失败: {str(e)}")
+    
+    async def aencrypt(self, data: String) -> String:
+        """在加密线程池中加密字符串（参数同 encrypt）"""
+        return await run_crypto(self.encrypt, data)
+    
+    async def adecrypt(self, encrypted_data: String) -> String:
+        """在加密线程池中解密字符串（参数同 decrypt）"""
+        return await run_crypto(self.decrypt, encrypted_data)
 
 
 # 全局加密管理器实例
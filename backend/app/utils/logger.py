@@ -1,13 +1,201 @@
 """
 日志配置工具
+文件日志经有界队列交给后台线程写入（含轮转与压缩），请求处理中记录日志只做一次入队
 """
 
+import atexit
+import json
+import queue
 import sys
+import threading
+import time
+import traceback
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
 from loguru import logger
 
 from app.core.config import settings
 
+# 后台线程写文件时附加的标记（取值为所属队列 sink 的标识）：文件 sink 只接收本队列的记录，其余 sink 忽略它们
+_FILE_WRITER_MARK = "_file_writer"
+
+_STOP = object()
+
+
+def _is_app_record(record: Dict[str, Any]) -> bool:
+    return _FILE_WRITER_MARK not in record["extra"]
+
+
+class QueuedLogSink:
+    """有界队列日志 sink：调用方只提取记录字段并入队，格式化与磁盘写入由后台线程完成"""
+
+    def __init__(self, maxsize: int, fmt: str = "text"):
+        """
+        初始化队列 sink
+
+        Args:
+            maxsize: 队列容量，写满后丢弃新记录并计数
+            fmt: 输出格式（text 为文本行，json 为 JSON Lines）
+        """
+        self.format = "json" if fmt == "json" else "text"
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, maxsize))
+        self._thread: Optional[threading.Thread] = None
+        self._writer = logger.bind(**{_FILE_WRITER_MARK: id(self)}).opt(raw=True)
+        self._consumers: List[Callable[[Dict[str, Any]], None]] = []
+        self._stats = {"enqueued": 0, "written": 0, "dropped": 0, "errors": 0}
+
+    def __call__(self, message) -> None:
+        """loguru sink 入口（在记录日志的线程中执行，不做格式化与 I/O）"""
+        record = message.record
+        entry = {
+            "time": record["time"],
+            "level": record["level"].name,
+            "name": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+            "message": record["message"],
+            "extra": dict(record["extra"]),
+            "exception": record["exception"],
+        }
+        try:
+            self._queue.put_nowait(entry)
+            self._stats["enqueued"] += 1
+        except queue.Full:
+            self._stats["dropped"] += 1
+
+    def add_consumer(self, consumer: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        注册结构化记录的消费者（在后台写入线程中调用，需自行保证线程安全且不阻塞）
+
+        Args:
+            consumer: 接收 to_dict 结果的回调
+        """
+        if consumer not in self._consumers:
+            self._consumers.append(consumer)
+
+    def remove_consumer(self, consumer: Callable[[Dict[str, Any]], None]) -> None:
+        """注销消费者"""
+        if consumer in self._consumers:
+            self._consumers.remove(consumer)
+
+    def accepts(self, record: Dict[str, Any]) -> bool:
+        """文件 sink 的过滤器：只接收本队列后台线程写出的记录"""
+        return record["extra"].get(_FILE_WRITER_MARK) == id(self)
+
+    @staticmethod
+    def to_dict(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        将队列中的记录转换为可 JSON 序列化的结构
+
+        Args:
+            entry: 队列中的记录
+
+        Returns:
+            包含 time/level/name/function/line/message/extra/exception 的字典
+        """
+        exception = entry["exception"]
+        return {
+            "time": entry["time"].isoformat(),
+            "level": entry["level"],
+            "name": entry["name"],
+            "function": entry["function"],
+            "line": entry["line"],
+            "message": entry["message"],
+            "extra": entry["extra"],
+            "exception": "".join(traceback.format_exception(*exception)) if exception else None,
+        }
+
+    def render(self, entry: Dict[str, Any]) -> str:
+        """
+        格式化一条记录（不含换行）
+
+        Args:
+            entry: 队列中的记录
+
+        Returns:
+            文本行或 JSON 字符串
+        """
+        return self._format(entry, self.to_dict(entry))
+
+    def _format(self, entry: Dict[str, Any], data: Dict[str, Any]) -> str:
+        if self.format == "json":
+            return json.dumps(data, ensure_ascii=False, default=str)
+        line = (
+            f"{entry['time']:%Y-%m-%d %H:%M:%S} | {data['level']: <8} | "
+            f"{data['name']}:{data['function']}:{data['line']} - {data['message']}"
+        )
+        if data["exception"]:
+            line = f"{line}\n{data['exception'].rstrip()}"
+        return line
+
+    def start(self) -> None:
+        """启动后台写入线程"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is _STOP:
+                    return
+                data = self.to_dict(entry)
+                self._writer.log(entry["level"], self._format(entry, data) + "\n")
+                self._stats["written"] += 1
+                for consumer in list(self._consumers):
+                    consumer(data)
+            except Exception:
+                self._stats["errors"] += 1
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        等待队列中的记录写完
+
+        Args:
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            是否在超时前写完
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline or self._thread is None or not self._thread.is_alive():
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """写完剩余记录并停止后台线程"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取队列统计
+
+        Returns:
+            当前排队数、容量、累计入队/写入/丢弃/写入失败次数与输出格式
+        """
+        return {
+            **self._stats,
+            "queued": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "format": self.format,
+        }
+
+
+# 文件日志队列 sink
+log_sink = QueuedLogSink(maxsize=settings.LOG_QUEUE_SIZE, fmt=settings.LOG_FORMAT)
+
 
 def setup_logger():
     """
@@ -15,7 +203,7 @@ def setup_logger():
     """
     # 移除默认的logger配置
     logger.remove()
-    
+
     # 控制台日志配置
     logger.add(
         sys.stdout,
@@ -25,24 +213,34 @@ def setup_logger():
                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
                "<level>{message}</level>",
         colorize=True,
+        filter=_is_app_record,
     )
-    
-    # 文件日志配置
+
+    # 文件日志配置：应用日志先进入队列，由后台线程经下面的文件 sink 写入（轮转与压缩也在后台线程）
     log_file = Path(settings.LOG_FILE)
     log_file.parent.mkdir(parents=True, exist_ok=True)
-    
+
     logger.add(
-        log_file,
+        log_sink,
         level=settings.LOG_LEVEL,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        filter=_is_app_record,
+        catch=False,
+    )
+    logger.add(
+        log_file,
+        level=0,
+        format="{message}",
+        filter=log_sink.accepts,
         rotation=settings.LOG_ROTATION,
         retention=settings.LOG_RETENTION,
         compression="zip",
         encoding="utf-8",
     )
-    
+    log_sink.start()
+
     return logger
 
 
 # 创建全局logger实例
 app_logger = setup_logger()
+atexit.register(log_sink.stop)
@@ -0,0 +1,50 @@
+"""
+游标（keyset）分页工具
+游标为排序键取值的 URL 安全 base64 编码，对客户端不透明
+"""
+
+import base64
+import json
+from typing import Sequence, Tuple
+
+
+def encode_cursor(values: Sequence[int]) -> str:
+    """
+    将排序键编码为游标
+
+    Args:
+        values: 最后一条记录的排序键（如 (sort_order, id)）
+
+    Returns:
+        游标字符串
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> Tuple[int, ...]:
+    """
+    解码游标
+
+    Args:
+        cursor: 游标字符串
+        size: 排序键的列数
+
+    Returns:
+        排序键取值
+
+    Raises:
+        ValueError: 游标格式错误
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("无效的分页游标") from e
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(isinstance(v, int) and not isinstance(v, bool) for v in values)
+    ):
+        raise ValueError("无效的分页游标")
+    return tuple(values)
@@ -1,7 +1,19 @@
 """统一响应封装工具"""
 
+from decimal import Decimal
 from typing import Any, Optional, Dict
 
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库 json
+    orjson = None
+
 
 def success_response(data: Optional[Any] = None, message: str = "OK", code: int = 200) -> Dict[str, Any]:
     """
@@ -25,3 +37,47 @@ def error_response(message: str, code: int, data: Optional[Any] = None) -> Dict[
     }
 
 
+def orjson_enabled() -> bool:
+    """是否使用 orjson 序列化响应（ORJSON_RESPONSE 开启且已安装 orjson）"""
+    return orjson is not None and settings.ORJSON_RESPONSE
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson 不支持的类型：Pydantic 模型、集合与 Decimal"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON 响应：优先使用 orjson 直接序列化 dict、datetime 与 Pydantic 模型，
+    否则先经 jsonable_encoder 再使用标准库 json（输出一致）
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson_enabled():
+            return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(jsonable_encoder(content))
+
+
+def json_response(data: Optional[Any] = None, message: str = "OK", code: int = 200) -> FastJSONResponse:
+    """
+    构建统一成功响应并直接返回响应对象
+
+    data 中可直接包含 Pydantic 模型与 datetime，不经过 FastAPI 的 jsonable_encoder，
+    用于列表类等数据量较大的接口。
+
+    Args:
+        data: 响应数据
+        message: 响应消息
+        code: 业务码
+
+    Returns:
+        JSON 响应
+    """
+    return FastJSONResponse(success_response(data, message=message, code=code))
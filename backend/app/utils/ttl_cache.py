@@ -0,0 +1,78 @@
+"""
+进程内 TTL 缓存
+有界 LRU + TTL 的内存缓存，不依赖应用其他模块，供 core/db/services 各层共用
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+# 缓存未命中的哨兵值（区分缓存的 None 与未命中）
+MISSING = object()
+
+
+class TTLCache:
+    """有界的 LRU 缓存，条目按 TTL 过期"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        初始化缓存
+
+        Args:
+            maxsize: 最大条目数，超出时淘汰最久未使用的条目
+            ttl: 条目存活时间（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        """
+        读取缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存值，未命中或已过期返回 MISSING
+        """
+        item = self._data.get(key)
+        if item is None:
+            return MISSING
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+            ttl: 自定义存活时间（秒），默认使用实例 TTL
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """
+        删除缓存项
+
+        Args:
+            key: 缓存键
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,59 @@
+"""
+EncryptionManager 加解密微基准
+
+对比每次调用都重新执行 PBKDF2 派生密钥（旧实现）与复用缓存 Fernet 实例（当前实现）
+的单次 encrypt/decrypt 耗时。
+
+用法（在 backend 目录下）:
+    python -m benchmarks.bench_encryption [--rounds 20]
+"""
+
+import argparse
+import base64
+import time
+
+from app.utils.encryption import EncryptionManager, _derive_fernet
+
+
+def _measure(func, rounds: int) -> float:
+    """返回单次调用的平均耗时（微秒）"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EncryptionManager 加解密微基准")
+    parser.add_argument("--rounds", type=int, default=20, help="每项测量的调用次数")
+    args = parser.parse_args()
+
+    manager = EncryptionManager(password="bench-secret")
+    plaintext = "0123456789abcdef0123456789abcdef"
+    token = manager.encrypt(plaintext)
+
+    # 旧实现：每次调用都完整执行一次 PBKDF2
+    uncached = _derive_fernet.__wrapped__
+
+    def encrypt_uncached():
+        f = uncached(manager._password, manager._salt)
+        f.encrypt(plaintext.encode())
+
+    def decrypt_uncached():
+        f = uncached(manager._password, manager._salt)
+        f.decrypt(base64.urlsafe_b64decode(token.encode()))
+
+    results = [
+        ("encrypt（每次派生）", _measure(encrypt_uncached, args.rounds)),
+        ("decrypt（每次派生）", _measure(decrypt_uncached, args.rounds)),
+        ("encrypt（缓存密钥）", _measure(lambda: manager.encrypt(plaintext), args.rounds * 100)),
+        ("decrypt（缓存密钥）", _measure(lambda: manager.decrypt(token), args.rounds * 100)),
+    ]
+
+    print(f"{'场景':<20}{'单次耗时(us)':>16}")
+    for name, cost in results:
+        print(f"{name:<20}{cost:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+JSON 响应序列化基准
+
+对比配置概览（/config/）与字典项列表（/dict/items）响应的两种序列化路径：
+- 标准库：model_dump() + 手动 isoformat() 得到 dict，再经 jsonable_encoder 与 json.dumps（旧实现）
+- orjson：FastJSONResponse 直接序列化包含 Pydantic 模型与 datetime 的统一响应（当前实现）
+
+用法（在 backend 目录下）:
+    python -m benchmarks.bench_json_response [--rows 200] [--rounds 200]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.schemas.config import KVConfigOut, ServiceConfigOut
+from app.api.schemas.system_dict import DictItemListResponse, DictItemOut
+from app.utils.response import FastJSONResponse, orjson_enabled, success_response
+
+
+def _config_models(rows: int):
+    now = datetime(2026, 10, 18, 12, 0, 0)
+    services = [
+        ServiceConfigOut(
+            id=i,
+            service_name="sonarr",
+            service_type="api",
+            name=f"Sonarr {i}",
+            url=f"http://127.0.0.1:{8000 + i}",
+            api_key_masked="abcd************wxyz",
+            api_key_length=32,
+            username=None,
+            is_active=True,
+            extra_config={"timeout": 3000, "use_proxy": i % 2 == 0},
+            created_at=now,
+            updated_at=now + timedelta(seconds=i),
+        )
+        for i in range(rows)
+    ]
+    kv = [
+        KVConfigOut(
+            id=i, key=f"key_{i}", value=f"值 {i}", has_value=None, is_encrypted=False,
+            is_active=True, created_at=now, updated_at=now,
+        )
+        for i in range(rows)
+    ]
+    return services, kv
+
+
+def _dict_models(rows: int) -> DictItemListResponse:
+    now = datetime(2026, 10, 18, 12, 0, 0)
+    items = [
+        DictItemOut(
+            id=i,
+            dict_type_code="anime_alias",
+            code=f"alias_{i}",
+            name=f"番剧别名 {i}",
+            value=f"Anime Title {i}",
+            sort_order=i,
+            remark=None,
+            is_active=True,
+            extra_data=json.dumps({"tmdb_id": 1000 + i}),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(rows)
+    ]
+    return DictItemListResponse(items=items, total=rows * 10, page=1, page_size=rows)
+
+
+def _std_config(services, kv) -> bytes:
+    def dump(model):
+        data = model.model_dump()
+        data["created_at"] = model.created_at.isoformat()
+        data["updated_at"] = model.updated_at.isoformat()
+        return data
+
+    content = success_response({"services": [dump(s) for s in services], "kv": [dump(c) for c in kv]})
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _std_dict(listing) -> bytes:
+    return JSONResponse(jsonable_encoder(success_response(listing.model_dump()))).body
+
+
+def _measure(func: Callable[[], bytes], rounds: int) -> float:
+    """返回每秒完成的序列化次数"""
+    func()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return rounds / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON 响应序列化基准")
+    parser.add_argument("--rows", type=int, default=200, help="每个响应中的记录数")
+    parser.add_argument("--rounds", type=int, default=200, help="每项测量的序列化次数")
+    args = parser.parse_args()
+
+    if not orjson_enabled():
+        print("未安装 orjson 或 ORJSON_RESPONSE=false，FastJSONResponse 将回退到标准库")
+
+    services, kv = _config_models(args.rows)
+    listing = _dict_models(args.rows)
+    cases = [
+        (
+            f"/config/ ({args.rows} 服务 + {args.rows} KV)",
+            lambda: _std_config(services, kv),
+            lambda: FastJSONResponse(success_response({"services": services, "kv": kv})).body,
+        ),
+        (
+            f"/dict/items ({args.rows} 项)",
+            lambda: _std_dict(listing),
+            lambda: FastJSONResponse(success_response(listing)).body,
+        ),
+    ]
+
+    print(f"{'响应':<32}{'标准库(次/秒)':>14}{'orjson(次/秒)':>16}{'加速':>8}")
+    for name, std, fast in cases:
+        assert json.loads(std()) == json.loads(fast()), f"{name} 两种路径输出不一致"
+        std_rate = _measure(std, args.rounds)
+        fast_rate = _measure(fast, args.rounds)
+        print(f"{name:<32}{std_rate:>14.0f}{fast_rate:>16.0f}{fast_rate / std_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+登录风暴下的事件循环响应基准
+
+并发发起大量登录请求（每次 bcrypt 校验），同时持续请求 /health/ping，
+统计 ping 的 p50/p99 延迟以及相邻两次 ping 完成之间的最大间隔（反映事件循环被阻塞的最长时间）。分别测量 bcrypt 在事件循环中内联执行（旧实现）
+与交给加密线程池执行（当前实现）两种情况。使用临时 SQLite 数据库，不影响现有数据。
+
+用法（在 backend 目录下）:
+    python -m benchmarks.bench_login_storm [--logins 40] [--interval 0.005]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import Executor, Future
+from typing import List, Tuple
+
+_tmpdir = tempfile.mkdtemp(prefix="queqiao-bench-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmpdir}/bench.db"
+
+import httpx  # noqa: E402
+
+from app.core import executor as crypto  # noqa: E402
+from app.db.crud_user import create_user  # noqa: E402
+from app.db.database import AsyncSessionLocal, create_tables  # noqa: E402
+from app.main import app  # noqa: E402
+
+USERNAME = "storm"
+PASSWORD = "P@ssw0rd"
+
+
+class _InlineExecutor(Executor):
+    """在调用线程（即事件循环线程）中同步执行，模拟未使用线程池时的行为"""
+
+    def submit(self, fn, *args, **kwargs):
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def storm(client: httpx.AsyncClient, logins: int, interval: float) -> Tuple[List[float], float]:
+    """
+    并发登录的同时循环 ping
+
+    Returns:
+        (ping 延迟列表, 相邻 ping 完成的最大间隔)，单位秒
+    """
+    latencies: List[float] = []
+    finished: List[float] = []
+    done = asyncio.Event()
+
+    async def pinger():
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.get("/api/v1/health/ping")
+            finished.append(time.perf_counter())
+            latencies.append(finished[-1] - start)
+            await asyncio.sleep(interval)
+
+    async def login():
+        resp = await client.post("/api/v1/auth/login", json={"username": USERNAME, "password": PASSWORD})
+        assert resp.status_code == 200, resp.text
+
+    ping_task = asyncio.create_task(pinger())
+    await asyncio.sleep(interval * 4)
+    await asyncio.gather(*(login() for _ in range(logins)))
+    done.set()
+    await ping_task
+    max_gap = max((b - a for a, b in zip(finished, finished[1:])), default=0.0)
+    return latencies, max_gap
+
+
+async def run(logins: int, interval: float) -> None:
+    await create_tables()
+    async with AsyncSessionLocal() as db:
+        await create_user(db, username=USERNAME, password=PASSWORD)
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+        print(f"并发登录: {logins}，ping 间隔: {interval * 1000:.0f}ms")
+        print(f"{'模式':<16}{'ping次数':>10}{'p50(ms)':>10}{'p99(ms)':>10}{'最大间隔(ms)':>14}{'总耗时(s)':>12}")
+        for name, executor in (("内联 bcrypt", _InlineExecutor()), ("加密线程池", None)):
+            crypto.shutdown_crypto_executor()
+            crypto._crypto_executor = executor
+            start = time.perf_counter()
+            latencies, max_gap = await storm(client, logins, interval)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:<16}{len(latencies):>10}"
+                f"{statistics.median(latencies) * 1000:>10.1f}"
+                f"{_percentile(latencies, 99) * 1000:>10.1f}"
+                f"{max_gap * 1000:>14.1f}"
+                f"{elapsed:>12.2f}"
+            )
+        crypto.shutdown_crypto_executor()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="登录风暴下的 /health/ping 延迟基准")
+    parser.add_argument("--logins", type=int, default=40, help="并发登录请求数")
+    parser.add_argument("--interval", type=float, default=0.005, help="ping 间隔（秒）")
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+标题解析器基准
+
+基于标注语料（benchmarks/data/parser_corpus.jsonl）报告解析吞吐（标题/秒）与准确率。
+冷启动吞吐关闭记忆化，反映规则本身的开销；热吞吐为重复标题命中记忆化后的开销。
+可通过 --min-rate / --min-accuracy 设定门槛，不达标时以非零状态退出，防止规则修改悄悄拖慢或改坏解析。
+
+用法（在 backend 目录下）:
+    python -m benchmarks.bench_parser [--repeat 200] [--min-rate 20000] [--min-accuracy 1.0]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from app.services.parser import BUILTIN_RULES, RuleSet
+
+CORPUS_PATH = Path(__file__).parent / "data" / "parser_corpus.jsonl"
+
+# 参与准确率比对的字段（语料中未列出的字段期望为 None）
+FIELDS = ("name", "season", "episode", "episode_end", "resolution")
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> List[Dict]:
+    """读取标注语料"""
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evaluate(ruleset: RuleSet, corpus: List[Dict]) -> Dict:
+    """
+    计算准确率
+
+    Returns:
+        整体准确率、各字段准确率与失败样例
+    """
+    field_hits = {field: 0 for field in FIELDS}
+    failures = []
+    for case in corpus:
+        result = ruleset.parse(case["title"])
+        expected = case["expected"]
+        wrong = {}
+        for field in FIELDS:
+            actual, want = getattr(result, field), expected.get(field)
+            if actual == want:
+                field_hits[field] += 1
+            else:
+                wrong[field] = {"actual": actual, "expected": want}
+        if wrong:
+            failures.append({"title": case["title"], "fields": wrong})
+    total = len(corpus)
+    return {
+        "accuracy": (total - len(failures)) / total if total else 0.0,
+        "fields": {field: hits / total for field, hits in field_hits.items()},
+        "failures": failures,
+    }
+
+
+def throughput(ruleset: RuleSet, titles: List[str]) -> float:
+    """返回 parse_many 的吞吐（标题/秒）"""
+    start = time.perf_counter()
+    ruleset.parse_many(titles)
+    return len(titles) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="标题解析器基准")
+    parser.add_argument("--repeat", type=int, default=200, help="吞吐测量时语料的重复次数")
+    parser.add_argument("--min-rate", type=float, default=0.0, help="冷启动吞吐下限（标题/秒）")
+    parser.add_argument("--min-accuracy", type=float, default=0.0, help="整体准确率下限（0~1）")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    titles = [case["title"] for case in corpus] * args.repeat
+
+    report = evaluate(RuleSet(BUILTIN_RULES, cache_size=0), corpus)
+    cold = throughput(RuleSet(BUILTIN_RULES, cache_size=0), titles)
+    warm_ruleset = RuleSet(BUILTIN_RULES, cache_size=len(corpus))
+    warm_ruleset.parse_many(titles[: len(corpus)])
+    warm = throughput(warm_ruleset, titles)
+
+    print(f"语料条数: {len(corpus)}，吞吐测量标题数: {len(titles)}")
+    print(f"{'冷启动吞吐（无记忆化）':<24}{cold:>14,.0f} 标题/秒")
+    print(f"{'热吞吐（记忆化命中）':<24}{warm:>14,.0f} 标题/秒")
+    print(f"{'整体准确率':<24}{report['accuracy']:>14.2%}")
+    for field, ratio in report["fields"].items():
+        print(f"  {field:<22}{ratio:>14.2%}")
+    for failure in report["failures"]:
+        print(f"  ✗ {failure['title']}: {failure['fields']}")
+
+    failed = []
+    if cold < args.min_rate:
+        failed.append(f"冷启动吞吐 {cold:,.0f} 低于门槛 {args.min_rate:,.0f}")
+    if report["accuracy"] < args.min_accuracy:
+        failed.append(f"准确率 {report['accuracy']:.2%} 低于门槛 {args.min_accuracy:.2%}")
+    if failed:
+        print("\n".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+批量解析进程池基准
+
+对不同批次大小分别测量内联解析与进程池解析的总耗时，以及解析期间事件循环的最大停顿
+（由一个每 1ms 唤醒一次的探针协程测得），输出总耗时与事件循环停顿两个交叉点，用于设定 PARSER_POOL_THRESHOLD。
+标题由语料变换集数生成，保证互不相同，避免记忆化干扰。
+
+用法（在 backend 目录下）:
+    python -m benchmarks.bench_parser_pool [--workers 2] [--sizes 250,500,1000,2000,5000,10000] [--stall-budget 50]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Tuple
+
+from app.services.parser import ParserPool
+from benchmarks.bench_parser import load_corpus
+
+
+def make_titles(count: int, salt: str = "") -> List[str]:
+    """由语料生成 count 条互不相同的标题（不同 salt 生成的标题也互不相同）"""
+    corpus = [case["title"] for case in load_corpus()]
+    return [f"{corpus[i % len(corpus)]} [{salt}{i}]" for i in range(count)]
+
+
+async def measure(pool: ParserPool, titles: List[str]) -> Tuple[float, float]:
+    """
+    返回 (总耗时秒, 事件循环最大停顿秒)
+    """
+    stalls = [0.0]
+    done = asyncio.Event()
+
+    async def probe():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls[0] = max(stalls[0], now - last)
+            last = now
+
+    probe_task = asyncio.create_task(probe())
+    await asyncio.sleep(0.005)
+    start = time.perf_counter()
+    await pool.parse_many(titles)
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+    return elapsed, stalls[0]
+
+
+async def run(workers: int, sizes: List[int], chunk_size: int, stall_budget: float) -> None:
+    inline = ParserPool(max_workers=0)
+    pooled = ParserPool(max_workers=workers, threshold=1, chunk_size=chunk_size)
+    # 预热子进程（进程启动与规则编译为一次性开销，不计入）
+    await pooled.parse_many(make_titles(workers * chunk_size, salt="warmup-"))
+
+    print(f"CPU: {os.cpu_count()}，子进程: {workers}，分块: {chunk_size}")
+    print(f"{'批次':>8}{'内联(ms)':>12}{'内联停顿(ms)':>14}{'进程池(ms)':>12}{'进程池停顿(ms)':>16}")
+    rows = []
+    for size in sizes:
+        inline_time, inline_stall = await measure(inline, make_titles(size, salt=f"inline-{size}-"))
+        pool_time, pool_stall = await measure(pooled, make_titles(size, salt=f"pool-{size}-"))
+        print(
+            f"{size:>8}{inline_time * 1000:>12.1f}{inline_stall * 1000:>14.1f}"
+            f"{pool_time * 1000:>12.1f}{pool_stall * 1000:>16.1f}"
+        )
+        rows.append((size, inline_time, inline_stall, pool_time))
+    pooled.shutdown()
+
+    # 交叉点：从该批次起（含更大批次）进程池总耗时均不高于内联解析
+    crossover = None
+    for size, inline_time, _, pool_time in reversed(rows):
+        if pool_time > inline_time:
+            break
+        crossover = size
+    if crossover is None:
+        print("总耗时交叉点: 测试范围内进程池未稳定快于内联解析（单核或批次过小）")
+    else:
+        print(f"总耗时交叉点: 批次 >= {crossover} 时进程池总耗时不高于内联解析")
+
+    # 停顿交叉点：内联解析导致的事件循环停顿超过预算的最小批次
+    over_budget = [size for size, _, inline_stall, _ in rows if inline_stall * 1000 > stall_budget]
+    if over_budget:
+        print(f"停顿交叉点: 批次 >= {over_budget[0]} 时内联解析停顿超过 {stall_budget:.0f}ms，建议以此设定 PARSER_POOL_THRESHOLD")
+    else:
+        print(f"停顿交叉点: 测试范围内内联解析停顿均未超过 {stall_budget:.0f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="批量解析进程池基准")
+    parser.add_argument("--workers", type=int, default=2, help="子进程数")
+    parser.add_argument("--chunk-size", type=int, default=500, help="分块大小")
+    parser.add_argument("--sizes", default="250,500,1000,2000,5000,10000", help="批次大小列表，逗号分隔")
+    parser.add_argument("--stall-budget", type=float, default=50.0, help="可接受的事件循环停顿（毫秒）")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    asyncio.run(run(args.workers, sizes, args.chunk_size, args.stall_budget))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Alembic 迁移环境
+
+应用启动时由 app.db.migrate 传入已打开的连接（config.attributes["connection"]）；
+直接执行 alembic 命令时按 DATABASE_URL 创建异步引擎。
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.database import Base
+from app.db.sqlite import install_pragmas
+import app.models  # noqa: F401  注册全部模型
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def _render_as_batch(connection: Connection) -> bool:
+    """SQLite 不支持大部分 ALTER TABLE，需使用 batch 模式重建表"""
+    return connection.dialect.name == "sqlite"
+
+
+def run_migrations_offline() -> None:
+    """离线模式：仅输出 SQL"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """在给定连接上执行迁移"""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=_render_as_batch(connection),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """按 DATABASE_URL 创建临时异步引擎并执行迁移"""
+    connectable = create_async_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+    install_pragmas(connectable, settings.SQLITE_PRAGMA_PROFILE)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """在线模式：优先复用调用方传入的连接"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
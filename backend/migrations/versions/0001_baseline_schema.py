@@ -0,0 +1,119 @@
+"""基线表结构：用户、系统配置、服务配置、系统字典
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("username", sa.String(length=50), nullable=False),
+        sa.Column("email", sa.String(length=100), nullable=True),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_superuser", sa.Boolean(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id", name="pk_users"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "configurations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("key", sa.String(length=100), nullable=False),
+        sa.Column("value", sa.Text(), nullable=True),
+        sa.Column("description", sa.String(length=255), nullable=True),
+        sa.Column("is_encrypted", sa.Boolean(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id", name="pk_configurations"),
+    )
+    op.create_index("ix_configurations_id", "configurations", ["id"])
+    op.create_index("ix_configurations_key", "configurations", ["key"], unique=True)
+
+    op.create_table(
+        "service_configs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("service_name", sa.String(length=50), nullable=False),
+        sa.Column("service_type", sa.String(length=20), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("url", sa.String(length=255), nullable=False),
+        sa.Column("api_key", sa.Text(), nullable=True),
+        sa.Column("username", sa.String(length=100), nullable=True),
+        sa.Column("password", sa.Text(), nullable=True),
+        sa.Column("extra_config", sa.Text(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id", name="pk_service_configs"),
+    )
+    op.create_index("ix_service_configs_id", "service_configs", ["id"])
+
+    op.create_table(
+        "dict_types",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("code", sa.String(length=50), nullable=False, comment="类型编码（唯一）"),
+        sa.Column("name", sa.String(length=100), nullable=False, comment="类型名称"),
+        sa.Column("remark", sa.Text(), nullable=True, comment="备注说明"),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="是否启用"),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id", name="pk_dict_types"),
+    )
+    op.create_index("ix_dict_types_id", "dict_types", ["id"])
+    op.create_index("ix_dict_types_code", "dict_types", ["code"], unique=True)
+
+    op.create_table(
+        "dict_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("dict_type_code", sa.String(length=50), nullable=False, comment="字典类型编码"),
+        sa.Column("code", sa.String(length=50), nullable=False, comment="项编码"),
+        sa.Column("name", sa.String(length=100), nullable=False, comment="显示名称"),
+        sa.Column("value", sa.String(length=200), nullable=False, comment="实际值"),
+        sa.Column("sort_order", sa.Integer(), nullable=True, comment="排序（升序）"),
+        sa.Column("parent_id", sa.Integer(), nullable=True, comment="父项ID（层级）"),
+        sa.Column("remark", sa.Text(), nullable=True, comment="备注说明"),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="是否启用"),
+        sa.Column("extra_data", sa.Text(), nullable=True, comment="扩展数据（JSON）"),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(
+            ["dict_type_code"], ["dict_types.code"],
+            name="fk_dict_items_dict_type_code_dict_types", ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["parent_id"], ["dict_items.id"],
+            name="fk_dict_items_parent_id_dict_items", ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name="pk_dict_items"),
+        sa.UniqueConstraint("dict_type_code", "code", name="uq_dict_item_type_code"),
+    )
+    op.create_index("ix_dict_items_id", "dict_items", ["id"])
+    op.create_index("ix_dict_items_dict_type_code", "dict_items", ["dict_type_code"])
+    op.create_index("ix_dict_items_code", "dict_items", ["code"])
+
+
+def downgrade() -> None:
+    op.drop_table("dict_items")
+    op.drop_table("dict_types")
+    op.drop_table("service_configs")
+    op.drop_table("configurations")
+    op.drop_table("users")
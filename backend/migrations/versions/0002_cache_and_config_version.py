@@ -0,0 +1,45 @@
+"""外部接口响应缓存表与配置版本号表
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 引入迁移前的数据库已由 create_all 建好这两张表
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "api_cache" not in existing:
+        op.create_table(
+            "api_cache",
+            sa.Column("key", sa.String(length=64), nullable=False, comment="缓存键（SHA-256）"),
+            sa.Column("namespace", sa.String(length=50), nullable=False, comment="缓存命名空间，如 tmdb"),
+            sa.Column("value", sa.Text(), nullable=False, comment="响应数据（JSON）"),
+            sa.Column("expires_at", sa.Float(), nullable=False, comment="过期时间（Unix 时间戳）"),
+            sa.PrimaryKeyConstraint("key", name="pk_api_cache"),
+        )
+        op.create_index("ix_api_cache_namespace", "api_cache", ["namespace"])
+        op.create_index("ix_api_cache_expires_at", "api_cache", ["expires_at"])
+
+    if "config_version" not in existing:
+        op.create_table(
+            "config_version",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name="pk_config_version"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("config_version")
+    op.drop_table("api_cache")
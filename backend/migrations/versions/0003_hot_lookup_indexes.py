@@ -0,0 +1,35 @@
+"""配置与字典热点查询的复合索引
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_service_configs_service_name_is_active", "service_configs", ["service_name", "is_active"]),
+    ("ix_service_configs_service_name_name", "service_configs", ["service_name", "name"]),
+    ("ix_dict_items_type_active_order", "dict_items", ["dict_type_code", "is_active", "sort_order", "id"]),
+    ("ix_dict_items_type_order", "dict_items", ["dict_type_code", "sort_order", "id"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
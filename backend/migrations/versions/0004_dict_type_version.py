@@ -0,0 +1,36 @@
+"""字典类型版本号（选项树缓存失效）
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("dict_types")}
+    if "version" in columns:
+        return
+    op.add_column(
+        "dict_types",
+        sa.Column(
+            "version",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="版本号（类型或其字典项变更时递增，用于选项树缓存失效）",
+        ),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("dict_types") as batch_op:
+        batch_op.drop_column("version")
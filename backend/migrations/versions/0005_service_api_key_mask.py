@@ -0,0 +1,96 @@
+"""服务配置预先计算的 API Key 掩码与长度（含存量数据回填）
+
+迁移不引用应用内的加密与掩码实现：下面固定了本版本的密钥派生参数与掩码规则，
+之后应用代码变更也不会改变本迁移的行为；只依赖配置中的 SECRET_KEY。
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+import base64
+from typing import Optional
+
+from alembic import op
+import sqlalchemy as sa
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from app.core.config import settings
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# 本版本写入密文时使用的密钥派生参数
+_SALT = b"queqiao-arr-salt"
+_ITERATIONS = 100000
+
+
+def _fernet() -> Fernet:
+    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=_SALT, iterations=_ITERATIONS)
+    return Fernet(base64.urlsafe_b64encode(kdf.derive(settings.SECRET_KEY.encode())))
+
+
+def _decrypt(fernet: Fernet, ciphertext: str) -> Optional[str]:
+    """解密 API Key，密钥不匹配或数据损坏时返回 None"""
+    try:
+        return fernet.decrypt(base64.urlsafe_b64decode(ciphertext.encode())).decode()
+    except Exception:
+        return None
+
+
+def _mask(value: str) -> str:
+    """前后各4位可见、中间以*填充；长度<=8时全部遮蔽"""
+    if len(value) <= 8:
+        return "*" * len(value)
+    return f"{value[:4]}{'*' * (len(value) - 8)}{value[-4:]}"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    columns = {column["name"] for column in sa.inspect(bind).get_columns("service_configs")}
+    if "api_key_masked" not in columns:
+        op.add_column("service_configs", sa.Column("api_key_masked", sa.String(length=255), nullable=True))
+    if "api_key_length" not in columns:
+        op.add_column("service_configs", sa.Column("api_key_length", sa.Integer(), nullable=True))
+
+    # 回填存量数据：每行解密一次，之后配置概览不再解密
+    service_configs = sa.table(
+        "service_configs",
+        sa.column("id", sa.Integer),
+        sa.column("api_key", sa.Text),
+        sa.column("api_key_masked", sa.String),
+        sa.column("api_key_length", sa.Integer),
+    )
+    rows = bind.execute(
+        sa.select(service_configs.c.id, service_configs.c.api_key).where(
+            service_configs.c.api_key.isnot(None),
+            service_configs.c.api_key_masked.is_(None),
+        )
+    ).all()
+    if not rows:
+        return
+    fernet = _fernet()
+    for row_id, ciphertext in rows:
+        plaintext = _decrypt(fernet, ciphertext)
+        if plaintext is None:
+            print(f"⚠️  服务配置 {row_id} 的 API Key 无法解密（SECRET_KEY 已变更？），跳过掩码回填")
+            continue
+        bind.execute(
+            sa.update(service_configs)
+            .where(service_configs.c.id == row_id)
+            .values(
+                api_key_masked=_mask(plaintext) if plaintext else None,
+                api_key_length=len(plaintext) if plaintext else None,
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("service_configs") as batch_op:
+        batch_op.drop_column("api_key_length")
+        batch_op.drop_column("api_key_masked")
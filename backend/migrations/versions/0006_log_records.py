@@ -0,0 +1,36 @@
+"""日志记录表（日志查询接口）
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("log_records"):
+        return
+    op.create_table(
+        "log_records",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("timestamp", sa.Float(), nullable=False, comment="记录时间（Unix 时间戳）"),
+        sa.Column("level", sa.String(length=16), nullable=False, comment="日志级别"),
+        sa.Column("module", sa.String(length=255), nullable=True, comment="来源（模块:函数:行号）"),
+        sa.Column("message", sa.Text(), nullable=False, comment="日志内容"),
+        sa.Column("exception", sa.Text(), nullable=True, comment="异常堆栈"),
+        sa.PrimaryKeyConstraint("id", name="pk_log_records"),
+    )
+    op.create_index("ix_log_records_timestamp", "log_records", ["timestamp"])
+    op.create_index("ix_log_records_level_timestamp", "log_records", ["level", "timestamp"])
+
+
+def downgrade() -> None:
+    op.drop_table("log_records")
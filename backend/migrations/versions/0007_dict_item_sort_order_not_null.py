@@ -0,0 +1,42 @@
+"""字典项排序字段非空（游标分页按 (sort_order, id) 元组比较，NULL 会导致漏读）
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    columns = {column["name"]: column for column in sa.inspect(bind).get_columns("dict_items")}
+    if not columns["sort_order"]["nullable"]:
+        return
+    bind.execute(sa.text("UPDATE dict_items SET sort_order = 0 WHERE sort_order IS NULL"))
+    with op.batch_alter_table("dict_items") as batch_op:
+        batch_op.alter_column(
+            "sort_order",
+            existing_type=sa.Integer(),
+            nullable=False,
+            server_default="0",
+            existing_comment="排序（升序）",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("dict_items") as batch_op:
+        batch_op.alter_column(
+            "sort_order",
+            existing_type=sa.Integer(),
+            nullable=True,
+            server_default=None,
+            existing_comment="排序（升序）",
+        )
@@ -57,3 +57,60 @@ async def test_login_and_me():
         )
         assert me.status_code == 200
         assert me.json()["data"]["username"] == "admin"
+
+
+@pytest.mark.asyncio
+async def test_authenticated_user_cache(monkeypatch):
+    from app.core import security
+    from app.db import crud_user
+    from app.db.database import AsyncSessionLocal
+    from app.services.auth_cache import user_cache
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        await drop_tables(); await create_tables()
+        user_cache.clear()
+        r = await ac.post("/api/v1/auth/register", json={"username": "cacheadmin", "password": "P@ssw0rd"})
+        headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+
+        # 令牌验证结果与用户主体均被缓存
+        decode_calls = []
+        real_decode = security.jwt.decode
+        monkeypatch.setattr(security.jwt, "decode", lambda *a, **k: decode_calls.append(1) or real_decode(*a, **k))
+        lookups = []
+        real_lookup = crud_user.get_user_by_username
+
+        async def counting_lookup(db, username):
+            lookups.append(username)
+            return await real_lookup(db, username)
+
+        monkeypatch.setattr("app.api.endpoints.auth.get_user_by_username", counting_lookup)
+        for _ in range(3):
+            me = await ac.get("/api/v1/auth/me", headers=headers)
+            assert me.status_code == 200
+            assert me.json()["data"]["username"] == "cacheadmin"
+        assert len(decode_calls) == 1
+        assert len(lookups) == 1
+
+        # 禁用用户后缓存立即失效
+        async with AsyncSessionLocal() as db:
+            await crud_user.set_user_active(db, username="cacheadmin", is_active=False)
+        assert (await ac.get("/api/v1/auth/me", headers=headers)).status_code == 401
+
+        async with AsyncSessionLocal() as db:
+            await crud_user.set_user_active(db, username="cacheadmin", is_active=True)
+        assert (await ac.get("/api/v1/auth/me", headers=headers)).status_code == 200
+
+        # 删除用户后缓存立即失效
+        async with AsyncSessionLocal() as db:
+            assert await crud_user.delete_user_by_username(db, "cacheadmin")
+        assert (await ac.get("/api/v1/auth/me", headers=headers)).status_code == 401
+
+
+def test_invalid_token_not_memoized():
+    from app.core.security import create_access_token, verify_token
+    from datetime import timedelta
+
+    assert verify_token("not-a-jwt") is None
+    expired = create_access_token("someone", expires_delta=timedelta(seconds=-1))
+    assert verify_token(expired) is None
+    assert verify_token(create_access_token("someone")) == "someone"
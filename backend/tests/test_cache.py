@@ -0,0 +1,145 @@
+"""
+外部接口响应缓存单元测试
+"""
+
+import time
+
+import httpx
+import pytest
+from unittest.mock import patch
+from sqlalchemy import delete, select
+
+from app.db import crud_cache
+from app.db.database import AsyncSessionLocal, create_tables
+from app.models.cache import ApiCacheEntry
+from app.services.cache import ResponseCache
+from app.utils.ttl_cache import MISSING, TTLCache
+from app.services.clients import TMDBClient, NO_RETRY
+
+
+class TestTTLCache:
+    """进程内 LRU + TTL 缓存测试"""
+
+    def test_lru_eviction(self):
+        """测试超出容量时淘汰最久未使用的条目"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        """测试条目过期后不再命中"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1, ttl=0)
+
+        assert cache.get("a") is MISSING
+        assert len(cache) == 0
+
+
+class TestResponseCache:
+    """两级响应缓存测试"""
+
+    def test_key_ignores_api_key(self):
+        """测试缓存键不包含 api_key 且与参数顺序无关"""
+        a = ResponseCache.make_key("/search/tv", {"query": "斗罗大陆", "language": "zh-CN", "api_key": "k1"})
+        b = ResponseCache.make_key("/search/tv", {"api_key": "k2", "language": "zh-CN", "query": "斗罗大陆"})
+        c = ResponseCache.make_key("/search/tv", {"query": "斗罗大陆", "language": "en-US"})
+
+        assert a == b
+        assert a != c
+
+    @pytest.mark.asyncio
+    async def test_persistent_tier_shared_across_instances(self):
+        """测试持久层命中后回填进程内缓存"""
+        await create_tables()
+        writer = ResponseCache(namespace="test", ttl=60, maxsize=10)
+        reader = ResponseCache(namespace="test", ttl=60, maxsize=10)
+        await writer.clear()
+        key = ResponseCache.make_key("/tv/1/alternative_titles", {"api_key": "k"})
+
+        assert await reader.get(key) is MISSING
+        await writer.set(key, {"results": [{"title": "Douluo Continent"}]})
+
+        assert await reader.get(key) == {"results": [{"title": "Douluo Continent"}]}
+        assert await reader.get(key) == {"results": [{"title": "Douluo Continent"}]}
+        stats = reader.stats()
+        assert stats["misses"] == 1
+        assert stats["persistent_hits"] == 1
+        assert stats["memory_hits"] == 1
+        await writer.clear()
+
+    @pytest.mark.asyncio
+    async def test_expired_rows_purged_on_write(self):
+        """测试写入时按清理间隔删除持久层中的过期条目，未过期条目与其他命名空间不受影响"""
+        await create_tables()
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(ApiCacheEntry))
+            await db.commit()
+            now = time.time()
+            for key, namespace, expires_at in [
+                ("expired", "purge-test", now - 10),
+                ("other-namespace", "purge-other", now - 10),
+            ]:
+                await crud_cache.upsert_cache_entry(
+                    db, key=key, namespace=namespace, value="{}", expires_at=expires_at
+                )
+
+        cache = ResponseCache(namespace="purge-test", ttl=60, maxsize=10, purge_interval=3600)
+        await cache.set("fresh", {"ok": True})
+
+        async with AsyncSessionLocal() as db:
+            keys = set((await db.execute(select(ApiCacheEntry.key))).scalars().all())
+        assert keys == {"fresh", "other-namespace"}
+        assert cache.stats()["purged"] == 1
+
+        # 间隔内的写入不再清理
+        async with AsyncSessionLocal() as db:
+            await crud_cache.upsert_cache_entry(
+                db, key="expired", namespace="purge-test", value="{}", expires_at=time.time() - 10
+            )
+        await cache.set("fresh", {"ok": True})
+        assert cache.stats()["purged"] == 1
+        await cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_tmdb_client_caches_successful_responses(self):
+        """测试 TMDB 客户端相同查询只请求一次上游"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"results": [{"id": 12345, "name": "斗罗大陆"}]})
+
+        cache = ResponseCache(namespace="tmdb-test", ttl=60, maxsize=10, persistent=False)
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = TMDBClient(api_key="test_key", retry_policy=NO_RETRY, cache=cache)
+            first = await client.asearch_tv("斗罗大陆")
+            second = await client.asearch_tv("斗罗大陆")
+            other_language = await client.asearch_tv("斗罗大陆", language="en-US")
+
+        await mock_client.aclose()
+        assert first == second
+        assert other_language[0] is True
+        assert len(calls) == 2
+        assert cache.stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tmdb_client_does_not_cache_failures(self):
+        """测试失败响应不写入缓存"""
+        cache = ResponseCache(namespace="tmdb-test", ttl=60, maxsize=10, persistent=False)
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(500)))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = TMDBClient(api_key="test_key", retry_policy=NO_RETRY, cache=cache)
+            ok, _ = await client.aget_alternative_titles(1)
+
+        await mock_client.aclose()
+        assert ok is False
+        assert len(cache.memory) == 0
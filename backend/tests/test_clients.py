@@ -2,9 +2,11 @@
 外部服务客户端单元测试
 """
 
+import httpx
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from app.services.clients import make_client, SonarrClient, ProwlarrClient, TMDBClient
+from app.services.clients import RetryPolicy, NO_RETRY
 
 
 class TestClientFactory:
@@ -279,3 +281,596 @@ class TestBaseClient:
 
         assert client.timeout == 60
 
+
+
+class TestHTTPClientPool:
+    """连接池测试"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_base_url_and_proxy(self):
+        """测试同一 (base_url, proxies) 复用同一客户端"""
+        from app.services.clients import HTTPClientPool
+
+        pool = HTTPClientPool()
+        proxies = {"https://": "http://127.0.0.1:7890", "http://": "http://127.0.0.1:7890"}
+
+        a = pool.get_client("http://localhost:8989/")
+        b = pool.get_client("http://localhost:8989")
+        c = pool.get_client("http://localhost:8989", proxies=proxies)
+        d = pool.get_client("http://localhost:8989", proxies=dict(reversed(list(proxies.items()))))
+
+        assert a is b
+        assert c is d
+        assert a is not c
+        assert pool.size == 2
+
+        await pool.aclose()
+        assert pool.size == 0
+        assert a.is_closed and c.is_closed
+
+    @pytest.mark.asyncio
+    async def test_clients_from_previous_loops_are_closed(self):
+        """测试事件循环变化后，旧事件循环上的客户端被关闭而不是直接丢弃"""
+        import asyncio
+        import threading
+
+        from app.services.clients import HTTPClientPool
+
+        pool = HTTPClientPool()
+
+        async def make(url):
+            return pool.get_client(url)
+
+        # 旧事件循环已结束：在当前事件循环中释放
+        finished = []
+        thread = threading.Thread(target=lambda: finished.append(asyncio.run(make("http://old:1"))))
+        thread.start(); thread.join()
+
+        # 旧事件循环仍在其他线程运行：交还该事件循环关闭
+        running = asyncio.new_event_loop()
+        thread = threading.Thread(target=running.run_forever)
+        thread.start()
+        try:
+            other = asyncio.run_coroutine_threadsafe(make("http://other:1"), running).result(5)
+            current = pool.get_client("http://current:1")
+            for _ in range(100):
+                if other.is_closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert other.is_closed
+            assert not current.is_closed
+            assert pool.size == 1
+
+            await pool.aclose()
+            assert finished[0].is_closed and current.is_closed
+        finally:
+            running.call_soon_threadsafe(running.stop)
+            thread.join()
+            running.close()
+
+    @pytest.mark.asyncio
+    async def test_acheck_status_uses_pooled_client(self):
+        """测试异步状态检查通过连接池发送请求"""
+        import httpx
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["X-Api-Key"] == "test_key"
+            return httpx.Response(200, json={"version": "4.0.0"})
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = SonarrClient(base_url="http://localhost:8989", api_key="test_key")
+            ok, note = await client.acheck_status()
+
+        await mock_client.aclose()
+        assert ok is True
+        assert "4.0.0" in note
+        mock_pool.get_client.assert_called_once_with("http://localhost:8989", None)
+
+    @pytest.mark.asyncio
+    async def test_async_http_error(self):
+        """测试异步请求的 HTTP 错误转换"""
+        import httpx
+
+        mock_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(502))
+        )
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(
+                base_url="http://localhost:9696",
+                api_key="test_key",
+                retry_policy=NO_RETRY,
+            )
+            ok, note = await client.acheck_status()
+
+        await mock_client.aclose()
+        assert ok is False
+        assert "502" in note
+
+
+class TestRetryPolicy:
+    """重试策略测试"""
+
+    @staticmethod
+    def _pooled(handler):
+        import httpx
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def test_backoff_is_exponential_and_capped(self):
+        """测试指数退避与上限"""
+        policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=False)
+
+        assert [policy.backoff(i) for i in range(4)] == [0.5, 1.0, 2.0, 3]
+
+    def test_backoff_jitter_within_ceiling(self):
+        """测试抖动后的退避时间不超过上限"""
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+
+        for attempt in range(5):
+            assert 0 <= policy.backoff(attempt) <= min(10, 2 ** attempt)
+
+    def test_parse_retry_after(self):
+        """测试 Retry-After 的秒数与 HTTP 日期格式"""
+        assert RetryPolicy.parse_retry_after({"Retry-After": "3"}) == 3.0
+        assert RetryPolicy.parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+        assert RetryPolicy.parse_retry_after({"Retry-After": "garbage"}) is None
+        assert RetryPolicy.parse_retry_after({}) is None
+
+    def test_large_retry_after_gives_up_without_deadline(self):
+        """测试不限总时间预算时，超过单次延迟上限的 Retry-After 放弃重试而不是长时间等待"""
+        policy = RetryPolicy(max_retries=3, max_delay=10, deadline=0, jitter=False)
+        request = httpx.Request("GET", "http://tmdb/3/search/tv")
+
+        def limited(retry_after: str) -> httpx.HTTPStatusError:
+            response = httpx.Response(429, headers={"Retry-After": retry_after}, request=request)
+            return httpx.HTTPStatusError("429", request=request, response=response)
+
+        assert policy.deadline is None
+        assert policy.next_delay(0, limited("3600"), policy.start_deadline()) is None
+        assert policy.next_delay(0, limited("5"), policy.start_deadline()) == 5.0
+
+    def test_post_only_retries_connect_errors(self):
+        """测试非幂等 POST 仅在连接阶段失败时重试"""
+        import httpx
+
+        policy = RetryPolicy()
+        read_timeout = httpx.ReadTimeout("timeout")
+        connect_error = httpx.ConnectError("refused")
+
+        assert policy.is_retryable("GET", read_timeout) is True
+        assert policy.is_retryable("POST", read_timeout) is False
+        assert policy.is_retryable("POST", read_timeout, idempotent=True) is True
+        assert policy.is_retryable("POST", connect_error) is True
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_502(self):
+        """测试 502 后重试成功"""
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(502)
+            return httpx.Response(200, json={"version": "1.0"})
+
+        mock_client = self._pooled(handler)
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(
+                base_url="http://localhost:9696",
+                api_key="test_key",
+                retry_policy=RetryPolicy(max_retries=3, base_delay=0, deadline=0),
+            )
+            ok, note = await client.acheck_status()
+
+        await mock_client.aclose()
+        assert ok is True
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_fails_fast(self):
+        """测试 401 等非瞬时错误不重试"""
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(401)
+
+        mock_client = self._pooled(handler)
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = SonarrClient(
+                base_url="http://localhost:8989",
+                api_key="test_key",
+                retry_policy=RetryPolicy(max_retries=3, base_delay=0, deadline=0),
+            )
+            ok, _ = await client.acheck_status()
+
+        await mock_client.aclose()
+        assert ok is False
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_deadline_gives_up(self):
+        """测试 Retry-After 超出时间预算时放弃重试"""
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, headers={"Retry-After": "30"})
+
+        mock_client = self._pooled(handler)
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = SonarrClient(
+                base_url="http://localhost:8989",
+                api_key="test_key",
+                retry_policy=RetryPolicy(max_retries=3, deadline=2),
+            )
+            ok, note = await client.acheck_status()
+
+        await mock_client.aclose()
+        assert ok is False
+        assert "429" in note
+        assert len(calls) == 1
+
+
+class TestSingleFlight:
+    """请求合并测试"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """测试并发的相同调用只执行一次"""
+        import asyncio
+        from app.services.clients import SingleFlight
+
+        group = SingleFlight()
+        executions = []
+
+        async def work():
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[group.do("k", work) for _ in range(10)])
+
+        assert results == ["result"] * 10
+        assert len(executions) == 1
+        assert group.stats() == {"executed": 1, "shared": 9, "inflight": 0}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """测试单个调用方取消不影响其他调用方"""
+        import asyncio
+        from app.services.clients import SingleFlight
+
+        group = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return 42
+
+        first = asyncio.ensure_future(group.do("k", work))
+        second = asyncio.ensure_future(group.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 42
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_hit_upstream_once(self):
+        """测试并发的相同 GET 请求只访问上游一次"""
+        import asyncio
+        import httpx
+
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"version": "1.0"})
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(base_url="http://localhost:9696", api_key="test_key")
+            results = await asyncio.gather(*[client.acheck_status() for _ in range(5)])
+
+        await mock_client.aclose()
+        assert all(ok for ok, _ in results)
+        assert len(calls) == 1
+
+
+class TestRateLimiter:
+    """令牌桶限流测试"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_throttle(self):
+        """测试突发容量用尽后按速率排队"""
+        import asyncio
+        import time
+        from app.services.clients import TokenBucket
+
+        bucket = TokenBucket(rate=50, burst=5)
+        start = time.monotonic()
+        await asyncio.gather(*[bucket.acquire() for _ in range(10)])
+        elapsed = time.monotonic() - start
+
+        # 前 5 个立即放行，后 5 个按 50 req/s 排队约 0.1s
+        assert 0.08 <= elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_queue_depth(self):
+        """测试排队深度统计"""
+        import asyncio
+        from app.services.clients import TokenBucket
+
+        bucket = TokenBucket(rate=20, burst=1)
+        tasks = [asyncio.ensure_future(bucket.acquire()) for _ in range(4)]
+        await asyncio.sleep(0)
+
+        assert bucket.queue_depth == 3
+        await asyncio.gather(*tasks)
+        assert bucket.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout_does_not_consume_token(self):
+        """测试预计等待超出 timeout 时立即放弃，且不占用令牌"""
+        import asyncio
+        from app.services.clients import TokenBucket
+
+        bucket = TokenBucket(rate=1, burst=1)
+        await bucket.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await bucket.acquire(timeout=0.1)
+        assert bucket.queue_depth == 0
+        assert bucket.stats()["tokens"] < 0.2
+
+    @pytest.mark.asyncio
+    async def test_local_throttling_does_not_trip_circuit(self):
+        """测试限流排队耗尽时间预算时不发出请求、不计入熔断失败"""
+        import httpx
+        from app.services.clients import CircuitBreaker, TokenBucket
+
+        sent = []
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: sent.append(r) or httpx.Response(200)))
+        breaker = CircuitBreaker("prowlarr", failure_threshold=1, recovery_timeout=60)
+        bucket = TokenBucket(rate=0.5, burst=1)
+        await bucket.acquire()
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(
+                base_url="http://localhost:9696",
+                api_key="test_key",
+                retry_policy=RetryPolicy(max_retries=0, deadline=0.2),
+                rate_limiter=bucket,
+                circuit_breaker=breaker,
+            )
+            ok, message = await client.acheck_status()
+
+        await mock_client.aclose()
+        assert not ok and "时间预算" in message
+        assert sent == []
+        assert breaker.state == "closed"
+        assert breaker.stats()["failures"] == 0
+
+    def test_registry_from_extra_config(self):
+        """测试按 extra_config 创建、更新与移除限流器"""
+        from app.services.clients import RateLimiterRegistry
+
+        registry = RateLimiterRegistry()
+        limiter = registry.from_extra_config(1, {"rate_limit": 4, "rate_burst": 10})
+        assert limiter.rate == 4 and limiter.burst == 10
+
+        same = registry.from_extra_config(1, {"rate_limit": 2})
+        assert same is limiter
+        assert same.rate == 2
+
+        assert registry.from_extra_config(1, {"use_proxy": True}) is None
+        assert registry.stats() == {}
+        assert registry.from_extra_config(2, {"rate_limit": "abc"}) is None
+
+
+class TestCircuitBreaker:
+    """熔断器测试"""
+
+    def test_state_transitions(self):
+        """测试 closed -> open -> half_open -> closed"""
+        from app.services.clients import CircuitBreaker
+
+        breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=0.05)
+        assert breaker.allow_request() and breaker.state == "closed"
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.allow_request() is False
+
+        import time
+        time.sleep(0.06)
+        assert breaker.state == "half_open"
+        assert breaker.allow_request() is True
+        # 探测进行中，其他请求仍被拒绝
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self):
+        """测试探测失败后重新熔断"""
+        import time
+        from app.services.clients import CircuitBreaker
+
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow_request() is True
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.allow_request() is False
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """测试熔断后请求不再访问上游"""
+        import httpx
+        from app.services.clients import CircuitBreaker
+
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused")
+
+        breaker = CircuitBreaker("prowlarr", failure_threshold=2, recovery_timeout=60)
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(
+                base_url="http://localhost:9696",
+                api_key="test_key",
+                retry_policy=NO_RETRY,
+                circuit_breaker=breaker,
+            )
+            for _ in range(2):
+                ok, _ = await client.acheck_status()
+                assert ok is False
+            ok, note = await client.acheck_status()
+
+        await mock_client.aclose()
+        assert ok is False
+        assert "熔断" in note
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_circuit(self):
+        """测试 4xx 不计入熔断失败"""
+        import httpx
+        from app.services.clients import CircuitBreaker
+
+        breaker = CircuitBreaker("sonarr", failure_threshold=1, recovery_timeout=60)
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(401)))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = SonarrClient(
+                base_url="http://localhost:8989",
+                api_key="wrong_key",
+                retry_policy=NO_RETRY,
+                circuit_breaker=breaker,
+            )
+            await client.acheck_status()
+
+        await mock_client.aclose()
+        assert breaker.state == "closed"
+
+
+class TestProwlarrSearch:
+    """Prowlarr 并发搜索测试"""
+
+    @staticmethod
+    def _release(guid, title, indexer_id):
+        return {"guid": guid, "title": title, "indexerId": indexer_id}
+
+    @pytest.mark.asyncio
+    async def test_streams_results_as_indexers_answer(self):
+        """测试快的索引器先产出结果，慢的索引器超时不阻塞"""
+        import asyncio
+        import httpx
+
+        async def handler(request):
+            indexer_id = int(request.url.params["indexerIds"])
+            if indexer_id == 1:
+                await asyncio.sleep(0.05)
+                return httpx.Response(200, json=[self._release("a", "[VCB-Studio][斗罗大陆][156][1080p]", 1)])
+            if indexer_id == 2:
+                return httpx.Response(200, json=[
+                    self._release("b", "[GM-Team][斗罗大陆][156][1080p]", 2),
+                    self._release("a", "[VCB-Studio][斗罗大陆][156][1080p]", 2),
+                ])
+            await asyncio.sleep(1)
+            return httpx.Response(200, json=[])
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(base_url="http://localhost:9696", api_key="test_key", retry_policy=NO_RETRY)
+            batches = [
+                batch async for batch in client.asearch(
+                    "斗罗大陆", indexer_ids=[1, 2, 3], categories=[5000], indexer_timeout=0.2
+                )
+            ]
+
+        await mock_client.aclose()
+        assert [b[0] for b in batches] == [2, 1, 3]
+        assert [r["guid"] for r in batches[0][2]] == ["b", "a"]
+        # 重复的 guid 已被去重
+        assert batches[1][1] is True and batches[1][2] == []
+        assert batches[2][1] is False and "超时" in batches[2][2]
+
+    @pytest.mark.asyncio
+    async def test_uses_enabled_indexers_by_default(self):
+        """测试未指定索引器时使用全部已启用的索引器"""
+        import httpx
+
+        searched = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/indexer":
+                return httpx.Response(200, json=[{"id": 1, "enable": True}, {"id": 2, "enable": False}])
+            searched.append(request.url.params.get_list("indexerIds"))
+            assert request.url.params.get_list("categories") == ["5000", "5070"]
+            return httpx.Response(200, json=[])
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(base_url="http://localhost:9696", api_key="test_key", retry_policy=NO_RETRY)
+            batches = [b async for b in client.asearch("斗罗大陆", categories=[5000, 5070])]
+
+        await mock_client.aclose()
+        assert searched == [["1"]]
+        assert batches == [(1, True, [])]
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_early_exit_cancel_upstream_requests(self):
+        """测试索引器超时或调用方提前结束时，上游请求被取消而不是在后台继续执行"""
+        import asyncio
+        import httpx
+
+        cancelled = []
+
+        async def handler(request):
+            indexer_id = int(request.url.params["indexerIds"])
+            if indexer_id == 1:
+                return httpx.Response(200, json=[self._release("a", "[VCB-Studio][斗罗大陆][156][1080p]", 1)])
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(indexer_id)
+                raise
+            return httpx.Response(200, json=[])
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("app.services.clients.base.http_client_pool") as mock_pool:
+            mock_pool.get_client.return_value = mock_client
+            client = ProwlarrClient(base_url="http://localhost:9696", api_key="test_key", retry_policy=NO_RETRY)
+
+            batches = [b async for b in client.asearch("斗罗大陆", indexer_ids=[2], indexer_timeout=0.05)]
+            assert batches[0][1] is False
+            assert cancelled == [2]
+
+            search = client.asearch("斗罗大陆", indexer_ids=[1, 3], indexer_timeout=5)
+            assert (await search.__anext__())[0] == 1
+            await search.aclose()
+            assert cancelled == [2, 3]
+
+        await mock_client.aclose()
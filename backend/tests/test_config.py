@@ -50,6 +50,29 @@ async def test_create_and_list_service_config(monkeypatch):
         assert len(data["services"]) == 1
         # API Key "TESTKEY123456" (13位) 的掩码应为 "TEST*****3456" (前4位+中间5个星号+后4位)
         assert data["services"][0]["api_key_masked"] == "TEST*****3456"
+        assert data["services"][0]["api_key_length"] == 13
+
+        # 概览直接读取写入时计算的掩码，不做任何解密
+        from app.utils.encryption import encryption_manager
+
+        def fail(*args, **kwargs):
+            raise AssertionError("配置概览不应解密")
+
+        monkeypatch.setattr(encryption_manager, "decrypt", fail)
+        monkeypatch.setattr(encryption_manager, "adecrypt", fail)
+        lst = await ac.get("/api/v1/config/", headers={"Authorization": f"Bearer {token}"})
+        assert lst.json()["data"]["services"][0]["api_key_masked"] == "TEST*****3456"
+        monkeypatch.undo()
+
+        # 更新 api_key 时同步更新掩码
+        await ac.put(
+            f"/api/v1/config/{created_id}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"api_key": "NEWKEY-abcdefgh"},
+        )
+        lst = await ac.get("/api/v1/config/", headers={"Authorization": f"Bearer {token}"})
+        svc = lst.json()["data"]["services"][0]
+        assert (svc["api_key_masked"], svc["api_key_length"]) == ("NEWK*******efgh", 15)
 
 
 @pytest.mark.asyncio
@@ -116,6 +139,9 @@ async def test_connection_success_and_fail(monkeypatch):
             def check_status(self):
                 return True, "连接成功"
 
+            async def acheck_status(self):
+                return self.check_status()
+
         class MockClientFail:
             def __init__(self, *args, **kwargs):
                 pass
@@ -123,6 +149,9 @@ async def test_connection_success_and_fail(monkeypatch):
             def check_status(self):
                 return False, "连接失败: boom"
 
+            async def acheck_status(self):
+                return self.check_status()
+
         # Mock 成功情况 - patch 客户端层的工厂
         def make_client_ok(*args, **kwargs):
             return MockClientOK()
@@ -153,3 +182,108 @@ async def test_connection_success_and_fail(monkeypatch):
         assert fail.json()["data"]["ok"] is False
 
 
+
+
+@pytest.mark.asyncio
+async def test_config_snapshot_versioned_invalidation():
+    from app.db import crud_config
+    from app.db.database import AsyncSessionLocal
+    from app.services.config_snapshot import config_snapshots
+    from app.utils.config_helpers import get_active_proxy_config
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        await drop_tables(); await create_tables()
+        config_snapshots.clear()
+        r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+        headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+
+        created = await ac.post("/api/v1/config/", headers=headers, json={
+            "type": "service", "service_name": "proxy", "service_type": "proxy",
+            "name": "代理", "url": "http://127.0.0.1:7890", "api_key": "PROXYKEY",
+        })
+        proxy_id = created.json()["data"]["id"]
+
+        async with AsyncSessionLocal() as db:
+            snapshot = await config_snapshots.get(db)
+            assert snapshot.version == 1
+            assert snapshot.get_service(proxy_id).api_key == "PROXYKEY"
+            assert await config_snapshots.get(db) is snapshot
+            assert await get_active_proxy_config(db) == {
+                "http://": "http://127.0.0.1:7890", "https://": "http://127.0.0.1:7890",
+            }
+
+        # 本进程内的写入：版本号递增，快照重新加载
+        await ac.put(f"/api/v1/config/{proxy_id}", headers=headers, json={
+            "extra_config": {"http": "http://10.0.0.1:3128"},
+        })
+        async with AsyncSessionLocal() as db:
+            snapshot = await config_snapshots.get(db)
+            assert snapshot.version == 2
+            assert snapshot.proxy["http://"] == "http://10.0.0.1:3128"
+
+            # 其他 worker 的写入：仅版本号变化，本进程下次读取时刷新
+            svc = await crud_config.get_service_config_by_id(db, config_id=proxy_id)
+            await crud_config.update_service_config(db, obj=svc, data={"is_active": False})
+            assert (await config_snapshots.get(db)) is snapshot
+            await crud_config.bump_config_version(db)
+            refreshed = await config_snapshots.get(db)
+            assert refreshed.version == 3
+            assert refreshed.proxy is None
+
+
+@pytest.mark.asyncio
+async def test_overview_json_matches_without_orjson(monkeypatch):
+    """测试 orjson 与标准库两种序列化路径输出一致"""
+    from app.core.config import settings
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        await drop_tables(); await create_tables()
+        r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+        headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+        await ac.post("/api/v1/config/", headers=headers, json={
+            "type": "service", "service_name": "sonarr", "service_type": "api", "name": "主Sonarr",
+            "url": "http://127.0.0.1:8989", "api_key": "TESTKEY123456", "extra_config": {"timeout": 3000},
+        })
+
+        fast = await ac.get("/api/v1/config/", headers=headers)
+        monkeypatch.setattr(settings, "ORJSON_RESPONSE", False)
+        std = await ac.get("/api/v1/config/", headers=headers)
+
+        assert fast.json() == std.json()
+        assert fast.json()["data"]["services"][0]["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_tmdb_language_region_validated_against_dict():
+    """测试 extra_config 中的语言/地区按系统字典校验"""
+    from app.db.database import AsyncSessionLocal
+    from app.db.init_dict_data import init_dict_data
+    from app.services.dict_tree import dict_trees
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        await drop_tables(); await create_tables()
+        dict_trees.clear()
+        async with AsyncSessionLocal() as db:
+            await init_dict_data(db)
+        r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+        headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+        payload = {
+            "type": "service", "service_name": "tmdb", "service_type": "metadata", "name": "默认TMDB",
+            "url": "https://api.themoviedb.org/3", "api_key": "TMDBKEY123456",
+        }
+
+        bad = await ac.post("/api/v1/config/", headers=headers, json={
+            **payload, "extra_config": {"language": "xx-XX", "region": "CN"},
+        })
+        assert bad.status_code == 400 and "language" in bad.json()["detail"]
+
+        ok = await ac.post("/api/v1/config/", headers=headers, json={
+            **payload, "extra_config": {"language": "ja-JP", "region": "JP"},
+        })
+        assert ok.status_code == 200
+        config_id = ok.json()["data"]["id"]
+
+        bad = await ac.put(f"/api/v1/config/{config_id}", headers=headers, json={
+            "extra_config": {"language": "zh-CN", "region": "XX"},
+        })
+        assert bad.status_code == 400 and "region" in bad.json()["detail"]
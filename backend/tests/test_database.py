@@ -0,0 +1,219 @@
+"""
+数据库连接参数测试
+"""
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.models  # noqa: F401
+from app.db import crud_config, crud_system_dict
+from app.db.database import AsyncSessionLocal, Base, create_tables, drop_tables, engine
+from app.db.migrate import head_revisions, is_at_head, upgrade_database
+from app.db.sqlite import build_pragmas, install_pragmas, read_pragmas
+
+
+@pytest.mark.asyncio
+async def test_pragmas_applied_on_connect(tmp_path):
+    """测试新建连接时按方案设置 WAL、同步级别、缓存与锁等待"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/pragma.db")
+    install_pragmas(engine, "balanced")
+    try:
+        pragmas = await read_pragmas(engine)
+    finally:
+        await engine.dispose()
+
+    expected = build_pragmas("balanced")
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["synchronous"] == 1  # NORMAL
+    assert pragmas["temp_store"] == 2  # MEMORY
+    assert pragmas["cache_size"] == expected["cache_size"]
+    assert pragmas["busy_timeout"] == expected["busy_timeout"]
+
+
+@pytest.mark.asyncio
+async def test_pragma_profile_off_and_unknown(tmp_path):
+    """测试 off 方案保持 SQLite 默认值，未知方案直接报错"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/plain.db")
+    install_pragmas(engine, "off")
+    try:
+        pragmas = await read_pragmas(engine)
+    finally:
+        await engine.dispose()
+
+    assert pragmas["journal_mode"] == "delete"
+    assert pragmas["synchronous"] == 2  # FULL（SQLite 默认）
+
+    with pytest.raises(ValueError, match="未知的 SQLite 配置方案"):
+        build_pragmas("fastest")
+
+
+async def _query_plans(run):
+    """执行 run(db) 并返回其中每条 SELECT 的 EXPLAIN QUERY PLAN 明细"""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSessionLocal() as db:
+            await run(db)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    plans = []
+    async with engine.connect() as conn:
+        for statement, parameters in captured:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append(" | ".join(row[-1] for row in result))
+    return plans
+
+
+@pytest.mark.asyncio
+async def test_hot_lookups_use_composite_indexes():
+    """测试配置与字典的热点查询命中复合索引且无需临时排序"""
+    await drop_tables(); await create_tables()
+
+    plans = await _query_plans(
+        lambda db: crud_config.get_service_configs(db, service_name="proxy", is_active=True)
+    )
+    assert "ix_service_configs_service_name_is_active" in plans[0]
+
+    plans = await _query_plans(
+        lambda db: crud_config.is_service_name_duplicate(db, service_name="sonarr", name="主Sonarr")
+    )
+    assert "ix_service_configs_service_name_name" in plans[0]
+
+    plans = await _query_plans(
+        lambda db: crud_system_dict.get_dict_options(db, dict_type_code="language")
+    )
+    assert "ix_dict_items_type_active_order" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+
+    plans = await _query_plans(
+        lambda db: crud_system_dict.get_dict_items(db, dict_type_code="language", is_active=True)
+    )
+    assert all("ix_dict_items_type_active_order" in plan for plan in plans)
+    assert "COVERING INDEX" in plans[0]  # 计数查询只读索引
+    assert "TEMP B-TREE" not in plans[1]
+
+    plans = await _query_plans(
+        lambda db: crud_system_dict.get_dict_items(db, dict_type_code="language")
+    )
+    assert "ix_dict_items_type_order" in plans[1]
+    assert "TEMP B-TREE" not in plans[1]
+
+
+def _schema_diff(sync_conn):
+    """迁移后的表结构与模型定义的差异"""
+    return compare_metadata(MigrationContext.configure(sync_conn), Base.metadata)
+
+
+@pytest.mark.asyncio
+async def test_migrations_build_model_schema(tmp_path):
+    """测试空数据库迁移到最新版本后与模型一致，再次启动只做版本检查"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/fresh.db")
+    try:
+        assert not await is_at_head(engine)
+        assert await upgrade_database(engine)
+        assert await is_at_head(engine)
+        assert not await upgrade_database(engine)
+
+        async with engine.connect() as conn:
+            assert await conn.run_sync(_schema_diff) == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrations_adopt_legacy_database(tmp_path):
+    """测试由 create_all 建立、无版本表的旧数据库可原地升级且保留数据"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/legacy.db")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(text("DROP INDEX ix_dict_items_type_active_order"))
+            await conn.execute(text("DROP TABLE api_cache"))
+            await conn.execute(text(
+                "INSERT INTO users (username, hashed_password, is_active, is_superuser) "
+                "VALUES ('legacy', 'x', 1, 1)"
+            ))
+
+        assert await upgrade_database(engine)
+
+        async with engine.connect() as conn:
+            assert await conn.run_sync(_schema_diff) == []
+            version = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            assert (version.scalar(),) == head_revisions()
+            users = await conn.execute(text("SELECT username FROM users"))
+            assert users.scalars().all() == ["legacy"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_api_key_mask_backfill(tmp_path):
+    """测试掩码迁移为存量服务配置回填 api_key 掩码与长度"""
+    from app.utils.encryption import encryption_manager
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/backfill.db")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(text("ALTER TABLE service_configs DROP COLUMN api_key_masked"))
+            await conn.execute(text("ALTER TABLE service_configs DROP COLUMN api_key_length"))
+            await conn.execute(
+                text(
+                    "INSERT INTO service_configs (service_name, service_type, name, url, api_key) "
+                    "VALUES ('sonarr', 'api', 's', 'http://x', :key), ('proxy', 'proxy', 'p', 'http://y', NULL)"
+                ),
+                {"key": encryption_manager.encrypt("TESTKEY123456")},
+            )
+
+        assert await upgrade_database(engine)
+
+        async with engine.connect() as conn:
+            rows = await conn.execute(text(
+                "SELECT api_key_masked, api_key_length FROM service_configs ORDER BY id"
+            ))
+            assert rows.all() == [("TEST*****3456", 13), (None, None)]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_dict_item_sort_order_backfill(tmp_path):
+    """测试排序字段迁移将存量 NULL 回填为 0 并设为非空，保留字典项与索引"""
+    from alembic import command
+
+    from app.db.migrate import alembic_config
+
+    def upgrade_to(sync_conn, revision):
+        cfg = alembic_config()
+        cfg.attributes["connection"] = sync_conn
+        command.upgrade(cfg, revision)
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/sort_order.db")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(upgrade_to, "0006")
+            await conn.execute(text("INSERT INTO dict_types (code, name, is_active) VALUES ('t', 'T', 1)"))
+            await conn.execute(text(
+                "INSERT INTO dict_items (id, dict_type_code, code, name, value, sort_order, parent_id, is_active) "
+                "VALUES (1, 't', 'a', 'A', 'a', NULL, NULL, 1), (2, 't', 'b', 'B', 'b', 3, 1, 1)"
+            ))
+
+        assert await upgrade_database(engine)
+
+        async with engine.connect() as conn:
+            assert await conn.run_sync(_schema_diff) == []
+            rows = await conn.execute(text("SELECT id, sort_order, parent_id FROM dict_items ORDER BY id"))
+            assert rows.all() == [(1, 0, None), (2, 3, 1)]
+            indexes = await conn.execute(text("SELECT name FROM sqlite_master WHERE tbl_name = 'dict_items'"))
+            assert "ix_dict_items_type_order" in indexes.scalars().all()
+    finally:
+        await engine.dispose()
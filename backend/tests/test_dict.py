@@ -0,0 +1,226 @@
+"""
+系统字典初始化测试
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import delete, event, func, select
+
+from app.db import crud_system_dict
+from app.db.database import AsyncSessionLocal, create_tables, drop_tables, engine
+from app.db.init_dict_data import DICT_SEED, init_dict_data
+from app.models.config import Configuration
+from app.models.dict import DictItem, DictType
+
+
+async def _counts():
+    async with AsyncSessionLocal() as db:
+        types = (await db.execute(select(func.count(DictType.id)))).scalar()
+        items = (await db.execute(select(func.count(DictItem.id)))).scalar()
+    return types, items
+
+
+@pytest.mark.asyncio
+async def test_seed_is_bulk_and_idempotent():
+    """测试初始化批量写入（一次事务、固定语句数），重复与并发执行不产生重复数据"""
+    await drop_tables(); await create_tables()
+    expected = (len(DICT_SEED), sum(len(t["items"]) for t in DICT_SEED))
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        async with AsyncSessionLocal() as db:
+            await init_dict_data(db)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    # 查询已有类型 + 查询初始化记录 + 类型批量插入 + 字典项批量插入 + 写入初始化记录
+    assert len(statements) == 5
+    assert await _counts() == expected
+
+    async def seed_again():
+        async with AsyncSessionLocal() as db:
+            await init_dict_data(db)
+
+    await asyncio.gather(*(seed_again() for _ in range(4)))
+    assert await _counts() == expected
+
+
+@pytest.mark.asyncio
+async def test_seed_adds_missing_types_without_touching_existing():
+    """测试已有数据库只补齐新增的类型，已删除的内置类型与字典项不会被恢复"""
+    await drop_tables(); await create_tables()
+    async with AsyncSessionLocal() as db:
+        await init_dict_data(db)
+
+        deleted = (await db.execute(
+            select(DictItem).where(DictItem.dict_type_code == "language", DictItem.code == "ko-KR")
+        )).scalar_one()
+        await crud_system_dict.delete_dict_item(db, obj=deleted)
+        parse_rule = await crud_system_dict.get_dict_type_by_code(db, code="parse_rule")
+        await crud_system_dict.delete_dict_type(db, obj=parse_rule)
+
+        created = await crud_system_dict.seed_dict_data(
+            db, seeds=[*DICT_SEED, {"code": "anime_alias", "name": "番剧别名", "items": []}]
+        )
+        assert created == ["anime_alias"]
+
+        languages, _ = await crud_system_dict.get_dict_items(db, dict_type_code="language")
+        assert "ko-KR" not in {item.code for item in languages}
+        assert await crud_system_dict.get_dict_type_by_code(db, code="parse_rule") is None
+
+        # 升级前的数据库没有初始化记录：以已有类型为准，只补齐缺失的类型
+        await db.execute(delete(Configuration).where(Configuration.key == crud_system_dict.SEEDED_TYPES_KEY))
+        await db.commit()
+        created = await crud_system_dict.seed_dict_data(db, seeds=[{**t, "items": []} for t in DICT_SEED])
+        assert created == ["parse_rule"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_all_items():
+    """测试游标分页按 (sort_order, id) 完整遍历，可选返回缓存总数"""
+    from httpx import AsyncClient
+
+    from app.main import app
+
+    await drop_tables(); await create_tables()
+    async with AsyncSessionLocal() as db:
+        await crud_system_dict.seed_dict_data(db, seeds=[{
+            "code": "anime_alias",
+            "name": "番剧别名",
+            # 倒序的 sort_order 且有重复，验证按 (sort_order, id) 排序
+            "items": [
+                {"code": f"a{i}", "name": f"别名{i}", "value": str(i), "sort_order": (120 - i) // 3}
+                for i in range(120)
+            ],
+        }])
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+        headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+        params = {"dict_type_code": "anime_alias", "page_size": 50}
+
+        r = await ac.get("/api/v1/dict/items", headers=headers, params={**params, "page_size": 200})
+        expected = [item["code"] for item in r.json()["data"]["items"]]
+
+        seen, cursor, pages = [], "", 0
+        while cursor is not None:
+            r = await ac.get(
+                "/api/v1/dict/items", headers=headers,
+                params={**params, "cursor": cursor, "with_total": pages == 0},
+            )
+            data = r.json()["data"]
+            if pages == 0:
+                assert data["total"] == 120
+            else:
+                assert data["total"] is None
+            seen.extend(item["code"] for item in data["items"])
+            cursor, pages = data["next_cursor"], pages + 1
+            assert data["has_more"] == (cursor is not None)
+
+        assert pages == 3
+        assert seen == expected
+
+        r = await ac.get("/api/v1/dict/types", headers=headers, params={"cursor": "", "page_size": 1})
+        data = r.json()["data"]
+        assert [t["code"] for t in data["items"]] == ["anime_alias"]
+        assert data["next_cursor"] is None and not data["has_more"]
+
+        r = await ac.get("/api/v1/dict/items", headers=headers, params={**params, "cursor": "bad!"})
+        assert r.json()["code"] == 400
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_seeks_index():
+    """测试游标分页直接沿 (dict_type_code, sort_order, id) 索引定位，无需排序或跳过前面的行"""
+    await drop_tables(); await create_tables()
+    plans = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            plans.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSessionLocal() as db:
+            await crud_system_dict.get_dict_items_after(db, dict_type_code="language", after=(3, 10))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = plans[0]
+    async with engine.connect() as conn:
+        rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plan = " | ".join(row[-1] for row in rows)
+    assert "ix_dict_items_type_order" in plan
+    assert "sort_order" in plan and ">" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_options_tree_cached_with_etag():
+    """测试选项树缓存：ETag 条件请求返回 304，字典项变更后重建，tree=true 一次返回全部层级"""
+    from httpx import AsyncClient
+
+    from app.main import app
+    from app.services.dict_tree import dict_trees
+
+    await drop_tables(); await create_tables()
+    dict_trees.clear()
+    async with AsyncSessionLocal() as db:
+        await init_dict_data(db)
+        cn = (await db.execute(
+            select(DictItem).where(DictItem.dict_type_code == "region", DictItem.code == "CN")
+        )).scalar_one()
+        await crud_system_dict.create_dict_item(
+            db, dict_type_code="region", code="CN-SH", name="上海", value="CN-SH",
+            sort_order=9, parent_id=cn.id
+        )
+        cn_id = cn.id
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+        headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+
+        r = await ac.get("/api/v1/dict/options/region", headers=headers)
+        assert r.status_code == 200
+        etag = r.headers["etag"]
+        flat = r.json()["data"]["options"]
+        assert [o["code"] for o in flat] == ["CN", "TW", "HK", "US", "JP", "KR", "CN-SH"]
+
+        builds = dict_trees.stats()["builds"]
+        r = await ac.get("/api/v1/dict/options/region", headers={**headers, "If-None-Match": etag})
+        assert r.status_code == 304 and r.content == b""
+        assert dict_trees.stats()["builds"] == builds
+
+        r = await ac.get("/api/v1/dict/options/region", headers=headers, params={"tree": True})
+        roots = r.json()["data"]["options"]
+        assert [o["code"] for o in roots] == ["CN", "TW", "HK", "US", "JP", "KR"]
+        assert [c["code"] for c in roots[0]["children"]] == ["CN-SH"]
+
+        r = await ac.get("/api/v1/dict/options/region", headers=headers, params={"parent_id": cn_id})
+        assert [o["code"] for o in r.json()["data"]["options"]] == ["CN-SH"]
+
+        # 不存在的父项 ID 不进入渲染缓存
+        rendered = len(dict_trees._trees["region"]._rendered)
+        for parent_id in range(10000, 10020):
+            r = await ac.get("/api/v1/dict/options/region", headers=headers, params={"parent_id": parent_id})
+            assert r.json()["data"]["options"] == []
+        assert len(dict_trees._trees["region"]._rendered) == rendered
+
+        # 修改字典项后版本号递增，旧 ETag 失效
+        async with AsyncSessionLocal() as db:
+            item = (await db.execute(select(DictItem).where(DictItem.code == "KR"))).scalar_one()
+            await crud_system_dict.update_dict_item(db, obj=item, data={"is_active": False})
+
+        r = await ac.get("/api/v1/dict/options/region", headers={**headers, "If-None-Match": etag})
+        assert r.status_code == 200 and r.headers["etag"] != etag
+        assert "KR" not in [o["code"] for o in r.json()["data"]["options"]]
+        assert dict_trees.stats()["builds"] == builds + 1
+
+        r = await ac.get("/api/v1/dict/options/missing", headers=headers)
+        assert r.json()["code"] == 404
@@ -0,0 +1,64 @@
+"""
+加密工具单元测试
+"""
+
+import pytest
+
+from app.utils.encryption import EncryptionManager, _derive_fernet
+
+
+class TestEncryptionManager:
+    """EncryptionManager 测试"""
+
+    def test_encrypt_decrypt_roundtrip(self):
+        """测试加密后可正确解密"""
+        manager = EncryptionManager(password="unit-test-secret")
+        token = manager.encrypt("TESTKEY123456")
+
+        assert token != "TESTKEY123456"
+        assert manager.decrypt(token) == "TESTKEY123456"
+
+    def test_derived_key_is_cached(self):
+        """测试同一 (password, salt) 只派生一次密钥"""
+        _derive_fernet.cache_clear()
+        manager = EncryptionManager(password="cache-test-secret")
+        other = EncryptionManager(password="cache-test-secret")
+
+        for _ in range(5):
+            other.decrypt(manager.encrypt("value"))
+
+        info = _derive_fernet.cache_info()
+        assert info.misses == 1
+        assert info.hits >= 9
+
+    def test_decrypt_with_wrong_password_fails(self):
+        """测试不同密码无法解密"""
+        token = EncryptionManager(password="secret-a").encrypt("value")
+
+        with pytest.raises(ValueError, match="解密失败"):
+            EncryptionManager(password="secret-b").decrypt(token)
+
+    @pytest.mark.asyncio
+    async def test_async_crypto_runs_in_crypto_pool(self, monkeypatch):
+        """测试异步加解密与密码哈希在加密线程池中执行，不占用事件循环线程"""
+        import threading
+
+        import app.core.security as security
+        from app.core.security import aget_password_hash, averify_password
+
+        threads = []
+        original = security.bcrypt.hashpw
+
+        def tracking_hashpw(password, salt):
+            threads.append(threading.current_thread().name)
+            return original(password, salt)
+
+        monkeypatch.setattr(security.bcrypt, "hashpw", tracking_hashpw)
+        hashed = await aget_password_hash("P@ssw0rd")
+        assert await averify_password("P@ssw0rd", hashed)
+        assert not await averify_password("wrong", hashed)
+        assert threads and threads[0].startswith("crypto")
+
+        manager = EncryptionManager(password="async-test-secret")
+        token = await manager.aencrypt("TESTKEY123456")
+        assert await manager.adecrypt(token) == "TESTKEY123456"
@@ -0,0 +1,82 @@
+"""
+文件日志队列单元测试
+"""
+
+import json
+
+from loguru import logger
+
+from app.utils.logger import QueuedLogSink, _is_app_record
+
+
+def _drain(sink: QueuedLogSink) -> list:
+    entries = []
+    while not sink._queue.empty():
+        entries.append(sink._queue.get_nowait())
+        sink._queue.task_done()
+    return entries
+
+
+class TestQueuedLogSink:
+    """有界队列日志 sink 测试"""
+
+    def test_json_lines(self):
+        """测试 JSON 格式包含结构化字段与异常堆栈"""
+        sink = QueuedLogSink(maxsize=10, fmt="json")
+        handler_id = logger.add(sink, filter=_is_app_record)
+        try:
+            logger.bind(request_id="r1").info("你好")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("失败")
+        finally:
+            logger.remove(handler_id)
+
+        first, second = [json.loads(sink.render(entry)) for entry in _drain(sink)]
+        assert first["level"] == "INFO"
+        assert first["message"] == "你好"
+        assert first["extra"] == {"request_id": "r1"}
+        assert first["name"] == __name__
+        assert first["exception"] is None
+        assert second["level"] == "ERROR"
+        assert "ValueError: boom" in second["exception"]
+
+    def test_drops_when_full(self):
+        """测试队列写满后丢弃新记录而不阻塞调用方"""
+        sink = QueuedLogSink(maxsize=2)
+        handler_id = logger.add(sink, filter=_is_app_record)
+        try:
+            for i in range(5):
+                logger.info(f"message {i}")
+        finally:
+            logger.remove(handler_id)
+
+        stats = sink.stats()
+        assert stats["enqueued"] == 2
+        assert stats["dropped"] == 3
+        assert stats["queued"] == 2
+        assert [entry["message"] for entry in _drain(sink)] == ["message 0", "message 1"]
+
+    def test_background_writer(self, tmp_path):
+        """测试后台线程经文件 sink 写入文本行，刷新后队列为空"""
+        log_file = tmp_path / "app.log"
+        sink = QueuedLogSink(maxsize=10)
+        file_id = logger.add(log_file, level=0, format="{message}", filter=sink.accepts)
+        handler_id = logger.add(sink, filter=_is_app_record)
+        sink.start()
+        try:
+            logger.warning("写入测试")
+            assert sink.flush(timeout=5)
+        finally:
+            logger.remove(handler_id)
+            sink.stop()
+            logger.remove(file_id)
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert "| WARNING  | " in lines[0]
+        assert f"| {__name__}:test_background_writer:" in lines[0]
+        assert lines[0].endswith(" - 写入测试")
+        assert sink.stats()["written"] == 1
+        assert sink.stats()["queued"] == 0
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+标题解析器测试
+"""
+import pytest
+
+from app.services.parser import BUILTIN_RULES, ParseRule, ParserPool, RuleSet, TitleParser, title_parser
+from app.services.parser import store
+from benchmarks.bench_parser import evaluate, load_corpus
+
+
+@pytest.fixture
+def parser():
+    return TitleParser(cache_size=64)
+
+
+class TestTitleParser:
+    """TitleParser 测试"""
+
+    @pytest.mark.parametrize(
+        "title,name,season,episode,rule",
+        [
+            ("[VCB-Studio][斗罗大陆][156][1080p]", "斗罗大陆", None, 156, "bracket_number"),
+            ("【幻樱字幕组】【斗罗大陆 Douluo Dalu】【第156话】【1080P】", "斗罗大陆", None, 156, "cn_episode"),
+            ("[ANi] 斗罗大陆 第二季 - 05 [1080P][Baha][WEB-DL]", "斗罗大陆", 2, 5, "bracket_dash"),
+            ("Douluo.Dalu.S01E156.2160p.WEB-DL.H265.AAC-GROUP", "Douluo Dalu", 1, 156, "season_episode"),
+            ("斗罗大陆.Douluo.Dalu.EP156.1080p.WEB-DL.H264.AAC-XXX", "斗罗大陆", None, 156, "ep_prefix"),
+            ("斗罗大陆 - 156 [1080P]", "斗罗大陆", None, 156, "plain_dash"),
+        ],
+    )
+    def test_common_formats(self, parser, title, name, season, episode, rule):
+        result = parser.parse(title)
+        assert (result.name, result.season, result.episode, result.rule) == (name, season, episode, rule)
+        assert result.ok
+
+    def test_attributes(self, parser):
+        result = parser.parse("[Lilith-Raws] 斗罗大陆 / Douluo Dalu - 156 [Baha][WEB-DL][1080p][AVC AAC][CHT][MP4]")
+        assert result.group == "Lilith-Raws"
+        assert result.aliases == ("Douluo Dalu",)
+        assert (result.resolution, result.source, result.codec) == ("1080p", "WEB-DL", "H.264")
+        assert result.subtitles == ("CHT",)
+
+    def test_year_bracket_is_not_episode(self, parser):
+        result = parser.parse("[GM-Team][国漫][斗罗大陆][Douluo Dalu][2018][Movie][AVC][GB][1080P]")
+        assert result.episode is None
+        assert not result.ok
+
+    def test_memoized_and_batch(self, parser):
+        titles = ["[VCB-Studio][斗罗大陆][156][1080p]", "斗罗大陆 - 157 [1080P]"] * 3
+        results = parser.parse_many(titles)
+        assert [r.episode for r in results] == [156, 157] * 3
+        assert results[0] is results[2]
+        assert parser.stats()["cache"]["misses"] == 2
+
+    def test_load_rules_swaps_ruleset(self, parser):
+        title = "斗罗大陆 #156 1080p"
+        assert not parser.parse(title).ok
+
+        custom = ParseRule(name="hash_episode", pattern=r"#(?P<episode>\d+)", hint="#", priority=5)
+        old = parser.ruleset
+        parser.load_rules((*BUILTIN_RULES, custom))
+        assert parser.ruleset is not old
+        assert parser.ruleset.version == old.version + 1
+        assert parser.parse(title).episode == 156
+
+    def test_invalid_rules_skipped(self):
+        ruleset = RuleSet(
+            [
+                ParseRule(name="broken", pattern=r"(?P<episode>\d+"),
+                ParseRule(name="no_episode", pattern=r"\d+"),
+                *BUILTIN_RULES,
+            ],
+            cache_size=0,
+        )
+        assert ruleset.rule_names == tuple(r.name for r in BUILTIN_RULES)
+
+    def test_benchmark_corpus_accuracy(self):
+        report = evaluate(RuleSet(BUILTIN_RULES, cache_size=0), load_corpus())
+        assert report["failures"] == []
+
+
+class TestParserPool:
+    """进程池批量解析测试"""
+
+    @pytest.mark.asyncio
+    async def test_small_batch_parsed_inline(self):
+        pool = ParserPool(max_workers=1, threshold=100)
+        results = await pool.parse_many(["[VCB-Studio][斗罗大陆][156][1080p]"] * 200)
+        assert results[0].episode == 156
+        assert pool.stats()["inline_batches"] == 1
+        assert not pool.stats()["running"]
+
+    @pytest.mark.asyncio
+    async def test_large_batch_uses_current_rules(self):
+        pool = ParserPool(max_workers=1, threshold=3, chunk_size=2)
+        titles = [f"斗罗大陆 #{n} 1080p" for n in range(1, 6)] + ["斗罗大陆 - 157 [1080P]"]
+        custom = ParseRule(name="hash_episode", pattern=r"#(?P<episode>\d+)", hint="#", priority=5)
+        title_parser.load_rules((*BUILTIN_RULES, custom))
+        try:
+            results = await pool.parse_many(titles + titles[:1])
+        finally:
+            pool.shutdown()
+            title_parser.load_rules(BUILTIN_RULES)
+        assert [r.episode for r in results] == [1, 2, 3, 4, 5, 157, 1]
+        assert results[0].rule == "hash_episode"
+        assert pool.stats()["pool_batches"] == 1
+
+
+class TestDictParseRules:
+    """字典中的自定义解析规则测试"""
+
+    @pytest.mark.asyncio
+    async def test_rule_changes_hot_reload(self):
+        from httpx import AsyncClient
+
+        from app.db.database import create_tables, drop_tables
+        from app.main import app
+        from app.services.parser import title_parser
+
+        title = "斗罗大陆 #156 1080p"
+        try:
+            async with AsyncClient(app=app, base_url="http://test") as ac:
+                await drop_tables(); await create_tables()
+                r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+                headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+                await ac.post("/api/v1/dict/types", headers=headers, json={"code": "parse_rule", "name": "标题解析规则"})
+
+                invalid = await ac.post("/api/v1/dict/items", headers=headers, json={
+                    "dict_type_code": "parse_rule", "code": "bad", "name": "bad", "value": r"#(\d+)",
+                })
+                assert invalid.json()["code"] == 400
+
+                version = title_parser.ruleset.version
+                created = await ac.post("/api/v1/dict/items", headers=headers, json={
+                    "dict_type_code": "parse_rule", "code": "hash_episode", "name": "井号集数",
+                    "value": r"#(?P<episode>\d+)", "sort_order": 1, "extra_data": '{"hint": "#"}',
+                })
+                item_id = created.json()["data"]["id"]
+                assert title_parser.ruleset.version == version + 1
+                assert title_parser.parse(title).rule == "hash_episode"
+                assert title_parser.parse(title).episode == 156
+
+                await ac.put(f"/api/v1/dict/items/{item_id}", headers=headers, json={"is_active": False})
+                assert title_parser.ruleset.version == version + 2
+                assert not title_parser.parse(title).ok
+        finally:
+            title_parser.load_rules(BUILTIN_RULES)
+            store._loaded_stamp = store._UNLOADED
+
+    @pytest.mark.asyncio
+    async def test_changes_from_other_workers_apply_on_read(self):
+        """测试其他 worker 写入的规则变更（本进程未收到通知）在下次解析前按版本戳生效"""
+        from app.db import crud_system_dict
+        from app.db.database import AsyncSessionLocal, create_tables, drop_tables
+        from app.services.parser import aparse_titles, ensure_parse_rules, reload_parse_rules
+
+        title = "斗罗大陆 #156 1080p"
+        await drop_tables(); await create_tables()
+        try:
+            async with AsyncSessionLocal() as db:
+                await crud_system_dict.create_dict_type(db, code="parse_rule", name="标题解析规则")
+                await reload_parse_rules(db)
+                version = title_parser.ruleset.version
+
+                # 未变更时只比对版本戳，不重新加载
+                assert (await ensure_parse_rules(db)).version == version
+
+                # 直接写库，模拟另一个 worker 的修改
+                await crud_system_dict.create_dict_item(
+                    db, dict_type_code="parse_rule", code="hash_episode", name="井号集数",
+                    value=r"#(?P<episode>\d+)", sort_order=1, extra_data='{"hint": "#"}',
+                )
+                assert title_parser.ruleset.version == version
+                assert not title_parser.parse(title).ok
+
+                parsed = await aparse_titles(db, [title])
+                assert title_parser.ruleset.version == version + 1
+                assert parsed[0].rule == "hash_episode"
+                assert parsed[0].episode == 156
+        finally:
+            title_parser.load_rules(BUILTIN_RULES)
+            store._loaded_stamp = store._UNLOADED
@@ -0,0 +1,152 @@
+"""
+日志查询接口测试
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.db import crud_log
+from app.db.database import AsyncSessionLocal, create_tables, drop_tables, engine
+from app.main import app
+from app.services.log_store import LogStore, log_store
+from app.utils.logger import QueuedLogSink, _is_app_record, logger
+
+BASE = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _entry(minutes: int, level: str, message: str) -> dict:
+    return {
+        "time": (BASE + timedelta(minutes=minutes)).isoformat(),
+        "level": level,
+        "name": "app.test",
+        "function": "run",
+        "line": minutes,
+        "message": message,
+        "extra": {},
+        "exception": None,
+    }
+
+
+async def _token(ac: AsyncClient) -> str:
+    r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+    return r.json()["data"]["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_logs_query_and_clear():
+    """测试按级别、时间范围分页查询（时间倒序，只查询已入库的记录），以及清空日志"""
+    await drop_tables(); await create_tables()
+    for minute in range(6):
+        log_store.collect(_entry(minute, "ERROR" if minute % 2 else "INFO", f"m{minute}"))
+    assert await log_store.flush() == 6
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        headers = {"Authorization": f"Bearer {await _token(ac)}"}
+
+        r = await ac.get("/api/v1/system/logs", params={"page": 1, "size": 4}, headers=headers)
+        data = r.json()["data"]
+        assert (data["total"], data["page"], data["size"], data["pages"], data["has_more"]) == (6, 1, 4, 2, True)
+        assert [item["message"] for item in data["items"]] == ["m5", "m4", "m3", "m2"]
+        assert data["items"][0]["module"] == "app.test:run:5"
+        assert datetime.fromisoformat(data["items"][0]["timestamp"]) == BASE + timedelta(minutes=5)
+
+        r = await ac.get(
+            "/api/v1/system/logs",
+            params={
+                "level": "error",
+                "start_time": (BASE + timedelta(minutes=2)).isoformat(),
+                "end_time": (BASE + timedelta(minutes=5)).isoformat(),
+            },
+            headers=headers,
+        )
+        data = r.json()["data"]
+        assert [item["message"] for item in data["items"]] == ["m5", "m3"]
+
+        r = await ac.get(
+            "/api/v1/system/logs", params={"page": 2, "size": 4, "with_total": False}, headers=headers
+        )
+        data = r.json()["data"]
+        assert (data["total"], data["pages"], data["has_more"]) == (None, None, False)
+        assert [item["message"] for item in data["items"]] == ["m1", "m0"]
+
+        r = await ac.get(
+            "/api/v1/system/logs",
+            params={"start_time": (BASE + timedelta(minutes=5)).isoformat(), "end_time": BASE.isoformat()},
+            headers=headers,
+        )
+        assert r.json()["code"] == 400
+
+        r = await ac.delete("/api/v1/system/logs", headers=headers)
+        assert r.json()["data"]["deleted"] == 6
+        r = await ac.get("/api/v1/system/logs", headers=headers)
+        assert r.json()["data"]["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_log_sink_feeds_store():
+    """测试文件日志后台线程写出的记录进入日志存储，并按保留天数清理"""
+    await drop_tables(); await create_tables()
+    sink = QueuedLogSink(maxsize=10)
+    store = LogStore(maxsize=2, flush_interval=1.0, retention_days=1)
+    sink.add_consumer(store.collect)
+    handler_id = logger.add(sink, filter=_is_app_record)
+    sink.start()
+    try:
+        logger.info("first")
+        logger.error("second")
+        logger.error("third")
+        assert sink.flush(timeout=5)
+    finally:
+        logger.remove(handler_id)
+        sink.stop()
+
+    assert store.stats()["dropped"] == 1
+    assert await store.flush() == 2
+
+    async with AsyncSessionLocal() as db:
+        items, has_more = await crud_log.get_log_records(db, level="ERROR")
+        assert not has_more
+        assert len(items) == 1
+        assert items[0].message == "second"
+        assert items[0].module.startswith(f"{__name__}:test_log_sink_feeds_store:")
+
+        await crud_log.add_log_records(db, rows=[
+            {"timestamp": BASE.timestamp(), "level": "INFO", "message": "old"},
+        ])
+        assert await crud_log.count_log_records(db) == 3
+        assert await crud_log.count_log_records(db, limit=2) == 2
+    assert await store.prune() == 1
+
+
+@pytest.mark.asyncio
+async def test_log_queries_use_indexes():
+    """测试按级别 + 时间范围与按时间倒序分页的查询走索引，不做临时排序"""
+    await drop_tables(); await create_tables()
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSessionLocal() as db:
+            await crud_log.count_log_records(db, level="ERROR", start=0.0, end=1.0, limit=100)
+            await crud_log.get_log_records(db, level="ERROR", start=0.0, end=1.0)
+            await crud_log.get_log_records(db)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    plans = []
+    async with engine.connect() as conn:
+        for statement, parameters in captured:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append(" | ".join(row[-1] for row in result))
+
+    assert all("ix_log_records_level_timestamp" in plan for plan in plans[:2])
+    assert "TEMP B-TREE" not in plans[1]
+    assert "ix_log_records_timestamp" in plans[2]
+    assert "TEMP B-TREE" not in plans[2]
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Torznab XML 生成与端点测试
+"""
+import pytest
+from httpx import AsyncClient
+from lxml import etree
+
+from app.main import app
+from app.db.database import drop_tables, create_tables
+from app.services import torznab
+from app.services.clients.prowlarr import ProwlarrClient
+
+
+def _release(n: int) -> dict:
+    return {
+        "guid": f"guid-{n}",
+        "title": f"Show.S01E{n:02d}.1080p.WEB-DL",
+        "downloadUrl": f"http://prowlarr/download/{n}",
+        "infoUrl": f"http://tracker/details/{n}",
+        "publishDate": "2024-01-02T03:04:05Z",
+        "size": 1024 * n,
+        "categories": [{"id": 5040, "name": "TV/HD"}],
+        "seeders": n,
+        "leechers": 1,
+    }
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+async def _collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+class TestStreamFeed:
+    """stream_feed 测试"""
+
+    @pytest.mark.asyncio
+    async def test_header_first_then_items(self):
+        chunks = await _collect(torznab.stream_feed(_batches([_release(1), _release(2)], [_release(3)])))
+        assert b"<channel>" in chunks[0]
+        assert b"<item>" not in chunks[0]
+
+        root = etree.fromstring(b"".join(chunks))
+        items = root.findall("channel/item")
+        assert [i.findtext("guid") for i in items] == ["guid-1", "guid-2", "guid-3"]
+        attrs = {
+            a.get("name"): a.get("value")
+            for a in items[0].findall(f"{{{torznab.TORZNAB_NS}}}attr")
+        }
+        assert attrs["seeders"] == "1"
+        assert attrs["peers"] == "1"
+        assert attrs["category"] == "5040"
+        assert items[0].findtext("pubDate") == "Tue, 02 Jan 2024 03:04:05 +0000"
+        assert items[0].find("enclosure").get("url") == "http://prowlarr/download/1"
+
+    @pytest.mark.asyncio
+    async def test_offset_and_limit_stop_consuming(self):
+        consumed = []
+
+        async def batches():
+            for n in range(1, 5):
+                consumed.append(n)
+                yield [_release(n * 10 + i) for i in range(2)]
+
+        root = etree.fromstring(b"".join(await _collect(torznab.stream_feed(batches(), limit=3))))
+        assert [i.findtext("guid") for i in root.findall("channel/item")] == ["guid-10", "guid-11", "guid-20"]
+        assert consumed == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_pages_stable_across_arrival_orders(self):
+        """翻页时按发布时间倒序、guid 升序排序，与索引器返回先后无关，各页不重复不遗漏"""
+        releases = [
+            {**_release(n), "publishDate": f"2024-01-{n:02d}T00:00:00Z"} for n in range(1, 9)
+        ] + [{**_release(20), "publishDate": "2024-01-04T00:00:00Z"}]
+        # 第一页按到达顺序流式输出：最先返回的索引器给出最新的 3 条
+        order_a = [releases[5:8][::-1], releases[:3], releases[3:5], releases[8:]]
+        order_b = [releases[:3], releases[8:], releases[3:8]]
+
+        async def page(batches, offset):
+            stream = torznab.stream_feed(_batches(*batches), offset=offset, limit=3)
+            root = etree.fromstring(b"".join(await _collect(stream)))
+            return [i.findtext("guid") for i in root.findall("channel/item")]
+
+        page1 = await page(order_a, 0)
+        page2_a, page2_b = await page(order_a, 3), await page(order_b, 3)
+        page3 = await page(order_b, 6)
+        assert page1 == ["guid-8", "guid-7", "guid-6"]
+        assert page2_a == page2_b == ["guid-5", "guid-20", "guid-4"]
+        assert page3 == ["guid-3", "guid-2", "guid-1"]
+        assert not set(page1) & set(page2_b)
+        assert sorted(page1 + page2_b + page3) == sorted(r["guid"] for r in releases)
+
+    def test_caps_and_error(self):
+        caps = etree.fromstring(torznab.render_caps())
+        assert caps.find("searching/tv-search").get("available") == "yes"
+        assert caps.find("categories/category").get("id") == "5000"
+
+        error = etree.fromstring(torznab.render_error(torznab.ERROR_INCORRECT_CREDENTIALS, "bad key"))
+        assert error.tag == "error"
+        assert error.get("code") == "100"
+
+
+class TestTorznabEndpoint:
+    """/api/v1/torznab/api 端点测试"""
+
+    @pytest.mark.asyncio
+    async def test_search_flow(self, monkeypatch):
+        captured = {}
+
+        async def fake_asearch(self, query, indexer_ids=None, categories=None, search_type="search", **kwargs):
+            captured.update(query=query, categories=categories, search_type=search_type)
+            yield 1, True, [_release(1)]
+            yield 2, False, "timeout"
+            yield 3, True, [_release(2)]
+
+        monkeypatch.setattr(ProwlarrClient, "asearch", fake_asearch)
+
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            await drop_tables(); await create_tables()
+            r = await ac.post("/api/v1/auth/register", json={"username": "admin", "password": "P@ssw0rd"})
+            headers = {"Authorization": f"Bearer {r.json()['data']['access_token']}"}
+
+            caps = await ac.get("/api/v1/torznab/api", params={"t": "caps"})
+            assert caps.status_code == 200
+            assert etree.fromstring(caps.content).tag == "caps"
+
+            denied = await ac.get("/api/v1/torznab/api", params={"t": "search", "q": "x", "apikey": "nope"})
+            assert etree.fromstring(denied.content).get("code") == "100"
+
+            await ac.post("/api/v1/config/", headers=headers, json={
+                "type": "kv", "key": "torznab_api_key", "value": "secret-key", "is_encrypted": True,
+            })
+            missing = await ac.get("/api/v1/torznab/api", params={"t": "search", "q": "x", "apikey": "secret-key"})
+            assert etree.fromstring(missing.content).get("code") == "900"
+
+            await ac.post("/api/v1/config/", headers=headers, json={
+                "type": "service", "service_name": "prowlarr", "service_type": "api",
+                "name": "Prowlarr", "url": "http://127.0.0.1:9696", "api_key": "PKEY",
+            })
+            resp = await ac.get("/api/v1/torznab/api", params={
+                "t": "tvsearch", "q": "Show", "season": "1", "ep": "2", "cat": "5000,5040", "apikey": "secret-key",
+            })
+            assert resp.status_code == 200
+            assert resp.headers["content-type"].startswith("application/rss+xml")
+            root = etree.fromstring(resp.content)
+            assert [i.findtext("guid") for i in root.findall("channel/item")] == ["guid-1", "guid-2"]
+            assert captured == {
+                "query": "Show{Season:01}{Episode:02}",
+                "categories": [5000, 5040],
+                "search_type": "tvsearch",
+            }